@@ -0,0 +1,36 @@
+"""
+Environment settings shared by the backend's caches and worker pools.
+
+Importing this module loads the project's .env files (later files override
+earlier ones, except backend/.env, which only fills gaps), so settings read
+at import time see them whichever module is imported first.
+"""
+
+from __future__ import annotations
+
+import os
+
+from dotenv import load_dotenv
+
+_BACKEND_DIR = os.path.dirname(__file__)
+_PROJECT_ROOT = os.path.dirname(_BACKEND_DIR)
+load_dotenv(os.path.join(_PROJECT_ROOT, ".env"))
+load_dotenv(os.path.join(_PROJECT_ROOT, ".env.local"), override=True)
+load_dotenv(os.path.join(_PROJECT_ROOT, ".env.backend.local"), override=True)
+load_dotenv(os.path.join(_BACKEND_DIR, ".env"))
+
+
+def env_int(name: str, default: int) -> int:
+    """Positive int from `name`, or `default` when unset or unparsable."""
+    try:
+        return max(1, int(os.getenv(name, str(default))))
+    except ValueError:
+        return default
+
+
+def env_float(name: str, default: float) -> float:
+    """Non-negative float from `name`, or `default` when unset or unparsable."""
+    try:
+        return max(0.0, float(os.getenv(name, str(default))))
+    except ValueError:
+        return default
@@ -1,7 +1,29 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import math
-
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from .economics_engine import (
+    MONTHLY_DISCOUNT_RATE,
+    MONTHS_TO_PROJECT,
+    EconomicsColumns,
+    FlowColumns,
+    GrossStreams,
+    compile_opex_table,
+    net_flow_columns,
+    npv,
+    payout_month,
+    place_gross_volumes,
+    price_gross_streams,
+    pv_profile,
+    well_capex,
+)
+from .irr import solve_irr
 from .models import (
     CapexAssumptions,
     DebtAssumptions,
@@ -11,15 +33,20 @@ from .models import (
     OpexAssumptions,
     OwnershipAssumptions,
     PricingAssumptions,
+    PvProfilePoint,
     ReserveCategory,
     Scalars,
     ScheduleParams,
     TaxAssumptions,
     TypeCurveParams,
     Well,
-    WellGroup,
 )
+from .scheduling import WellSchedule, schedule_wells
+
 
+_DEFAULT_PRODUCTION_CACHE_MAX_ENTRIES = 256
+# Scaled initial declines are capped here so (1 - di) stays positive.
+_MAX_DECLINE_PCT = 99.99
 
 DEFAULT_RESERVE_RISK_FACTORS: dict[ReserveCategory, float] = {
     "PDP": 1.0,
@@ -54,154 +81,386 @@ def _legacy_ownership(pricing: PricingAssumptions) -> OwnershipAssumptions:
     return OwnershipAssumptions(baseNri=nri, baseCostInterest=1.0, agreements=[])
 
 
-def _get_opex_segment_for_age_month(opex: OpexAssumptions, age_month: int):
-    segments = sorted(opex.segments or [], key=lambda seg: seg.startMonth)
-    for segment in segments:
-        if segment.startMonth <= age_month <= segment.endMonth:
-            return segment
-    return None
+def _agreement_start_indices(agreements: list) -> np.ndarray:
+    return np.array(
+        [max(0, math.floor((agreement.startMonth or 1) - 1)) for agreement in agreements],
+        dtype=np.int64,
+    )
 
 
-def _compute_agreement_payout_month(
-    agreement,
+def _compute_agreement_payout_months(
     ownership: OwnershipAssumptions,
-    gross_revenue: list[float],
-    gross_opex: list[float],
-    gross_capex: list[float],
-) -> int | None:
-    months = len(gross_revenue)
-    start_idx = max(0, math.floor((agreement.startMonth or 1) - 1))
+    gross_revenue: np.ndarray,
+    gross_opex: np.ndarray,
+    gross_capex: np.ndarray,
+) -> np.ndarray:
+    """1-based payout month per agreement (0 = never pays out).
+
+    Each partner's pre-payout net is accumulated from the agreement's start
+    month; payout is the first month that cumulative reaches zero. All
+    agreements are solved together as one agreements × months matrix. Leading
+    dimensions of the gross streams broadcast, so a (scenarios × months) batch
+    returns (scenarios × agreements).
+    """
+    agreements = ownership.agreements or []
+    months = gross_revenue.shape[-1]
+    if not agreements:
+        return np.zeros(0, dtype=np.int64)
+
     base_nri = _clamp01(ownership.baseNri)
     base_cost = _clamp01(ownership.baseCostInterest)
-    convey_rev = _clamp01(agreement.prePayout.conveyRevenuePctOfBase)
-    convey_cost = _clamp01(agreement.prePayout.conveyCostPctOfBase)
-    partner_rev_factor = base_nri * convey_rev
-    partner_cost_factor = base_cost * convey_cost
-
-    cumulative = 0.0
-    for i in range(start_idx, months):
-        partner_net = (gross_revenue[i] * partner_rev_factor) - (
-            (gross_opex[i] + gross_capex[i]) * partner_cost_factor
-        )
-        cumulative += partner_net
-        if cumulative >= 0:
-            return i + 1
-    return None
+    partner_rev_factor = base_nri * np.array(
+        [_clamp01(a.prePayout.conveyRevenuePctOfBase) for a in agreements], dtype=float
+    )
+    partner_cost_factor = base_cost * np.array(
+        [_clamp01(a.prePayout.conveyCostPctOfBase) for a in agreements], dtype=float
+    )
+
+    started = np.arange(months)[None, :] >= _agreement_start_indices(agreements)[:, None]
+    partner_net = partner_rev_factor[:, None] * gross_revenue[..., None, :] - partner_cost_factor[:, None] * (
+        gross_opex + gross_capex
+    )[..., None, :]
+    cumulative = np.cumsum(np.where(started, partner_net, 0.0), axis=-1)
+    crossed = started & (cumulative >= 0)
+    first = crossed.argmax(axis=-1)
+    return np.where(crossed.any(axis=-1), first + 1, 0)
 
 
 def _compute_ownership_factors(
     ownership: OwnershipAssumptions,
-    gross_revenue: list[float],
-    gross_opex: list[float],
-    gross_capex: list[float],
-) -> tuple[list[float], list[float]]:
-    months = len(gross_revenue)
+    gross_revenue: np.ndarray,
+    gross_opex: np.ndarray,
+    gross_capex: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """(net revenue, net cost) factor per month; leading dimensions broadcast
+    as in `_compute_agreement_payout_months`."""
     base_nri = _clamp01(ownership.baseNri)
     base_cost = _clamp01(ownership.baseCostInterest)
+    agreements = ownership.agreements or []
+    if not agreements:
+        return np.full(gross_revenue.shape, base_nri), np.full(gross_revenue.shape, base_cost)
+
+    # Payout is looked up by agreement id, so a repeated id shares the payout
+    # month of the last agreement carrying it.
+    last_with_id = {a.id: i for i, a in enumerate(agreements)}
+    payouts = _compute_agreement_payout_months(ownership, gross_revenue, gross_opex, gross_capex)
+    payout = payouts[..., [last_with_id[a.id] for a in agreements]]
+
+    months = gross_revenue.shape[-1]
+    month_idx = np.arange(months)
+    started = month_idx[None, :] >= _agreement_start_indices(agreements)[:, None]
+    # Post-payout terms apply from the month after payout (index >= payout month).
+    use_post = (payout[..., None] > 0) & (month_idx >= payout[..., None])
+
+    def conveyed(attr: str) -> np.ndarray:
+        pre = np.array([_clamp01(getattr(a.prePayout, attr)) for a in agreements], dtype=float)
+        post = np.array([_clamp01(getattr(a.postPayout, attr)) for a in agreements], dtype=float)
+        terms = np.where(use_post, post[:, None], pre[:, None])
+        return np.clip(np.where(started, terms, 0.0).sum(axis=-2), 0.0, 1.0)
+
+    net_revenue_factor = base_nri * (1 - conveyed("conveyRevenuePctOfBase"))
+    net_cost_factor = base_cost * (1 - conveyed("conveyCostPctOfBase"))
+    return net_revenue_factor, net_cost_factor
 
-    payout_months = {
-        agreement.id: _compute_agreement_payout_month(
-            agreement, ownership, gross_revenue, gross_opex, gross_capex
-        )
-        for agreement in ownership.agreements or []
-    }
 
-    net_revenue_factor = [0.0 for _ in range(months)]
-    net_cost_factor = [0.0 for _ in range(months)]
+def _segment_field(segment, name: str):
+    return getattr(segment, name) if hasattr(segment, name) else segment[name]
 
-    for i in range(months):
-        conveyed_rev_pct = 0.0
-        conveyed_cost_pct = 0.0
 
-        for agreement in ownership.agreements or []:
-            start_idx = max(0, math.floor((agreement.startMonth or 1) - 1))
-            if i < start_idx:
-                continue
-            payout_month = payout_months.get(agreement.id)
-            use_post = payout_month is not None and i >= payout_month
-            terms = agreement.postPayout if use_post else agreement.prePayout
-            conveyed_rev_pct += _clamp01(terms.conveyRevenuePctOfBase)
-            conveyed_cost_pct += _clamp01(terms.conveyCostPctOfBase)
+def _resolved_segments(tc: TypeCurveParams) -> list:
+    return tc.segments or [
+        {
+            "id": "default",
+            "name": "Default",
+            "method": "arps",
+            "qi": tc.qi,
+            "b": tc.b,
+            "initialDecline": tc.di,
+            "cutoffKind": "default",
+            "cutoffValue": None,
+        }
+    ]
 
-        net_revenue_factor[i] = base_nri * (1 - _clamp01(conveyed_rev_pct))
-        net_cost_factor[i] = base_cost * (1 - _clamp01(conveyed_cost_pct))
 
-    return net_revenue_factor, net_cost_factor
+def _monthly_decline(annual_pct):
+    """Annual effective decline (%) -> monthly rate, as used in the Arps equations."""
+    return 1 - np.power(1 - (annual_pct / 100.0), 1 / 12.0)
+
+
+def _terminal_monthly(tc: TypeCurveParams) -> float | None:
+    return float(_monthly_decline(tc.terminalDecline)) if tc.modifiedHyperbolic else None
+
+
+def hyperbolic_rates(qi, b, di_monthly, local_t: np.ndarray, terminal_monthly: float | None = None):
+    """Hyperbolic Arps rates; arguments broadcast (e.g. per-draw columns against months).
+
+    With `terminal_monthly` the curve is modified hyperbolic: the instantaneous
+    decline ``di / (1 + b * di * t)`` reaches the terminal rate at
+
+        t_switch = (di / terminal - 1) / (b * di)
+
+    and the rate continues exponentially at the terminal decline from there
+    (from the start when ``di`` is already below it).
+    """
+    rates = qi / np.power(1 + b * di_monthly * local_t, 1 / b)
+    if terminal_monthly is None:
+        return rates
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t_switch = np.maximum((di_monthly / terminal_monthly - 1) / (b * di_monthly), 0.0)
+    switch_rate = qi / np.power(1 + b * di_monthly * t_switch, 1 / b)
+    tail = switch_rate * np.exp(-terminal_monthly * (local_t - t_switch))
+    return np.where(local_t > t_switch, tail, rates)
+
 
+def arps_rates(
+    qi: float, b: float, di_monthly: float, local_t: np.ndarray, terminal_monthly: float | None = None
+) -> np.ndarray:
+    """Arps rate at each local month: exponential when ``b == 0``, else hyperbolic (harmonic at 1)."""
+    if b == 0:
+        return qi * np.exp(-di_monthly * local_t)
+    return hyperbolic_rates(qi, b, di_monthly, local_t, terminal_monthly)
 
-def _should_cutoff(seg, rate_monthly: float, local_months: int, cum_production: float) -> bool:
-    kind = (seg.cutoffKind if hasattr(seg, "cutoffKind") else seg["cutoffKind"]) or "default"
-    raw_value = seg.cutoffValue if hasattr(seg, "cutoffValue") else seg["cutoffValue"]
-    value = raw_value or 0.0
-    if kind == "default":
-        return False
+
+def _first_cutoff(segment, q: np.ndarray, local_t: np.ndarray, di_monthly: float) -> int:
+    """Index of the first local month at which `segment` cuts off (``q.size`` = never).
+
+    The month is found over the whole array rather than by stepping: rate and
+    time by `searchsorted` on monotone sequences, cumulative by `searchsorted`
+    on the running total before each month (what the cutoff compares against).
+    """
+    kind = _segment_field(segment, "cutoffKind") or "default"
+    value = _segment_field(segment, "cutoffValue") or 0.0
     if kind == "rate":
-        return rate_monthly <= value * 30.4
+        threshold = value * 30.4
+        if di_monthly >= 0:
+            # Non-increasing rates: first q <= threshold.
+            return int(np.searchsorted(-q, -threshold, side="left"))
+        hits = np.flatnonzero(q <= threshold)
+        return int(hits[0]) if hits.size else q.size
     if kind == "time_days":
-        return local_months * 30.4 >= value
+        return int(np.searchsorted(local_t * 30.4, value, side="left"))
     if kind == "cum":
-        return cum_production >= value
-    return False
+        before = np.zeros(q.size)
+        np.cumsum(q[:-1], out=before[1:])
+        return int(np.searchsorted(before, value, side="left"))
+    return q.size
 
 
 def _evaluate_multi_segment_production(
     tc: TypeCurveParams,
     months_to_project: int,
     production_scalar: float,
-) -> tuple[list[float], list[float]]:
-    segments = tc.segments or [
-        {
-            "id": "default",
-            "name": "Default",
-            "method": "arps",
-            "qi": tc.qi,
-            "b": tc.b,
-            "initialDecline": tc.di,
-            "cutoffKind": "default",
-            "cutoffValue": None,
-        }
-    ]
-    oil_by_month = [0.0 for _ in range(months_to_project)]
-    gas_by_month = [0.0 for _ in range(months_to_project)]
+) -> tuple[np.ndarray, np.ndarray]:
+    """Monthly oil and gas for a chain of Arps segments.
+
+    Each segment is evaluated in closed form over the months it could still
+    cover, and its cutoff month is solved over that array, so a curve costs
+    O(segments) array operations. A segment that cuts off hands the rate of
+    its first unproduced month to the next segment (used when that segment
+    has no qi of its own). With `tc.modifiedHyperbolic`, hyperbolic segments
+    switch to exponential at `tc.terminalDecline` (see `hyperbolic_rates`).
+    """
+    segments = _resolved_segments(tc)
+    terminal_monthly = _terminal_monthly(tc)
+    oil = np.zeros(months_to_project)
 
     current_month = 0
-    first_qi = getattr(segments[0], "qi", None) if not isinstance(segments[0], dict) else segments[0]["qi"]
+    first_qi = _segment_field(segments[0], "qi")
     current_rate = (first_qi if first_qi is not None else tc.qi) * 30.4 * production_scalar
 
     for segment in segments:
-        if current_month >= months_to_project:
+        remaining = months_to_project - current_month
+        if remaining <= 0:
             break
-        qi_raw = segment.qi if hasattr(segment, "qi") else segment["qi"]
-        b_raw = segment.b if hasattr(segment, "b") else segment["b"]
-        di_raw = segment.initialDecline if hasattr(segment, "initialDecline") else segment["initialDecline"]
+        qi_raw = _segment_field(segment, "qi")
+        b_raw = _segment_field(segment, "b")
+        di_raw = _segment_field(segment, "initialDecline")
         qi = qi_raw * 30.4 * production_scalar if qi_raw is not None else current_rate
         b = b_raw if b_raw is not None else 0.0
         di_annual = di_raw if di_raw is not None else 8.0
         di_monthly = 1 - math.pow(1 - (di_annual / 100.0), 1 / 12.0)
 
-        local_t = 0
-        cum_prod = 0.0
-        while current_month < months_to_project:
-            local_t += 1
-            if b == 0:
-                q_t = qi * math.exp(-di_monthly * local_t)
-            else:
-                q_t = qi / math.pow(1 + b * di_monthly * local_t, 1 / b)
+        local_t = np.arange(1, remaining + 1, dtype=float)
+        q = arps_rates(qi, b, di_monthly, local_t, terminal_monthly)
+        produced = _first_cutoff(segment, q, local_t, di_monthly)
+        oil[current_month : current_month + produced] = q[:produced]
+        current_rate = float(q[produced] if produced < remaining else q[-1])
+        current_month += produced
+
+    return oil, oil * (tc.gorMcfPerBbl or 0.0)
+
+
+def _cutoff_mask(segment, q: np.ndarray, local_t: np.ndarray) -> np.ndarray | None:
+    """`_first_cutoff` conditions for every (draw, local month) at once; None = never cuts."""
+    kind = _segment_field(segment, "cutoffKind") or "default"
+    value = _segment_field(segment, "cutoffValue") or 0.0
+    if kind == "rate":
+        return q <= value * 30.4
+    if kind == "time_days":
+        return np.broadcast_to(local_t * 30.4 >= value, q.shape)
+    if kind == "cum":
+        before = np.zeros(q.shape)
+        np.cumsum(q[:, :-1], axis=1, out=before[:, 1:])
+        return before >= value
+    return None
+
 
-            if _should_cutoff(segment, q_t, local_t, cum_prod):
-                current_rate = q_t
-                break
+def evaluate_production_curves_batch(
+    tc: TypeCurveParams,
+    months_to_project: int,
+    production_scalar: float = 1.0,
+    *,
+    qi_scale: np.ndarray,
+    b_scale: np.ndarray,
+    di_scale: np.ndarray,
+) -> np.ndarray:
+    """(draws × months) oil curves for per-draw scalings of every segment's qi, b and di.
+
+    Same segment chaining and cutoffs as `_evaluate_multi_segment_production`,
+    but each segment is evaluated for all draws at once and the cutoff month
+    found with one argmax, so a draw's segment boundary can land anywhere.
+    Scaled declines are capped just below 100%/yr.
+    """
+    segments = _resolved_segments(tc)
+    terminal_monthly = _terminal_monthly(tc)
+    draws = qi_scale.size
+    oil = np.zeros((draws, months_to_project))
+    local_t = np.arange(1, months_to_project + 1, dtype=float)
+    columns = np.arange(months_to_project)
+
+    first_qi = _segment_field(segments[0], "qi")
+    current_month = np.zeros(draws, dtype=np.int64)
+    current_rate = (first_qi if first_qi is not None else tc.qi) * 30.4 * production_scalar * qi_scale
 
-            oil_by_month[current_month] = q_t
-            gas_by_month[current_month] = q_t * (tc.gorMcfPerBbl or 0.0)
-            cum_prod += q_t
-            current_rate = q_t
-            current_month += 1
+    for segment in segments:
+        remaining = months_to_project - current_month
+        active = remaining > 0
+        if not active.any():
+            break
+        qi_raw = _segment_field(segment, "qi")
+        b_raw = _segment_field(segment, "b")
+        di_raw = _segment_field(segment, "initialDecline")
+        qi = qi_raw * 30.4 * production_scalar * qi_scale if qi_raw is not None else current_rate
+        b = (b_raw if b_raw is not None else 0.0) * b_scale
+        di_annual = np.minimum((di_raw if di_raw is not None else 8.0) * di_scale, _MAX_DECLINE_PCT)
+        di_monthly = _monthly_decline(di_annual)
+
+        hyperbolic = b > 0
+        q = np.empty((draws, months_to_project))
+        rows = np.flatnonzero(hyperbolic)
+        if rows.size:
+            q[rows] = hyperbolic_rates(
+                qi[rows, None], b[rows, None], di_monthly[rows, None], local_t, terminal_monthly
+            )
+        rows = np.flatnonzero(~hyperbolic)
+        if rows.size:
+            q[rows] = qi[rows, None] * np.exp(-di_monthly[rows, None] * local_t)
+
+        allowed = local_t[None, :] <= remaining[:, None]
+        cut = _cutoff_mask(segment, q, local_t)
+        cut = allowed & cut if cut is not None else np.zeros_like(allowed)
+        has_cut = cut.any(axis=1)
+        produced = np.where(has_cut, cut.argmax(axis=1), np.maximum(remaining, 0))
+
+        offset = columns[None, :] - current_month[:, None]
+        placed = (offset >= 0) & (offset < produced[:, None])
+        np.copyto(oil, np.take_along_axis(q, np.clip(offset, 0, months_to_project - 1), axis=1), where=placed)
+
+        # The rate carried into the next segment is the first month not produced
+        # (cutoff) or the last month produced (horizon reached).
+        carry_idx = np.where(has_cut, produced, produced - 1)
+        carried = q[np.arange(draws), np.clip(carry_idx, 0, months_to_project - 1)]
+        current_rate = np.where(active, carried, current_rate)
+        current_month = current_month + np.where(active, produced, 0)
+
+    return oil
+
+
+class _ProductionCurveCache:
+    """Bounded LRU cache of evaluated (oil, gas) type-curve arrays.
+
+    Keys are a canonical hash of the full TypeCurveParams (segments, cutoffs,
+    GOR) plus the horizon and production scalar. Cached arrays are read-only so
+    callers can share them without defensive copies.
+    """
+
+    def __init__(self, *, max_entries: int = _DEFAULT_PRODUCTION_CACHE_MAX_ENTRIES) -> None:
+        self.max_entries = max(1, max_entries)
+        self._items: OrderedDict[str, tuple[np.ndarray, np.ndarray]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def key(tc: TypeCurveParams, months_to_project: int, production_scalar: float) -> str:
+        canonical = json.dumps(tc.model_dump(mode="json"), sort_keys=True, separators=(",", ":"))
+        digest = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+        return f"{digest}|{months_to_project}|{float(production_scalar)!r}"
+
+    def get(self, key: str) -> tuple[np.ndarray, np.ndarray] | None:
+        with self._lock:
+            entry = self._items.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def set(self, key: str, value: tuple[np.ndarray, np.ndarray]) -> None:
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_entries:
+                self._items.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._items),
+                "maxEntries": self.max_entries,
+            }
 
-    return oil_by_month, gas_by_month
 
+_production_cache = _ProductionCurveCache()
 
-def calculate_economics(
+
+def evaluate_production_curve(
+    tc: TypeCurveParams,
+    months_to_project: int,
+    production_scalar: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Memoized `_evaluate_multi_segment_production` returning read-only arrays."""
+    key = _ProductionCurveCache.key(tc, months_to_project, production_scalar)
+    cached = _production_cache.get(key)
+    if cached is not None:
+        return cached
+
+    oil, gas = _evaluate_multi_segment_production(tc, months_to_project, production_scalar)
+    oil.setflags(write=False)
+    gas.setflags(write=False)
+    _production_cache.set(key, (oil, gas))
+    return oil, gas
+
+
+def production_cache_stats() -> dict[str, int]:
+    """Hit/miss/eviction counters for the type-curve production cache."""
+    return _production_cache.stats()
+
+
+def calculate_economics_columns(
     selected_wells: list[Well],
     tc: TypeCurveParams,
     capex: CapexAssumptions,
@@ -213,202 +472,181 @@ def calculate_economics(
     tax_assumptions: TaxAssumptions | None = None,
     debt_assumptions: DebtAssumptions | None = None,
     reserve_category: ReserveCategory | None = None,
-) -> EconomicsResponse:
-    months_to_project = 120
+    schedule: WellSchedule | None = None,
+    pv_rates: list[float] | None = None,
+) -> EconomicsColumns:
+    """Run the engine and return column arrays; no MonthlyCashFlow rows are built.
+
+    `schedule` lets callers reuse a `schedule_wells()` result built for the same
+    wells, capex and schedule override (e.g. across price or scalar changes).
+    `pv_rates` (annual percent) adds `metrics.pvProfile`.
+    """
+    months_to_project = MONTHS_TO_PROJECT
     scalars = scalars or Scalars()
     opex = opex or _legacy_opex(pricing)
     ownership = ownership or _legacy_ownership(pricing)
 
     if len(selected_wells) == 0:
-        return EconomicsResponse(
-            flow=[],
+        return EconomicsColumns(
+            columns={},
             metrics=DealMetrics(
                 totalCapex=0.0,
                 eur=0.0,
                 npv10=0.0,
-                irr=0.0,
+                irr=None,
                 payoutMonths=0,
                 wellCount=0,
             ),
         )
 
-    sorted_wells = sorted(selected_wells, key=lambda w: w.lateralLength, reverse=True)
-    drill_days = schedule_override.drillDurationDays if schedule_override else capex.drillDurationDays
-    stim_days = schedule_override.stimDurationDays if schedule_override else capex.stimDurationDays
-    cycle_time_months = (drill_days + stim_days) / 30.4
-
-    if schedule_override:
-        annual_rigs = schedule_override.annualRigs
-        start_count = max(1, int(math.ceil(annual_rigs[0] if annual_rigs else 1)))
-        rig_availability = [0.0 for _ in range(start_count)]
-        for y in range(1, len(annual_rigs)):
-            prev = annual_rigs[y - 1] or 0
-            curr = annual_rigs[y] or 0
-            if curr > prev:
-                for _ in range(int(math.ceil(curr - prev))):
-                    rig_availability.append(float(y * 12))
-    else:
-        rig_availability = [0.0 for _ in range(max(1, round(capex.rigCount)))]
-
-    well_schedules: list[tuple[Well, float]] = []
-    for well in sorted_wells:
-        best_rig_idx = 0
-        for i in range(1, len(rig_availability)):
-            if rig_availability[i] < rig_availability[best_rig_idx]:
-                best_rig_idx = i
-        start_month = rig_availability[best_rig_idx]
-        rig_availability[best_rig_idx] += cycle_time_months
-        well_schedules.append((well, start_month))
-
-    oil_production = [0.0 for _ in range(months_to_project)]
-    gas_production = [0.0 for _ in range(months_to_project)]
-    gross_revenue = [0.0 for _ in range(months_to_project)]
-    gross_opex = [0.0 for _ in range(months_to_project)]
-    gross_capex = [0.0 for _ in range(months_to_project)]
-    total_oil = 0.0
-    monthly_discount_rate = 0.10 / 12.0
-    realized_oil = pricing.oilPrice - (pricing.oilDifferential or 0.0)
-    realized_gas = pricing.gasPrice - (pricing.gasDifferential or 0.0)
-
-    for well, start_month_offset in well_schedules:
-        raw_well_capex = sum(
-            item.value * well.lateralLength if item.basis == "PER_FOOT" else item.value
-            for item in capex.items
-        )
-        well_total_capex = raw_well_capex * scalars.capex
-        prod_start_month_idx = math.floor(start_month_offset) + 1
-        capex_month_idx = math.floor(start_month_offset)
+    if schedule is None:
+        schedule = schedule_wells(selected_wells, capex, schedule_override)
+
+    # Every well shares the same age-indexed curves; evaluate them once.
+    oil_curve, gas_curve = evaluate_production_curve(tc, months_to_project, scalars.production)
+    volumes = place_group_volumes(schedule, oil_curve, gas_curve, capex, opex, scalars.capex, months_to_project)
+    gross = price_gross_streams(volumes, *realized_prices(pricing))
+    return apply_post_processing_layers(
+        net_economics(gross, ownership, len(selected_wells)),
+        tax_assumptions,
+        debt_assumptions,
+        reserve_category,
+        pv_rates,
+    )
 
-        if 0 <= capex_month_idx < months_to_project:
-            gross_capex[capex_month_idx] += well_total_capex
 
-        oil_by_month, gas_by_month = _evaluate_multi_segment_production(
-            tc, months_to_project, scalars.production
-        )
+def realized_prices(pricing: PricingAssumptions) -> tuple[float, float]:
+    """(oil, gas) wellhead prices after differentials."""
+    return (
+        pricing.oilPrice - (pricing.oilDifferential or 0.0),
+        pricing.gasPrice - (pricing.gasDifferential or 0.0),
+    )
 
-        for t in range(months_to_project):
-            calendar_month_idx = prod_start_month_idx + t
-            if 0 <= calendar_month_idx < months_to_project:
-                q_t = oil_by_month[t]
-                gas_t = gas_by_month[t]
-                opex_seg = _get_opex_segment_for_age_month(opex, t + 1)
-                fixed = opex_seg.fixedPerWellPerMonth if opex_seg else 0.0
-                var_oil = opex_seg.variableOilPerBbl if opex_seg else 0.0
-                var_gas = opex_seg.variableGasPerMcf if opex_seg else 0.0
-                revenue_gross = (q_t * realized_oil) + (gas_t * realized_gas)
-                opex_gross = fixed + (q_t * var_oil) + (gas_t * var_gas)
-
-                oil_production[calendar_month_idx] += q_t
-                gas_production[calendar_month_idx] += gas_t
-                gross_revenue[calendar_month_idx] += revenue_gross
-                gross_opex[calendar_month_idx] += opex_gross
-                total_oil += q_t
 
-    net_revenue_factor, net_cost_factor = _compute_ownership_factors(
-        ownership, gross_revenue, gross_opex, gross_capex
+def place_group_volumes(
+    schedule: WellSchedule,
+    oil_curve: np.ndarray,
+    gas_curve: np.ndarray,
+    capex: CapexAssumptions,
+    opex: OpexAssumptions,
+    capex_scalar: float = 1.0,
+    months: int = MONTHS_TO_PROJECT,
+) -> GrossStreams:
+    """Gross volumes, opex and capex for a scheduled program (revenue not yet priced)."""
+    return place_gross_volumes(
+        start_months=schedule.start_months,
+        capex_per_well=well_capex(schedule.wells, capex, capex_scalar),
+        oil_curve=oil_curve,
+        gas_curve=gas_curve,
+        opex_curve=compile_opex_table(opex, months).opex_curve(oil_curve, gas_curve),
+        months=months,
     )
 
-    cumulative_cash = 0.0
-    npv = 0.0
-    payout_month = 0
-    payout_found = False
-    total_net_capex = 0.0
-    final_flow: list[MonthlyCashFlow] = []
-
-    for i in range(months_to_project):
-        revenue = gross_revenue[i] * net_revenue_factor[i]
-        opex_net = gross_opex[i] * net_cost_factor[i]
-        capex_net = gross_capex[i] * net_cost_factor[i]
-        net_cash_flow = revenue - opex_net - capex_net
-        total_net_capex += capex_net
-        cumulative_cash += net_cash_flow
-        npv += net_cash_flow / math.pow(1 + monthly_discount_rate, i + 1)
-        if (not payout_found) and cumulative_cash >= 0:
-            payout_month = i + 1
-            payout_found = True
-
-        final_flow.append(
-            MonthlyCashFlow(
-                month=i + 1,
-                date=f"Month {i + 1}",
-                oilProduction=oil_production[i],
-                gasProduction=gas_production[i],
-                revenue=revenue,
-                capex=capex_net,
-                opex=opex_net,
-                netCashFlow=net_cash_flow,
-                cumulativeCashFlow=cumulative_cash,
-            )
-        )
 
+def net_economics(gross: GrossStreams, ownership: OwnershipAssumptions, well_count: int) -> EconomicsColumns:
+    """Apply ownership to priced gross streams and compute the pre-tax metrics."""
+    net_revenue_factor, net_cost_factor = _compute_ownership_factors(
+        ownership, gross.revenue, gross.opex, gross.capex
+    )
+    columns = net_flow_columns(gross, net_revenue_factor, net_cost_factor)
     metrics = DealMetrics(
-        totalCapex=total_net_capex,
-        eur=total_oil,
-        npv10=npv,
-        irr=0.0,
-        payoutMonths=payout_month,
-        wellCount=len(selected_wells),
+        totalCapex=float(columns["capex"].sum()),
+        eur=gross.total_oil,
+        npv10=npv(columns["netCashFlow"], MONTHLY_DISCOUNT_RATE),
+        irr=solve_irr(columns["netCashFlow"]),
+        payoutMonths=payout_month(columns["cumulativeCashFlow"]),
+        wellCount=well_count,
     )
-    response = EconomicsResponse(flow=final_flow, metrics=metrics)
+    return EconomicsColumns(columns=columns, metrics=metrics)
+
 
+def calculate_economics(
+    selected_wells: list[Well],
+    tc: TypeCurveParams,
+    capex: CapexAssumptions,
+    pricing: PricingAssumptions,
+    opex: OpexAssumptions | None = None,
+    ownership: OwnershipAssumptions | None = None,
+    scalars: Scalars | None = None,
+    schedule_override: ScheduleParams | None = None,
+    tax_assumptions: TaxAssumptions | None = None,
+    debt_assumptions: DebtAssumptions | None = None,
+    reserve_category: ReserveCategory | None = None,
+    pv_rates: list[float] | None = None,
+) -> EconomicsResponse:
+    return calculate_economics_columns(
+        selected_wells,
+        tc,
+        capex,
+        pricing,
+        opex,
+        ownership,
+        scalars,
+        schedule_override,
+        tax_assumptions,
+        debt_assumptions,
+        reserve_category,
+        pv_rates=pv_rates,
+    ).to_response()
+
+
+def apply_post_processing_layers(
+    result: EconomicsColumns,
+    tax_assumptions: TaxAssumptions | None = None,
+    debt_assumptions: DebtAssumptions | None = None,
+    reserve_category: ReserveCategory | None = None,
+    pv_rates: list[float] | None = None,
+) -> EconomicsColumns:
+    """Tax → debt → PV profile → reserves risk over one shared column buffer.
+
+    Each layer reads the columns it needs and adds its own in place; metrics
+    are updated in place too. Nothing is copied per month, and rows are only
+    materialized later at the response boundary.
+    """
     if tax_assumptions is not None:
-        response = apply_tax_layer(response.flow, response.metrics, tax_assumptions)
+        apply_tax_columns(result, tax_assumptions)
     if debt_assumptions is not None and debt_assumptions.enabled:
-        response = apply_debt_layer(response.flow, response.metrics, debt_assumptions)
+        apply_debt_columns(result, debt_assumptions)
+    if pv_rates:
+        apply_pv_profile(result, pv_rates)
     if reserve_category is not None:
-        response.metrics = apply_reserves_risk(response.metrics, reserve_category)
-
-    return response
+        apply_reserves_risk_in_place(result.metrics, reserve_category)
+    return result
+
+
+def tax_columns(columns: FlowColumns, months: int, tax: TaxAssumptions) -> FlowColumns:
+    """Tax-layer columns computed from pre-tax columns (inputs are not modified)."""
+    empty = np.zeros(months)
+    revenue = columns.get("revenue", empty)
+    severance_tax = revenue * (tax.severanceTaxPct / 100.0)
+    ad_valorem_tax = columns.get("capex", empty) * (tax.adValoremTaxPct / 100.0)
+    pre_tax_income = columns.get("netCashFlow", empty) - severance_tax - ad_valorem_tax
+    depletion_raw = revenue * (tax.depletionAllowancePct / 100.0)
+    depletion_allowance = np.minimum(depletion_raw, np.maximum(0.0, pre_tax_income * 0.65))
+    taxable_income = np.maximum(0.0, pre_tax_income - depletion_allowance)
+    income_tax = taxable_income * ((tax.federalTaxRate + tax.stateTaxRate) / 100.0)
+    after_tax_cash_flow = pre_tax_income - income_tax
+    return {
+        "severanceTax": severance_tax,
+        "adValoremTax": ad_valorem_tax,
+        "incomeTax": income_tax,
+        "afterTaxCashFlow": after_tax_cash_flow,
+        "cumulativeAfterTaxCashFlow": np.cumsum(after_tax_cash_flow),
+    }
 
 
-def apply_tax_layer(
-    flow: list[MonthlyCashFlow],
-    metrics: DealMetrics,
-    tax: TaxAssumptions,
-) -> EconomicsResponse:
-    monthly_discount_rate = 0.10 / 12.0
-    cumulative_after_tax = 0.0
-    after_tax_npv = 0.0
-    after_tax_payout_month = 0
-    after_tax_payout_found = False
-    taxed_flow: list[MonthlyCashFlow] = []
-
-    for i, f in enumerate(flow):
-        severance_tax = f.revenue * (tax.severanceTaxPct / 100.0)
-        ad_valorem_tax = f.capex * (tax.adValoremTaxPct / 100.0)
-        pre_tax_income = f.netCashFlow - severance_tax - ad_valorem_tax
-        depletion_raw = f.revenue * (tax.depletionAllowancePct / 100.0)
-        depletion_allowance = min(depletion_raw, max(0.0, pre_tax_income * 0.65))
-        taxable_income = max(0.0, pre_tax_income - depletion_allowance)
-        income_tax = taxable_income * ((tax.federalTaxRate + tax.stateTaxRate) / 100.0)
-        after_tax_cash_flow = pre_tax_income - income_tax
-
-        cumulative_after_tax += after_tax_cash_flow
-        after_tax_npv += after_tax_cash_flow / math.pow(1 + monthly_discount_rate, i + 1)
-        if (not after_tax_payout_found) and cumulative_after_tax >= 0:
-            after_tax_payout_month = i + 1
-            after_tax_payout_found = True
-
-        next_flow = f.model_copy(deep=True)
-        next_flow.severanceTax = severance_tax
-        next_flow.adValoremTax = ad_valorem_tax
-        next_flow.incomeTax = income_tax
-        next_flow.afterTaxCashFlow = after_tax_cash_flow
-        next_flow.cumulativeAfterTaxCashFlow = cumulative_after_tax
-        taxed_flow.append(next_flow)
-
-    next_metrics = metrics.model_copy(deep=True)
-    next_metrics.afterTaxNpv10 = after_tax_npv
-    next_metrics.afterTaxPayoutMonths = after_tax_payout_month
-    return EconomicsResponse(flow=taxed_flow, metrics=next_metrics)
+def apply_tax_columns(result: EconomicsColumns, tax: TaxAssumptions) -> EconomicsColumns:
+    taxed = tax_columns(result.columns, result.months, tax)
+    result.columns.update(taxed)
+    result.metrics.afterTaxNpv10 = npv(taxed["afterTaxCashFlow"], MONTHLY_DISCOUNT_RATE)
+    result.metrics.afterTaxPayoutMonths = payout_month(taxed["cumulativeAfterTaxCashFlow"])
+    return result
 
 
-def apply_debt_layer(
-    flow: list[MonthlyCashFlow],
-    metrics: DealMetrics,
-    debt: DebtAssumptions,
-) -> EconomicsResponse:
-    monthly_discount_rate = 0.10 / 12.0
+def apply_debt_columns(result: EconomicsColumns, debt: DebtAssumptions) -> EconomicsColumns:
+    columns = result.columns
+    months = result.months
+    base = columns.get("afterTaxCashFlow", columns.get("netCashFlow", np.zeros(months)))
     revolver_monthly_rate = (debt.revolverRate / 100.0) / 12.0
     term_monthly_rate = (debt.termLoanRate / 100.0) / 12.0
     term_monthly_payment = (
@@ -418,16 +656,18 @@ def apply_debt_layer(
         else 0.0
     )
 
+    interest_expense = np.zeros(months)
+    principal_payment = np.zeros(months)
+    levered = np.zeros(months)
+    outstanding = np.zeros(months)
+
+    # Balances carry month to month, so this recurrence stays a scalar loop;
+    # it writes straight into the preallocated columns.
     revolver_balance = 0.0
     term_balance = debt.termLoanAmount
-    cumulative_levered = 0.0
-    levered_npv = 0.0
     total_debt_service = 0.0
     total_cash_available = 0.0
-    levered_flow: list[MonthlyCashFlow] = []
-
-    for i, f in enumerate(flow):
-        base_cf = f.afterTaxCashFlow if f.afterTaxCashFlow is not None else f.netCashFlow
+    for i, base_cf in enumerate(base.tolist()):
         revolver_interest = revolver_balance * revolver_monthly_rate
         term_interest = term_balance * term_monthly_rate
         total_interest = revolver_interest + term_interest
@@ -451,96 +691,75 @@ def apply_debt_layer(
         revolver_balance = revolver_balance - revolver_paydown + revolver_draw
         term_balance = max(0.0, term_balance - term_principal)
         total_principal = term_principal + revolver_paydown
-        levered_cash_flow = base_cf - total_interest - total_principal + revolver_draw
-
-        cumulative_levered += levered_cash_flow
-        levered_npv += levered_cash_flow / math.pow(1 + monthly_discount_rate, i + 1)
         if base_cf > 0:
             total_cash_available += base_cf
         total_debt_service += total_interest + total_principal
 
-        next_flow = f.model_copy(deep=True)
-        next_flow.interestExpense = total_interest
-        next_flow.principalPayment = total_principal
-        next_flow.leveredCashFlow = levered_cash_flow
-        next_flow.cumulativeLeveredCashFlow = cumulative_levered
-        next_flow.outstandingDebt = revolver_balance + term_balance
-        levered_flow.append(next_flow)
+        interest_expense[i] = total_interest
+        principal_payment[i] = total_principal
+        levered[i] = base_cf - total_interest - total_principal + revolver_draw
+        outstanding[i] = revolver_balance + term_balance
+
+    columns["interestExpense"] = interest_expense
+    columns["principalPayment"] = principal_payment
+    columns["leveredCashFlow"] = levered
+    columns["cumulativeLeveredCashFlow"] = np.cumsum(levered)
+    columns["outstandingDebt"] = outstanding
+    result.metrics.leveredNpv10 = npv(levered, MONTHLY_DISCOUNT_RATE)
+    result.metrics.dscr = total_cash_available / total_debt_service if total_debt_service > 0 else 0.0
+    result.metrics.equityIrr = solve_irr(levered)
+    return result
+
+
+def apply_pv_profile(result: EconomicsColumns, pv_rates: list[float]) -> EconomicsColumns:
+    """PV of pre-tax, after-tax and levered flows at every rate in one product.
+
+    The (rates × months) discount matrix is cached per rate set, and the
+    available flows are stacked so all PVs come from a single matmul.
+    """
+    rates = tuple(float(rate) for rate in pv_rates)
+    names = [name for name in ("netCashFlow", "afterTaxCashFlow", "leveredCashFlow") if name in result.columns]
+    if not names:
+        result.metrics.pvProfile = [PvProfilePoint(ratePct=rate, pv=0.0) for rate in rates]
+        return result
+    values = dict(zip(names, pv_profile(np.vstack([result.columns[name] for name in names]), rates).tolist()))
+    result.metrics.pvProfile = [
+        PvProfilePoint(
+            ratePct=rate,
+            pv=values["netCashFlow"][i],
+            afterTaxPv=values["afterTaxCashFlow"][i] if "afterTaxCashFlow" in values else None,
+            leveredPv=values["leveredCashFlow"][i] if "leveredCashFlow" in values else None,
+        )
+        for i, rate in enumerate(rates)
+    ]
+    return result
+
+
+def apply_reserves_risk_in_place(metrics: DealMetrics, reserve_category: ReserveCategory) -> DealMetrics:
+    risk_factor = DEFAULT_RESERVE_RISK_FACTORS.get(reserve_category, 1.0)
+    metrics.riskedEur = metrics.eur * risk_factor
+    metrics.riskedNpv10 = metrics.npv10 * risk_factor
+    return metrics
+
 
-    next_metrics = metrics.model_copy(deep=True)
-    next_metrics.leveredNpv10 = levered_npv
-    next_metrics.dscr = total_cash_available / total_debt_service if total_debt_service > 0 else 0.0
-    next_metrics.equityIrr = 0.0
-    return EconomicsResponse(flow=levered_flow, metrics=next_metrics)
+def apply_tax_layer(
+    flow: list[MonthlyCashFlow],
+    metrics: DealMetrics,
+    tax: TaxAssumptions,
+) -> EconomicsResponse:
+    result = EconomicsColumns.from_flow(flow, metrics.model_copy())
+    return apply_tax_columns(result, tax).to_response()
+
+
+def apply_debt_layer(
+    flow: list[MonthlyCashFlow],
+    metrics: DealMetrics,
+    debt: DebtAssumptions,
+) -> EconomicsResponse:
+    result = EconomicsColumns.from_flow(flow, metrics.model_copy())
+    return apply_debt_columns(result, debt).to_response()
 
 
 def apply_reserves_risk(metrics: DealMetrics, reserve_category: ReserveCategory) -> DealMetrics:
-    risk_factor = DEFAULT_RESERVE_RISK_FACTORS.get(reserve_category, 1.0)
-    next_metrics = metrics.model_copy(deep=True)
-    next_metrics.riskedEur = metrics.eur * risk_factor
-    next_metrics.riskedNpv10 = metrics.npv10 * risk_factor
-    return next_metrics
-
-
-def aggregate_economics(groups: list[WellGroup]) -> EconomicsResponse:
-    months_to_project = 120
-    aggregated_flow = [
-        MonthlyCashFlow(
-            month=t,
-            date=f"Month {t}",
-            oilProduction=0.0,
-            gasProduction=0.0,
-            revenue=0.0,
-            capex=0.0,
-            opex=0.0,
-            netCashFlow=0.0,
-            cumulativeCashFlow=0.0,
-        )
-        for t in range(1, months_to_project + 1)
-    ]
+    return apply_reserves_risk_in_place(metrics.model_copy(), reserve_category)
 
-    total_capex = 0.0
-    total_eur = 0.0
-    total_npv10 = 0.0
-    total_well_count = 0
-
-    for group in groups:
-        if not group.flow or not group.metrics:
-            continue
-        total_capex += group.metrics.totalCapex
-        total_eur += group.metrics.eur
-        total_npv10 += group.metrics.npv10
-        total_well_count += group.metrics.wellCount
-
-        for i, f in enumerate(group.flow):
-            if i >= len(aggregated_flow):
-                break
-            agg = aggregated_flow[i]
-            agg.oilProduction += f.oilProduction
-            agg.gasProduction += f.gasProduction
-            agg.revenue += f.revenue
-            agg.capex += f.capex
-            agg.opex += f.opex
-            agg.netCashFlow += f.netCashFlow
-
-    cumulative = 0.0
-    payout_month = 0
-    payout_found = False
-    for f in aggregated_flow:
-        cumulative += f.netCashFlow
-        f.cumulativeCashFlow = cumulative
-        if (not payout_found) and cumulative >= 0:
-            payout_month = f.month
-            payout_found = True
-
-    return EconomicsResponse(
-        flow=aggregated_flow,
-        metrics=DealMetrics(
-            totalCapex=total_capex,
-            eur=total_eur,
-            npv10=total_npv10,
-            irr=0.0,
-            payoutMonths=payout_month,
-            wellCount=total_well_count,
-        ),
-    )
@@ -0,0 +1,214 @@
+"""
+Portfolio roll-up of per-group economics.
+
+Group flows are stacked into one (groups × months × fields) array and reduced
+along the group axis in a single sum. Every additive flow column is covered,
+including the tax and debt layers; cumulative columns and flow-derived metrics
+are rebuilt from the summed columns.
+
+Groups without a tax layer contribute their pre-tax flow as after-tax flow
+(no tax), and groups without debt contribute their unlevered flow as levered
+flow (no debt service) — the same fallback the debt layer uses for its base
+cash flow. Layer columns only appear in the result when some group has them.
+
+The reduction is carried in a `PartialAggregate`, which merges associatively,
+so large portfolios can be rolled up chunk by chunk or on separate workers
+and combined at the end with `merge_aggregates`.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import reduce
+from operator import attrgetter
+
+import numpy as np
+
+from .economics_engine import (
+    FLOW_VALUE_FIELDS,
+    MONTHLY_DISCOUNT_RATE,
+    MONTHS_TO_PROJECT,
+    EconomicsColumns,
+    npv,
+    payout_month,
+)
+from .irr import solve_irr
+from .models import DealMetrics, EconomicsResponse, MonthlyCashFlow, WellGroup
+
+# Cumulative columns are rebuilt from their summed base flow.
+_CUMULATIVE_OF = {
+    "cumulativeCashFlow": "netCashFlow",
+    "cumulativeAfterTaxCashFlow": "afterTaxCashFlow",
+    "cumulativeLeveredCashFlow": "leveredCashFlow",
+}
+AGGREGATE_FIELDS: tuple[str, ...] = tuple(name for name in FLOW_VALUE_FIELDS if name not in _CUMULATIVE_OF)
+_FIELD_INDEX = {name: i for i, name in enumerate(AGGREGATE_FIELDS)}
+_TAX_FIELDS = ("severanceTax", "adValoremTax", "incomeTax", "afterTaxCashFlow")
+_DEBT_FIELDS = ("interestExpense", "principalPayment", "leveredCashFlow", "outstandingDebt")
+_LAYER_INDEX = [_FIELD_INDEX[name] for name in _TAX_FIELDS + _DEBT_FIELDS]
+_row_values = attrgetter(*AGGREGATE_FIELDS)
+
+
+@dataclass
+class PartialAggregate:
+    """Mergeable running totals for a subset of a portfolio's groups."""
+
+    sums: np.ndarray
+    """(months × AGGREGATE_FIELDS) summed flows, fallbacks already applied."""
+    has_tax: bool = False
+    has_debt: bool = False
+    has_risk: bool = False
+    total_capex: float = 0.0
+    eur: float = 0.0
+    npv10: float = 0.0
+    well_count: int = 0
+    risked_eur: float = 0.0
+    risked_npv10: float = 0.0
+    cash_available: float = 0.0
+    """Sum of DSCR numerators (positive pre-debt cash) across levered groups."""
+    debt_service: float = 0.0
+
+    @classmethod
+    def empty(cls, months: int = MONTHS_TO_PROJECT) -> PartialAggregate:
+        return cls(sums=np.zeros((months, len(AGGREGATE_FIELDS))))
+
+    def merge(self, other: PartialAggregate) -> PartialAggregate:
+        return PartialAggregate(
+            sums=self.sums + other.sums,
+            has_tax=self.has_tax or other.has_tax,
+            has_debt=self.has_debt or other.has_debt,
+            has_risk=self.has_risk or other.has_risk,
+            total_capex=self.total_capex + other.total_capex,
+            eur=self.eur + other.eur,
+            npv10=self.npv10 + other.npv10,
+            well_count=self.well_count + other.well_count,
+            risked_eur=self.risked_eur + other.risked_eur,
+            risked_npv10=self.risked_npv10 + other.risked_npv10,
+            cash_available=self.cash_available + other.cash_available,
+            debt_service=self.debt_service + other.debt_service,
+        )
+
+    def to_columns(self) -> EconomicsColumns:
+        included = set(AGGREGATE_FIELDS)
+        if not self.has_tax:
+            included -= set(_TAX_FIELDS)
+        if not self.has_debt:
+            included -= set(_DEBT_FIELDS)
+
+        columns = {}
+        for name in FLOW_VALUE_FIELDS:
+            base = _CUMULATIVE_OF.get(name)
+            if base is not None and base in included:
+                columns[name] = np.cumsum(self.sums[:, _FIELD_INDEX[base]])
+            elif name in included:
+                columns[name] = self.sums[:, _FIELD_INDEX[name]].copy()
+
+        net = columns["netCashFlow"]
+        metrics = DealMetrics(
+            totalCapex=self.total_capex,
+            eur=self.eur,
+            npv10=self.npv10,
+            irr=solve_irr(net),
+            payoutMonths=payout_month(columns["cumulativeCashFlow"]),
+            wellCount=self.well_count,
+        )
+        if self.has_tax:
+            metrics.afterTaxNpv10 = npv(columns["afterTaxCashFlow"], MONTHLY_DISCOUNT_RATE)
+            metrics.afterTaxPayoutMonths = payout_month(columns["cumulativeAfterTaxCashFlow"])
+        if self.has_debt:
+            levered = columns["leveredCashFlow"]
+            metrics.leveredNpv10 = npv(levered, MONTHLY_DISCOUNT_RATE)
+            metrics.equityIrr = solve_irr(levered)
+            metrics.dscr = self.cash_available / self.debt_service if self.debt_service > 0 else 0.0
+        if self.has_risk:
+            metrics.riskedEur = self.risked_eur
+            metrics.riskedNpv10 = self.risked_npv10
+        return EconomicsColumns(columns=columns, metrics=metrics)
+
+
+def _stack_flows(flows: list[list[MonthlyCashFlow]], months: int) -> np.ndarray:
+    """(groups × months × fields) with NaN for fields a group did not produce.
+
+    Months past the end of a short flow are zero, except the tax and debt
+    fields, which stay NaN so a short flow without a layer still reads as such.
+    """
+    stack = np.zeros((len(flows), months, len(AGGREGATE_FIELDS)))
+    stack[..., _LAYER_INDEX] = np.nan
+    for g, flow in enumerate(flows):
+        rows = flow[:months]
+        if rows:
+            stack[g, : len(rows)] = np.array([_row_values(row) for row in rows], dtype=float)
+    return stack
+
+
+def _stack_columns(results: list[EconomicsColumns], months: int) -> np.ndarray:
+    stack = np.zeros((len(results), months, len(AGGREGATE_FIELDS)))
+    for g, result in enumerate(results):
+        for name, i in _FIELD_INDEX.items():
+            column = result.columns.get(name)
+            if column is None:
+                stack[g, :, i] = np.nan
+            else:
+                span = min(months, column.size)
+                stack[g, :span, i] = column[:span]
+    return stack
+
+
+def partial_aggregate(stack: np.ndarray, metrics: list[DealMetrics]) -> PartialAggregate:
+    """Reduce a (groups × months × fields) stack and its metrics to one partial."""
+    months = stack.shape[1]
+    if stack.shape[0] == 0:
+        return PartialAggregate.empty(months)
+
+    net = stack[..., _FIELD_INDEX["netCashFlow"]]
+    after_tax = stack[..., _FIELD_INDEX["afterTaxCashFlow"]]
+    levered = stack[..., _FIELD_INDEX["leveredCashFlow"]]
+    has_tax = ~np.isnan(after_tax).all(axis=1)
+    has_debt = ~np.isnan(levered).all(axis=1)
+
+    after_tax[:] = np.where(has_tax[:, None], after_tax, net)
+    levered[:] = np.where(has_debt[:, None], levered, after_tax)
+    np.nan_to_num(stack, copy=False, nan=0.0)
+
+    debt_service = (
+        stack[..., _FIELD_INDEX["interestExpense"]] + stack[..., _FIELD_INDEX["principalPayment"]]
+    ).sum(axis=1)
+    dscr = np.array([m.dscr or 0.0 for m in metrics], dtype=float)
+
+    return PartialAggregate(
+        sums=stack.sum(axis=0),
+        has_tax=bool(has_tax.any()),
+        has_debt=bool(has_debt.any()),
+        has_risk=any(m.riskedEur is not None or m.riskedNpv10 is not None for m in metrics),
+        total_capex=sum(m.totalCapex for m in metrics),
+        eur=sum(m.eur for m in metrics),
+        npv10=sum(m.npv10 for m in metrics),
+        well_count=sum(m.wellCount for m in metrics),
+        risked_eur=sum(m.riskedEur if m.riskedEur is not None else m.eur for m in metrics),
+        risked_npv10=sum(m.riskedNpv10 if m.riskedNpv10 is not None else m.npv10 for m in metrics),
+        cash_available=float((dscr * debt_service)[has_debt].sum()),
+        debt_service=float(debt_service[has_debt].sum()),
+    )
+
+
+def aggregate_groups(groups: list[WellGroup], months: int = MONTHS_TO_PROJECT) -> PartialAggregate:
+    """Partial aggregate of groups carrying computed `flow` and `metrics`."""
+    computed = [group for group in groups if group.flow and group.metrics]
+    return partial_aggregate(
+        _stack_flows([group.flow for group in computed], months),
+        [group.metrics for group in computed],
+    )
+
+
+def aggregate_columns(results: list[EconomicsColumns], months: int = MONTHS_TO_PROJECT) -> PartialAggregate:
+    """Partial aggregate straight from engine columns (no MonthlyCashFlow rows)."""
+    computed = [result for result in results if result.columns]
+    return partial_aggregate(_stack_columns(computed, months), [result.metrics for result in computed])
+
+
+def merge_aggregates(parts: list[PartialAggregate], months: int = MONTHS_TO_PROJECT) -> PartialAggregate:
+    return reduce(PartialAggregate.merge, parts, PartialAggregate.empty(months))
+
+
+def aggregate_economics(groups: list[WellGroup]) -> EconomicsResponse:
+    return aggregate_groups(groups).to_columns().to_response()
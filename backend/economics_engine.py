@@ -0,0 +1,330 @@
+"""
+Columnar NumPy kernels behind economics.calculate_economics.
+
+Every stream is a float64 array indexed by calendar month (0-based, month 1 is
+index 0). Wells in a group share one age-indexed production curve, so placing a
+program of N wells is a histogram of start months convolved with that curve
+instead of N × months Python additions. The public entry points in
+economics.py orchestrate these kernels and keep the pydantic request/response
+shapes unchanged.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, replace
+from functools import lru_cache
+
+import numpy as np
+
+from .models import (
+    CapexAssumptions,
+    DealMetrics,
+    EconomicsResponse,
+    MonthlyCashFlow,
+    OpexAssumptions,
+    Well,
+)
+
+logger = logging.getLogger(__name__)
+
+MONTHS_TO_PROJECT = 120
+MONTHLY_DISCOUNT_RATE = 0.10 / 12.0
+
+# PV0 / PV8 / PV10 / PV15 / PV20 — the standard reserve-report profile.
+DEFAULT_PV_RATES_PCT: tuple[float, ...] = (0.0, 8.0, 10.0, 15.0, 20.0)
+
+# Column name -> monthly array, keyed by MonthlyCashFlow field names.
+FlowColumns = dict[str, np.ndarray]
+
+# MonthlyCashFlow fields that carry numbers; month/date are implied by position.
+FLOW_VALUE_FIELDS: tuple[str, ...] = tuple(
+    name for name in MonthlyCashFlow.model_fields if name not in ("month", "date")
+)
+
+
+@dataclass
+class GrossStreams:
+    """Gross (100% WI, pre-ownership) monthly streams for one group."""
+
+    oil: np.ndarray
+    gas: np.ndarray
+    revenue: np.ndarray
+    opex: np.ndarray
+    capex: np.ndarray
+
+    @property
+    def total_oil(self) -> float:
+        return float(self.oil.sum())
+
+
+@dataclass(frozen=True)
+class OpexRateTable:
+    """Dense age-indexed opex rates compiled once from OpexAssumptions.
+
+    Index ``t`` holds the rates for well-age month ``t + 1``. Where segments
+    overlap, the segment with the earliest ``startMonth`` wins (same rule as the
+    TS engine's ``getOpexSegmentForAgeMonth``); uncovered months cost nothing.
+    Both conditions are recorded, and logged as a warning, once per compile
+    rather than re-discovered per lookup.
+    """
+
+    fixed: np.ndarray
+    var_oil: np.ndarray
+    var_gas: np.ndarray
+    overlaps: tuple[tuple[str, str], ...] = ()
+    gaps: tuple[tuple[int, int], ...] = ()
+
+    def opex_curve(self, oil: np.ndarray, gas: np.ndarray) -> np.ndarray:
+        """Per-well opex by age for the given age-indexed production curves."""
+        return self.fixed + (oil * self.var_oil) + (gas * self.var_gas)
+
+
+def compile_opex_table(opex: OpexAssumptions, months: int = MONTHS_TO_PROJECT) -> OpexRateTable:
+    segments = sorted(opex.segments or [], key=lambda seg: seg.startMonth)
+    fixed = np.zeros(months, dtype=float)
+    var_oil = np.zeros(months, dtype=float)
+    var_gas = np.zeros(months, dtype=float)
+    covered = np.zeros(months, dtype=bool)
+
+    # Paint latest-start first so earlier-start segments win on overlap.
+    for seg in reversed(segments):
+        lo = seg.startMonth - 1
+        hi = min(seg.endMonth, months)
+        if lo >= hi:
+            continue
+        fixed[lo:hi] = seg.fixedPerWellPerMonth
+        var_oil[lo:hi] = seg.variableOilPerBbl
+        var_gas[lo:hi] = seg.variableGasPerMcf
+        covered[lo:hi] = True
+
+    overlaps: list[tuple[str, str]] = []
+    reach: tuple[int, str] | None = None
+    for seg in segments:
+        if seg.endMonth < seg.startMonth:
+            continue
+        if reach is not None and seg.startMonth <= reach[0]:
+            overlaps.append((reach[1], seg.id))
+        if reach is None or seg.endMonth > reach[0]:
+            reach = (seg.endMonth, seg.id)
+
+    gaps: list[tuple[int, int]] = []
+    edges = np.diff(np.concatenate(([1], covered.astype(np.int8), [1])))
+    for lo, hi in zip(np.flatnonzero(edges == -1), np.flatnonzero(edges == 1)):
+        gaps.append((int(lo) + 1, int(hi)))
+    if overlaps:
+        logger.warning("Opex segments overlap (earliest start wins): %s", overlaps)
+    if gaps:
+        logger.warning("Opex segments leave well-age months without opex: %s", gaps)
+
+    return OpexRateTable(
+        fixed=fixed,
+        var_oil=var_oil,
+        var_gas=var_gas,
+        overlaps=tuple(overlaps),
+        gaps=tuple(gaps),
+    )
+
+
+def well_capex(wells: list[Well], capex: CapexAssumptions, capex_scalar: float) -> np.ndarray:
+    """Per-well total capex (PER_WELL items + PER_FOOT items × lateral), scaled."""
+    lateral = np.fromiter((w.lateralLength for w in wells), dtype=float, count=len(wells))
+    per_well = sum(item.value for item in capex.items if item.basis != "PER_FOOT")
+    per_foot = sum(item.value for item in capex.items if item.basis == "PER_FOOT")
+    return (per_well + per_foot * lateral) * capex_scalar
+
+
+def place_curve(start_idx: np.ndarray, curve: np.ndarray, months: int) -> np.ndarray:
+    """Sum one age-indexed curve shifted to every start index, clipped to the horizon.
+
+    Equivalent to ``out[s:] += curve[:months - s]`` for each well, done as a
+    single convolution of the start-month histogram with the curve.
+    """
+    out = np.zeros(months, dtype=float)
+    in_range = start_idx[(start_idx >= 0) & (start_idx < months)]
+    if in_range.size == 0 or curve.size == 0:
+        return out
+    counts = np.bincount(in_range, minlength=months).astype(float)
+    placed = np.convolve(counts, curve[:months])[:months]
+    out[: placed.size] = placed
+    return out
+
+
+def place_amounts(idx: np.ndarray, amounts: np.ndarray, months: int) -> np.ndarray:
+    """Sum per-well one-off amounts (e.g. capex) into their calendar month."""
+    mask = (idx >= 0) & (idx < months)
+    return np.bincount(idx[mask], weights=amounts[mask], minlength=months).astype(float)
+
+
+def place_curve_matrix(start_idx: np.ndarray, curve: np.ndarray, months: int, dtype=np.float64) -> np.ndarray:
+    """(wells × months) matrix whose row ``w`` is `curve` starting at ``start_idx[w]``.
+
+    The row sums equal `place_curve` for the same inputs.
+    """
+    age = np.arange(months)[None, :] - start_idx[:, None]
+    valid = (age >= 0) & (age < min(curve.size, months))
+    out = np.zeros((start_idx.size, months), dtype=dtype)
+    out[valid] = curve[age[valid]]
+    return out
+
+
+def place_amounts_matrix(idx: np.ndarray, amounts: np.ndarray, months: int, dtype=np.float64) -> np.ndarray:
+    """(wells × months) matrix with each well's one-off amount in its own month."""
+    out = np.zeros((idx.size, months), dtype=dtype)
+    rows = np.flatnonzero((idx >= 0) & (idx < months))
+    out[rows, idx[rows]] = amounts[rows]
+    return out
+
+
+def place_gross_volumes(
+    *,
+    start_months: np.ndarray,
+    capex_per_well: np.ndarray,
+    oil_curve: np.ndarray,
+    gas_curve: np.ndarray,
+    opex_curve: np.ndarray,
+    months: int = MONTHS_TO_PROJECT,
+) -> GrossStreams:
+    """Place every well's age-indexed volumes and costs at its scheduled start month.
+
+    Capex lands in ``floor(start)``; production starts the following month.
+    Revenue is left at zero — see `price_gross_streams`.
+    """
+    capex_idx = np.floor(start_months).astype(np.int64)
+    prod_idx = capex_idx + 1
+    return GrossStreams(
+        oil=place_curve(prod_idx, oil_curve, months),
+        gas=place_curve(prod_idx, gas_curve, months),
+        revenue=np.zeros(months, dtype=float),
+        opex=place_curve(prod_idx, opex_curve, months),
+        capex=place_amounts(capex_idx, capex_per_well, months),
+    )
+
+
+def price_gross_streams(volumes: GrossStreams, realized_oil: float, realized_gas: float) -> GrossStreams:
+    """Attach revenue to placed volumes; the other arrays are shared, not copied.
+
+    Placement is linear, so pricing the placed totals equals placing the
+    per-well revenue curve — a price change never needs to re-place wells.
+    """
+    return replace(volumes, revenue=volumes.oil * realized_oil + volumes.gas * realized_gas)
+
+
+def build_gross_streams(
+    *,
+    start_months: np.ndarray,
+    capex_per_well: np.ndarray,
+    oil_curve: np.ndarray,
+    gas_curve: np.ndarray,
+    opex_curve: np.ndarray,
+    realized_oil: float,
+    realized_gas: float,
+    months: int = MONTHS_TO_PROJECT,
+) -> GrossStreams:
+    """Place and price every well's streams in one call."""
+    volumes = place_gross_volumes(
+        start_months=start_months,
+        capex_per_well=capex_per_well,
+        oil_curve=oil_curve,
+        gas_curve=gas_curve,
+        opex_curve=opex_curve,
+        months=months,
+    )
+    return price_gross_streams(volumes, realized_oil, realized_gas)
+
+
+@lru_cache(maxsize=64)
+def discount_factors(months: int, monthly_rate: float = MONTHLY_DISCOUNT_RATE) -> np.ndarray:
+    """End-of-month discount factors ``1 / (1 + r) ** (i + 1)`` (shared, read-only)."""
+    factors = 1.0 / np.power(1.0 + monthly_rate, np.arange(1, months + 1, dtype=float))
+    factors.setflags(write=False)
+    return factors
+
+
+@lru_cache(maxsize=32)
+def discount_matrix(months: int, annual_rates_pct: tuple[float, ...]) -> np.ndarray:
+    """(rates × months) end-of-month discount factors for annual percent rates (shared, read-only)."""
+    monthly = np.asarray(annual_rates_pct, dtype=float) / 100.0 / 12.0
+    exponents = np.arange(1, months + 1, dtype=float)
+    factors = np.power(1.0 + monthly[:, None], -exponents[None, :])
+    factors.setflags(write=False)
+    return factors
+
+
+def pv_profile(cash_flows: np.ndarray, annual_rates_pct: tuple[float, ...]) -> np.ndarray:
+    """PV of each row of a (flows × months) matrix at every rate: (flows × rates)."""
+    flows = np.atleast_2d(cash_flows)
+    return flows @ discount_matrix(flows.shape[1], annual_rates_pct).T
+
+
+def npv(cash_flow: np.ndarray, monthly_rate: float = MONTHLY_DISCOUNT_RATE) -> float:
+    return float(np.dot(cash_flow, discount_factors(cash_flow.size, monthly_rate)))
+
+
+def payout_month(cumulative: np.ndarray) -> int:
+    """1-based month where cumulative cash first reaches zero, or 0 if never."""
+    hits = np.flatnonzero(cumulative >= 0)
+    return int(hits[0]) + 1 if hits.size else 0
+
+
+def net_flow_columns(
+    gross: GrossStreams,
+    net_revenue_factor: np.ndarray,
+    net_cost_factor: np.ndarray,
+) -> FlowColumns:
+    revenue = gross.revenue * net_revenue_factor
+    opex = gross.opex * net_cost_factor
+    capex = gross.capex * net_cost_factor
+    net_cash_flow = revenue - opex - capex
+    return {
+        "oilProduction": gross.oil,
+        "gasProduction": gross.gas,
+        "revenue": revenue,
+        "capex": capex,
+        "opex": opex,
+        "netCashFlow": net_cash_flow,
+        "cumulativeCashFlow": np.cumsum(net_cash_flow),
+    }
+
+
+def flow_models(columns: FlowColumns) -> list[MonthlyCashFlow]:
+    """Materialize columns as MonthlyCashFlow rows (response boundary only)."""
+    names = list(columns)
+    months = len(columns[names[0]]) if names else 0
+    values = [columns[name].tolist() for name in names]
+    return [
+        MonthlyCashFlow(
+            month=i + 1,
+            date=f"Month {i + 1}",
+            **{name: column[i] for name, column in zip(names, values)},
+        )
+        for i in range(months)
+    ]
+
+
+@dataclass
+class EconomicsColumns:
+    """Engine result in columnar form: one array per flow field plus metrics.
+
+    Columns that a calculation did not produce (e.g. tax fields without
+    TaxAssumptions) are absent rather than filled with None.
+    """
+
+    columns: FlowColumns
+    metrics: DealMetrics
+
+    @property
+    def months(self) -> int:
+        return next((column.size for column in self.columns.values()), 0)
+
+    def to_response(self) -> EconomicsResponse:
+        return EconomicsResponse(flow=flow_models(self.columns), metrics=self.metrics)
+
+    @classmethod
+    def from_flow(cls, flow: list[MonthlyCashFlow], metrics: DealMetrics) -> EconomicsColumns:
+        columns: FlowColumns = {}
+        for name in FLOW_VALUE_FIELDS:
+            values = [getattr(row, name) for row in flow]
+            if flow and any(value is not None for value in values):
+                columns[name] = np.array(values, dtype=float)
+        return cls(columns=columns, metrics=metrics)
@@ -0,0 +1,272 @@
+"""
+Incremental recomputation for one group's economics.
+
+`calculate_economics_columns` is a fixed pipeline:
+
+    schedule ─┐
+              ├─> volumes ─> gross (priced) ─> net (ownership) ─> tax ─> debt ─> PV profile, reserves
+  production ─┘
+
+Each stage here is keyed on a fingerprint of exactly the inputs it reads plus
+the keys of its upstream stages, and a `GroupEconomicsGraph` keeps the last
+value of every stage. Re-evaluating after an edit recomputes only the stages
+whose key changed: a price tweak reuses the schedule, production curves and
+placed volumes; a tax edit reuses everything up to the pre-tax net flows.
+
+Results are numerically identical to `calculate_economics_columns` because the
+graph calls the same stage functions. Stage arrays are shared between the
+graph's memo and the results it returns, so callers must treat returned
+columns as read-only.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, TypeVar
+
+from pydantic import BaseModel
+
+from .economics import (
+    _legacy_opex,
+    _legacy_ownership,
+    apply_debt_columns,
+    apply_pv_profile,
+    apply_reserves_risk_in_place,
+    apply_tax_columns,
+    calculate_economics_columns,
+    evaluate_production_curve,
+    net_economics,
+    place_group_volumes,
+    realized_prices,
+)
+from .economics_aggregate import aggregate_columns
+from .economics_engine import MONTHS_TO_PROJECT, EconomicsColumns, price_gross_streams
+from .models import (
+    BatchEconomicsResponse,
+    CapexAssumptions,
+    DebtAssumptions,
+    GroupEconomicsResult,
+    OpexAssumptions,
+    OwnershipAssumptions,
+    PricingAssumptions,
+    ReserveCategory,
+    Scalars,
+    ScheduleParams,
+    TaxAssumptions,
+    TypeCurveParams,
+    Well,
+    WellGroup,
+)
+from .scheduling import schedule_wells
+
+T = TypeVar("T")
+
+STAGES: tuple[str, ...] = ("schedule", "production", "volumes", "gross", "net", "tax", "debt")
+
+_DEFAULT_GRAPH_REGISTRY_MAX_ENTRIES = 256
+
+
+def _fingerprint(*parts: Any) -> str:
+    def encode(part: Any) -> Any:
+        if isinstance(part, BaseModel):
+            return part.model_dump(mode="json")
+        if isinstance(part, (list, tuple)):
+            return [encode(item) for item in part]
+        return part
+
+    payload = json.dumps([encode(part) for part in parts], sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _copy_result(result: EconomicsColumns) -> EconomicsColumns:
+    # Layers add columns and set metrics in place; give them their own dict and
+    # metrics so the upstream memo entry is never touched. Arrays are shared.
+    return EconomicsColumns(columns=dict(result.columns), metrics=result.metrics.model_copy())
+
+
+class GroupEconomicsGraph:
+    """Per-group memo of engine stages, invalidated by input fingerprint."""
+
+    def __init__(self) -> None:
+        self._memo: dict[str, tuple[str, Any]] = {}
+        self._lock = threading.Lock()
+        self.recomputed: dict[str, int] = {stage: 0 for stage in STAGES}
+
+    def _stage(self, name: str, key: str, compute: Callable[[], T]) -> T:
+        entry = self._memo.get(name)
+        if entry is not None and entry[0] == key:
+            return entry[1]
+        value = compute()
+        self._memo[name] = (key, value)
+        self.recomputed[name] += 1
+        return value
+
+    def invalidate(self) -> None:
+        self._memo.clear()
+
+    def evaluate(
+        self,
+        selected_wells: list[Well],
+        tc: TypeCurveParams,
+        capex: CapexAssumptions,
+        pricing: PricingAssumptions,
+        opex: OpexAssumptions | None = None,
+        ownership: OwnershipAssumptions | None = None,
+        scalars: Scalars | None = None,
+        schedule_override: ScheduleParams | None = None,
+        tax_assumptions: TaxAssumptions | None = None,
+        debt_assumptions: DebtAssumptions | None = None,
+        reserve_category: ReserveCategory | None = None,
+        pv_rates: list[float] | None = None,
+    ) -> EconomicsColumns:
+        """Same signature and result as `calculate_economics_columns`."""
+        if len(selected_wells) == 0:
+            return calculate_economics_columns(selected_wells, tc, capex, pricing, pv_rates=pv_rates)
+
+        months = MONTHS_TO_PROJECT
+        scalars = scalars or Scalars()
+        opex = opex or _legacy_opex(pricing)
+        ownership = ownership or _legacy_ownership(pricing)
+
+        with self._lock:
+            schedule_key = _fingerprint(
+                "schedule",
+                [(well.id, well.lateralLength) for well in selected_wells],
+                capex.rigCount,
+                capex.drillDurationDays,
+                capex.stimDurationDays,
+                schedule_override,
+            )
+            schedule = self._stage(
+                "schedule", schedule_key, lambda: schedule_wells(selected_wells, capex, schedule_override)
+            )
+
+            production_key = _fingerprint("production", tc, scalars.production, months)
+            oil_curve, gas_curve = self._stage(
+                "production", production_key, lambda: evaluate_production_curve(tc, months, scalars.production)
+            )
+
+            volumes_key = _fingerprint(
+                "volumes", schedule_key, production_key, capex.items, scalars.capex, opex
+            )
+            volumes = self._stage(
+                "volumes",
+                volumes_key,
+                lambda: place_group_volumes(schedule, oil_curve, gas_curve, capex, opex, scalars.capex, months),
+            )
+
+            prices = realized_prices(pricing)
+            gross_key = _fingerprint("gross", volumes_key, prices)
+            gross = self._stage("gross", gross_key, lambda: price_gross_streams(volumes, *prices))
+
+            net_key = _fingerprint("net", gross_key, ownership)
+            net = self._stage("net", net_key, lambda: net_economics(gross, ownership, len(selected_wells)))
+
+            result = net
+            tax_key = _fingerprint("tax", net_key, tax_assumptions)
+            if tax_assumptions is not None:
+                result = self._stage(
+                    "tax", tax_key, lambda: apply_tax_columns(_copy_result(net), tax_assumptions)
+                )
+
+            if debt_assumptions is not None and debt_assumptions.enabled:
+                taxed = result
+                debt_key = _fingerprint("debt", tax_key, debt_assumptions)
+                result = self._stage(
+                    "debt", debt_key, lambda: apply_debt_columns(_copy_result(taxed), debt_assumptions)
+                )
+
+        result = _copy_result(result)
+        if pv_rates:
+            apply_pv_profile(result, pv_rates)
+        if reserve_category is not None:
+            apply_reserves_risk_in_place(result.metrics, reserve_category)
+        return result
+
+
+class _GroupGraphRegistry:
+    """LRU of graphs keyed by `group_graph_key`, bounded like the other response caches."""
+
+    def __init__(self, max_entries: int) -> None:
+        self._max_entries = max(1, max_entries)
+        self._lock = threading.Lock()
+        self._graphs: OrderedDict[str, GroupEconomicsGraph] = OrderedDict()
+
+    def get(self, key: str) -> GroupEconomicsGraph:
+        with self._lock:
+            graph = self._graphs.get(key)
+            if graph is None:
+                graph = GroupEconomicsGraph()
+                self._graphs[key] = graph
+                while len(self._graphs) > self._max_entries:
+                    self._graphs.popitem(last=False)
+            else:
+                self._graphs.move_to_end(key)
+            return graph
+
+    def clear(self) -> None:
+        with self._lock:
+            self._graphs.clear()
+
+
+_group_graphs = _GroupGraphRegistry(_DEFAULT_GRAPH_REGISTRY_MAX_ENTRIES)
+
+
+def group_graph_key(group: WellGroup, session_id: str | None = None) -> str:
+    """Registry key for a group's graph.
+
+    Group ids are client-chosen and not unique across callers, so an id alone
+    never names a graph: within a session it is (session, id), which keeps one
+    graph per group across edits; without a session it is the group's inputs,
+    so unrelated callers never evict each other and only identical groups share.
+    """
+    if session_id is not None:
+        return _fingerprint("session", session_id, group.id)
+    return _fingerprint("group", group.model_dump(mode="json", exclude={"metrics", "flow"}))
+
+
+def group_graph(key: str) -> GroupEconomicsGraph:
+    """The shared incremental graph for a `group_graph_key` (created on first use)."""
+    return _group_graphs.get(key)
+
+
+def calculate_batch_economics(
+    groups: list[WellGroup],
+    wells: list[Well],
+    session_id: str | None = None,
+) -> BatchEconomicsResponse:
+    """Compute many groups against one shared well table, plus the portfolio rollup.
+
+    The well index is built once for all groups, and each group runs through its
+    `group_graph`. With a `session_id`, re-submitting a batch after editing one
+    group only recomputes that group's changed stages.
+    """
+    wells_by_id = {well.id: well for well in wells}
+    results: list[GroupEconomicsResult] = []
+    computed: list[EconomicsColumns] = []
+
+    for group in groups:
+        group_wells = [
+            wells_by_id[well_id] for well_id in dict.fromkeys(group.wellIds) if well_id in wells_by_id
+        ]
+        result = group_graph(group_graph_key(group, session_id)).evaluate(
+            group_wells,
+            group.typeCurve,
+            group.capex,
+            group.pricing,
+            group.opex,
+            group.ownership,
+            tax_assumptions=group.taxAssumptions,
+            debt_assumptions=group.debtAssumptions,
+            reserve_category=group.reserveCategory,
+        )
+        response = result.to_response()
+        results.append(GroupEconomicsResult(groupId=group.id, flow=response.flow, metrics=response.metrics))
+        computed.append(result)
+
+    # Roll up straight from the columns; no MonthlyCashFlow rows are re-read.
+    portfolio = aggregate_columns(computed).to_columns().to_response()
+    return BatchEconomicsResponse(groups=results, portfolio=portfolio)
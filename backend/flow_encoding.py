@@ -0,0 +1,118 @@
+"""
+Negotiated response encodings for monthly cash-flow results.
+
+The default stays the row-per-month EconomicsResponse JSON. Clients that name
+one of the media types below in their Accept header get the same numbers with
+one array per field; month/date are implied by position (month = index + 1).
+
+  application/vnd.slopcast.columnar+json
+      {"months": N, "columns": {"revenue": [...], ...}, "metrics": {...}}
+
+  application/vnd.slopcast.columnar+f64
+      Packed little-endian float64 buffers:
+        bytes 0-3    magic b"SLCF"
+        bytes 4-7    uint32 header length H (little-endian)
+        bytes 8..8+H UTF-8 JSON header {"months", "columns": [names], "metrics", "dtype": "<f8"}
+        padding      zero bytes up to the next 8-byte boundary
+        body         one float64 array of length `months` per column, in header order
+
+The binary form is a plain buffer layout rather than Arrow IPC so the backend
+does not pick up a pyarrow dependency; a browser reads it with one
+``Float64Array`` view per column.
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+from typing import Any, Literal
+
+import numpy as np
+
+from .economics_engine import EconomicsColumns, FlowColumns
+
+FlowEncoding = Literal["json", "columnar-json", "packed-f64"]
+
+COLUMNAR_JSON_MEDIA_TYPE = "application/vnd.slopcast.columnar+json"
+PACKED_F64_MEDIA_TYPE = "application/vnd.slopcast.columnar+f64"
+
+_MEDIA_TYPES: dict[str, FlowEncoding] = {
+    "application/json": "json",
+    COLUMNAR_JSON_MEDIA_TYPE: "columnar-json",
+    PACKED_F64_MEDIA_TYPE: "packed-f64",
+}
+_MAGIC = b"SLCF"
+
+
+def negotiate_flow_encoding(accept: str | None) -> FlowEncoding:
+    """Pick the highest-q supported media type from an Accept header (default JSON)."""
+    best: tuple[float, int, FlowEncoding] | None = None
+    for position, part in enumerate((accept or "").split(",")):
+        media_type, *params = [token.strip() for token in part.split(";")]
+        encoding = _MEDIA_TYPES.get(media_type.lower())
+        if encoding is None:
+            continue
+        q = 1.0
+        for param in params:
+            if param.startswith("q="):
+                try:
+                    q = float(param[2:])
+                except ValueError:
+                    q = 0.0
+        if q <= 0:
+            continue
+        # Higher q wins; ties go to the earlier entry.
+        candidate = (q, -position, encoding)
+        if best is None or candidate[:2] > best[:2]:
+            best = candidate
+    return best[2] if best else "json"
+
+
+def _header(result: EconomicsColumns) -> dict[str, Any]:
+    return {
+        "months": result.months,
+        "metrics": result.metrics.model_dump(mode="json"),
+    }
+
+
+def encode_columnar_json(result: EconomicsColumns) -> bytes:
+    body = _header(result)
+    body["columns"] = {name: column.tolist() for name, column in result.columns.items()}
+    return json.dumps(body, separators=(",", ":")).encode("utf-8")
+
+
+def encode_packed_f64(result: EconomicsColumns) -> bytes:
+    header = _header(result)
+    header["columns"] = list(result.columns)
+    header["dtype"] = "<f8"
+    header_bytes = json.dumps(header, separators=(",", ":")).encode("utf-8")
+    prefix = _MAGIC + struct.pack("<I", len(header_bytes)) + header_bytes
+    padding = b"\x00" * (-len(prefix) % 8)
+    body = b"".join(np.ascontiguousarray(column, dtype="<f8").tobytes() for column in result.columns.values())
+    return prefix + padding + body
+
+
+def decode_packed_f64(payload: bytes) -> tuple[FlowColumns, dict[str, Any]]:
+    """Inverse of `encode_packed_f64`; returns (columns, metrics)."""
+    if payload[:4] != _MAGIC:
+        raise ValueError("not a packed float64 cash-flow payload")
+    (header_len,) = struct.unpack("<I", payload[4:8])
+    header = json.loads(payload[8 : 8 + header_len].decode("utf-8"))
+    offset = 8 + header_len
+    offset += -offset % 8
+    months = int(header["months"])
+    columns: FlowColumns = {}
+    for name in header["columns"]:
+        columns[name] = np.frombuffer(payload, dtype="<f8", count=months, offset=offset)
+        offset += months * 8
+    return columns, header["metrics"]
+
+
+def encode_flow(result: EconomicsColumns, encoding: FlowEncoding) -> tuple[bytes, str]:
+    """Serialize a result in the negotiated encoding; returns (body, media type)."""
+    if encoding == "packed-f64":
+        return encode_packed_f64(result), PACKED_F64_MEDIA_TYPE
+    if encoding == "columnar-json":
+        return encode_columnar_json(result), COLUMNAR_JSON_MEDIA_TYPE
+    return result.to_response().model_dump_json().encode("utf-8"), "application/json"
+
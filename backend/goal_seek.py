@@ -0,0 +1,153 @@
+"""
+Goal seek: the input value at which portfolio NPV10, after-tax NPV10 or IRR
+hits a target (breakeven = target 0).
+
+Every iterate is one `SensitivityPlan` cell, so the plan's per-group wells,
+base schedule and memoized volumes are reused across iterations; a price,
+opex or NRI iterate only re-prices already placed volumes. The cases match
+the sensitivity grids (default scalars, flat rig schedule from each group's
+capex).
+
+The root is bracketed by the search range and refined with the Illinois
+variant of regula falsi: one step when the metric is affine in the variable
+(NPV in oil price or capex scalar while JV payout does not move), superlinear
+otherwise. Bisection takes over while an endpoint metric is infinite (IRR of
+a flow that never turns negative). RIG_COUNT only acts through whole rigs, so
+it is bisected on integers and the closer rig count on either side of the
+crossing is reported.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Callable
+
+from .economics_engine import MONTHLY_DISCOUNT_RATE, npv
+from .irr import solve_irr
+from .models import GoalSeekResult, GoalSeekTarget, TornadoVariable, Well, WellGroup
+from .sensitivity import SensitivityPlan
+
+# Search ranges used when the request does not give one.
+_DEFAULT_BOUNDS: dict[TornadoVariable, tuple[float, float]] = {
+    "OIL_PRICE": (0.0, 250.0),
+    "GAS_PRICE": (0.0, 25.0),
+    "CAPEX_SCALAR": (0.0, 5.0),
+    "EUR_SCALAR": (0.0, 5.0),
+    "OPEX_SCALAR": (0.0, 5.0),
+    "RIG_COUNT": (1.0, 20.0),
+    "NRI": (0.0, 1.0),
+}
+# |metric - target| accepted as a hit: one cent of NPV, 1e-8 of IRR.
+_TOLERANCE: dict[GoalSeekTarget, float] = {"NPV10": 1e-2, "AFTER_TAX_NPV10": 1e-2, "IRR": 1e-8}
+_VALUE_RTOL = 1e-12
+
+
+def portfolio_metric(plan: SensitivityPlan, variable: TornadoVariable, value: float, target: GoalSeekTarget) -> float:
+    pre_tax, after_tax = plan.portfolio_cash_flows({variable: value})
+    if target == "NPV10":
+        return npv(pre_tax, MONTHLY_DISCOUNT_RATE)
+    if target == "AFTER_TAX_NPV10":
+        return npv(after_tax, MONTHLY_DISCOUNT_RATE)
+    irr = solve_irr(pre_tax)
+    if irr is None:
+        # No sign change: an all-positive flow earns an unbounded return.
+        return math.inf if pre_tax.sum() > 0 else -math.inf
+    return irr
+
+
+def _solve(
+    residual: Callable[[float], float],
+    lo: float,
+    hi: float,
+    *,
+    tolerance: float,
+    discrete: bool,
+    max_evaluations: int,
+) -> tuple[float | None, float | None, bool, tuple[float, float] | None, int]:
+    """(value, residual at value, converged, bracket, evaluations)."""
+    a, b = float(lo), float(hi)
+    fa, fb = residual(a), residual(b)
+    evaluations = 2
+    for x, f in ((a, fa), (b, fb)):
+        if abs(f) <= tolerance:
+            return x, f, True, (x, x), evaluations
+    if math.isnan(fa) or math.isnan(fb) or (fa > 0) == (fb > 0):
+        return None, None, False, None, evaluations
+
+    # Illinois scales the retained endpoint's residual inside the secant step only;
+    # fa and fb stay true residuals for the best-endpoint choice.
+    ga = fa
+    while evaluations < max_evaluations:
+        span = abs(b - a)
+        if discrete:
+            if span <= 1:
+                break
+            x = float(math.floor((a + b) / 2))
+        else:
+            if span <= _VALUE_RTOL * max(1.0, abs(a), abs(b)):
+                break
+            x = b - fb * (b - a) / (fb - ga) if math.isfinite(ga) and math.isfinite(fb) else 0.5 * (a + b)
+            if not min(a, b) < x < max(a, b):
+                x = 0.5 * (a + b)
+        fx = residual(x)
+        evaluations += 1
+        if abs(fx) <= tolerance:
+            return x, fx, True, (x, x), evaluations
+        if (fx > 0) != (fb > 0):
+            a, fa, ga = b, fb, fb
+        elif not discrete:
+            # Illinois: halve the endpoint that stayed, so it cannot stall.
+            ga /= 2
+        b, fb = x, fx
+
+    best, f_best = min(((a, fa), (b, fb)), key=lambda item: abs(item[1]))
+    return best, f_best, False, (min(a, b), max(a, b)), evaluations
+
+
+def goal_seek(
+    plan: SensitivityPlan,
+    variable: TornadoVariable,
+    target: GoalSeekTarget = "NPV10",
+    target_value: float = 0.0,
+    lower_bound: float | None = None,
+    upper_bound: float | None = None,
+    max_evaluations: int = 40,
+) -> GoalSeekResult:
+    default_lo, default_hi = _DEFAULT_BOUNDS[variable]
+    lo = default_lo if lower_bound is None else lower_bound
+    hi = default_hi if upper_bound is None else upper_bound
+    lo, hi = min(lo, hi), max(lo, hi)
+    discrete = variable == "RIG_COUNT"
+    if discrete:
+        # Fractional rig counts are rounded up when scheduling.
+        lo, hi = float(max(1, math.ceil(lo))), float(max(1, math.ceil(hi)))
+
+    value, residual, converged, bracket, evaluations = _solve(
+        lambda x: portfolio_metric(plan, variable, x, target) - target_value,
+        lo,
+        hi,
+        tolerance=_TOLERANCE[target],
+        discrete=discrete,
+        max_evaluations=max_evaluations,
+    )
+    return GoalSeekResult(
+        variable=variable,
+        target=target,
+        targetValue=target_value,
+        value=value,
+        achieved=residual + target_value if residual is not None and math.isfinite(residual) else None,
+        converged=converged,
+        bracket=bracket,
+        evaluations=evaluations,
+    )
+
+
+def breakevens(
+    base_groups: list[WellGroup],
+    wells: list[Well],
+    variables: list[TornadoVariable],
+    target: GoalSeekTarget = "NPV10",
+) -> list[GoalSeekResult]:
+    """Target-0 goal seek for each variable over one shared plan."""
+    plan = SensitivityPlan.build(base_groups, wells)
+    return [goal_seek(plan, variable, target) for variable in variables]
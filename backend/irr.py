@@ -0,0 +1,108 @@
+"""
+Batched IRR solver for monthly cash-flow vectors.
+
+Works on a whole (scenarios × months) matrix at once: a sensitivity grid or a
+Monte Carlo run gets every IRR from one set of array operations instead of one
+scalar root-find per scenario.
+
+Conventions match the engine's NPV: cash flow ``i`` (0-based) is discounted by
+``(1 + r) ** (i + 1)`` at monthly rate ``r``, and the reported IRR is the
+nominal annual rate ``12 * r`` (so an IRR of 0.10 means NPV10 == 0).
+
+Method: NPV is evaluated on a fixed grid of ``u = ln(1 + r)`` to bracket a sign
+change (the bracket nearest r = 0 when there are several), then refined with
+Newton steps in ``u`` that fall back to bisection whenever a step leaves the
+bracket. Rows whose flows never change sign have no IRR and are flagged
+explicitly rather than reported as 0.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+
+import numpy as np
+
+# Monthly rates from -99% to +1000%, uniform in ln(1 + r).
+_BRACKET_GRID = np.linspace(math.log(0.01), math.log(11.0), 97)
+
+
+@dataclass(frozen=True)
+class IrrResult:
+    irr: np.ndarray
+    """Nominal annual IRR per scenario; NaN where no root was found."""
+    converged: np.ndarray
+    no_sign_change: np.ndarray
+    iterations: int
+
+
+def _npv_and_slope(cash_flows: np.ndarray, u: np.ndarray, t: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    weighted = cash_flows * np.exp(-np.outer(u, t))
+    return weighted.sum(axis=1), -(weighted * t).sum(axis=1)
+
+
+def solve_irr_batch(
+    cash_flows: np.ndarray,
+    *,
+    tol: float = 1e-12,
+    max_iter: int = 100,
+) -> IrrResult:
+    """IRR for every row of a (scenarios × months) cash-flow matrix."""
+    cf = np.atleast_2d(np.asarray(cash_flows, dtype=float))
+    n_rows, n_months = cf.shape
+    t = np.arange(1, n_months + 1, dtype=float)
+
+    no_sign_change = ~((cf > 0).any(axis=1) & (cf < 0).any(axis=1))
+    irr = np.full(n_rows, np.nan)
+    converged = np.zeros(n_rows, dtype=bool)
+    if n_months == 0 or no_sign_change.all():
+        return IrrResult(irr=irr, converged=converged, no_sign_change=no_sign_change, iterations=0)
+
+    grid_npv = cf @ np.exp(-np.outer(_BRACKET_GRID, t)).T
+    signs = np.sign(grid_npv)
+    crossings = (signs[:, :-1] != signs[:, 1:]) & ~no_sign_change[:, None]
+    mid_distance = np.abs(_BRACKET_GRID[:-1] + _BRACKET_GRID[1:])
+    choice = np.where(crossings, mid_distance, np.inf).argmin(axis=1)
+    bracketed = crossings[np.arange(n_rows), choice]
+
+    rows = np.flatnonzero(bracketed)
+    if rows.size == 0:
+        return IrrResult(irr=irr, converged=converged, no_sign_change=no_sign_change, iterations=0)
+
+    sub = cf[rows]
+    lo = _BRACKET_GRID[choice[rows]]
+    hi = _BRACKET_GRID[choice[rows] + 1]
+    f_lo = grid_npv[rows, choice[rows]]
+    u = 0.5 * (lo + hi)
+    done = np.zeros(rows.size, dtype=bool)
+
+    iterations = 0
+    for iterations in range(1, max_iter + 1):
+        f, slope = _npv_and_slope(sub, u, t)
+        exact = f == 0
+        same_side = np.sign(f) == np.sign(f_lo)
+        lo = np.where(same_side, u, lo)
+        f_lo = np.where(same_side, f, f_lo)
+        hi = np.where(same_side, hi, u)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            newton = u - f / slope
+        inside = np.isfinite(newton) & (newton > lo) & (newton < hi)
+        step = np.where(inside, newton, 0.5 * (lo + hi))
+        step = np.where(exact | done, u, step)
+
+        done |= exact | (np.abs(step - u) <= tol) | (hi - lo <= tol)
+        u = step
+        if done.all():
+            break
+
+    irr[rows] = 12.0 * np.expm1(u)
+    converged[rows] = done
+    return IrrResult(irr=irr, converged=converged, no_sign_change=no_sign_change, iterations=iterations)
+
+
+def solve_irr(cash_flow: np.ndarray) -> float | None:
+    """Scalar convenience wrapper: nominal annual IRR, or None when undefined."""
+    result = solve_irr_batch(np.asarray(cash_flow, dtype=float)[None, :])
+    value = float(result.irr[0])
+    return value if result.converged[0] and math.isfinite(value) else None
@@ -1,22 +1,47 @@
 from contextlib import asynccontextmanager
 from typing import AsyncIterator
 
-from fastapi import FastAPI, Request
+import numpy as np
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 
-from .economics import aggregate_economics, calculate_economics
+from .economics import calculate_economics_columns
+from .economics_aggregate import aggregate_groups
+from .economics_graph import calculate_batch_economics
+from .flow_encoding import encode_flow, negotiate_flow_encoding
+from .goal_seek import breakevens, goal_seek
 from .models import (
     AggregateEconomicsRequest,
+    BatchEconomicsRequest,
+    BatchEconomicsResponse,
+    BreakevenRequest,
     CalculateEconomicsRequest,
     EconomicsResponse,
+    GoalSeekRequest,
+    GoalSeekResult,
+    MonteCarloRequest,
+    MonteCarloResponse,
     Scalars,
     SensitivityMatrixRequest,
     SensitivityMatrixResult,
+    TornadoRequest,
+    TornadoResponse,
+    WellEconomicsRequest,
+    WellEconomicsResponse,
 )
-from .sensitivity import generate_sensitivity_matrix
+from .monte_carlo import run_monte_carlo
+from .result_cache import cached_response
+from .sensitivity import SensitivityPlan, generate_sensitivity_matrix, generate_tornado
+from .sensitivity_stream import sensitivity_stream_response
 from .setup_routes import create_setup_router
 from .spatial_routes import create_spatial_router
 from .spatial_service import SpatialDBManager
+from .well_economics import calculate_well_economics
+from .worker_pool import shutdown_pools
+
+_SENSITIVITY_MATRIX_ADAPTER = TypeAdapter(list[list[SensitivityMatrixResult]])
 
 
 def create_app() -> FastAPI:
@@ -25,6 +50,7 @@ def create_app() -> FastAPI:
         app.state.spatial_db = SpatialDBManager()
         yield
         app.state.spatial_db.disconnect()
+        shutdown_pools()
 
     app = FastAPI(title="Slopcast Backend", version="0.1.0", lifespan=lifespan)
 
@@ -53,40 +79,118 @@ def create_app() -> FastAPI:
     # reference implementation — kept intentionally for parity comparison against the
     # authoritative TypeScript engine. Do not delete these routes.
     @app.post("/api/economics/calculate", response_model=EconomicsResponse)
-    def economics_calculate(req: CalculateEconomicsRequest) -> EconomicsResponse:
-        scalars = req.scalars or Scalars()
-        return calculate_economics(
+    def economics_calculate(req: CalculateEconomicsRequest, request: Request) -> Response:
+        # Columnar / packed-binary encodings are opt-in via Accept and skip
+        # per-month MonthlyCashFlow construction entirely.
+        encoding = negotiate_flow_encoding(request.headers.get("accept"))
+
+        def compute() -> tuple[bytes, str]:
+            result = calculate_economics_columns(
+                selected_wells=req.wells,
+                tc=req.typeCurve,
+                capex=req.capex,
+                pricing=req.pricing,
+                opex=req.opex,
+                ownership=req.ownership,
+                scalars=req.scalars or Scalars(),
+                schedule_override=req.scheduleOverride,
+                tax_assumptions=req.taxAssumptions,
+                debt_assumptions=req.debtAssumptions,
+                reserve_category=req.reserveCategory,
+                pv_rates=req.pvRates,
+            )
+            return encode_flow(result, encoding)
+
+        return cached_response(request, "economics/calculate", req, compute, variant=encoding)
+
+    @app.post("/api/economics/aggregate", response_model=EconomicsResponse)
+    def economics_aggregate(req: AggregateEconomicsRequest, request: Request) -> Response:
+        encoding = negotiate_flow_encoding(request.headers.get("accept"))
+
+        def compute() -> tuple[bytes, str]:
+            # Columns straight into the encoder; rows are only built for JSON.
+            return encode_flow(aggregate_groups(req.groups).to_columns(), encoding)
+
+        return cached_response(request, "economics/aggregate", req, compute, variant=encoding)
+
+    @app.post("/api/economics/batch", response_model=BatchEconomicsResponse)
+    def economics_batch(req: BatchEconomicsRequest) -> BatchEconomicsResponse:
+        # One round trip for every group plus the portfolio rollup; wells are
+        # validated once and referenced by id from each group.
+        return calculate_batch_economics(req.groups, req.wells, req.sessionId)
+
+    @app.post("/api/economics/wells", response_model=WellEconomicsResponse)
+    def economics_wells(req: WellEconomicsRequest) -> WellEconomicsResponse:
+        # Opt-in well-level view: per-well metrics (and optionally monthly
+        # streams) from one wells x months matrix per stream.
+        result = calculate_well_economics(
             selected_wells=req.wells,
             tc=req.typeCurve,
             capex=req.capex,
             pricing=req.pricing,
             opex=req.opex,
             ownership=req.ownership,
-            scalars=scalars,
+            scalars=req.scalars,
             schedule_override=req.scheduleOverride,
-            tax_assumptions=req.taxAssumptions,
-            debt_assumptions=req.debtAssumptions,
-            reserve_category=req.reserveCategory,
+            dtype=np.float32 if req.precision == "float32" else np.float64,
         )
-
-    @app.post("/api/economics/aggregate", response_model=EconomicsResponse)
-    def economics_aggregate(req: AggregateEconomicsRequest) -> EconomicsResponse:
-        return aggregate_economics(req.groups)
+        return result.to_response(include_flows=req.includeFlows)
 
     @app.post(
         "/api/sensitivity/matrix",
         response_model=list[list[SensitivityMatrixResult]],
     )
-    def sensitivity_matrix(req: SensitivityMatrixRequest) -> list[list[SensitivityMatrixResult]]:
-        return generate_sensitivity_matrix(
-            base_groups=req.baseGroups,
-            wells=req.wells,
-            x_var=req.xVar,
-            x_steps=req.xSteps,
-            y_var=req.yVar,
-            y_steps=req.ySteps,
+    def sensitivity_matrix(req: SensitivityMatrixRequest, request: Request) -> Response:
+        def compute() -> tuple[bytes, str]:
+            matrix = generate_sensitivity_matrix(
+                base_groups=req.baseGroups,
+                wells=req.wells,
+                x_var=req.xVar,
+                x_steps=req.xSteps,
+                y_var=req.yVar,
+                y_steps=req.ySteps,
+            )
+            return _SENSITIVITY_MATRIX_ADAPTER.dump_json(matrix), "application/json"
+
+        return cached_response(request, "sensitivity/matrix", req, compute)
+
+    @app.post("/api/sensitivity/tornado", response_model=TornadoResponse)
+    def sensitivity_tornado(req: TornadoRequest) -> TornadoResponse:
+        return generate_tornado(req.baseGroups, req.wells, req.variables)
+
+    @app.post("/api/sensitivity/goal-seek", response_model=GoalSeekResult)
+    def sensitivity_goal_seek(req: GoalSeekRequest) -> GoalSeekResult:
+        return goal_seek(
+            SensitivityPlan.build(req.baseGroups, req.wells),
+            req.variable,
+            req.target,
+            req.targetValue,
+            req.lowerBound,
+            req.upperBound,
+            req.maxEvaluations,
         )
 
+    @app.post("/api/sensitivity/breakeven", response_model=list[GoalSeekResult])
+    def sensitivity_breakeven(req: BreakevenRequest) -> list[GoalSeekResult]:
+        return breakevens(req.baseGroups, req.wells, req.variables, req.target)
+
+    @app.post("/api/sensitivity/monte-carlo", response_model=MonteCarloResponse)
+    def sensitivity_monte_carlo(req: MonteCarloRequest) -> MonteCarloResponse:
+        return run_monte_carlo(
+            req.baseGroups,
+            req.wells,
+            req.distributions,
+            req.draws,
+            seed=req.seed,
+            chunk_size=req.chunkSize,
+        )
+
+    @app.post("/api/sensitivity/matrix/stream")
+    async def sensitivity_matrix_stream(req: SensitivityMatrixRequest, request: Request) -> StreamingResponse:
+        # Row-by-row NDJSON (default) or SSE (Accept: text/event-stream) with
+        # progress counts and a final summary frame; stops on disconnect.
+        return sensitivity_stream_response(request, req)
+
     # ALWAYS-LIVE: /api/spatial/* is polled by the app's connection-status check
     # regardless of which economics engine is active.
     app.include_router(create_spatial_router())
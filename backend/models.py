@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Literal
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 
 
 WellStatus = Literal["PRODUCING", "DUC", "PERMIT"]
@@ -59,6 +59,10 @@ class TypeCurveParams(BaseModel):
     terminalDecline: float = Field(..., ge=0, description="Terminal decline (annual %)")
     gorMcfPerBbl: float = Field(0.0, ge=0, description="Gas-Oil Ratio (mcf/bbl)")
     segments: list[ForecastSegment] = Field(default_factory=list)
+    modifiedHyperbolic: bool = Field(
+        False,
+        description="Hyperbolic segments turn exponential at terminalDecline (off by default; TS ignores it)",
+    )
 
 
 class CapexItem(BaseModel):
@@ -162,11 +166,18 @@ class MonthlyCashFlow(BaseModel):
     outstandingDebt: float | None = None
 
 
+class PvProfilePoint(BaseModel):
+    ratePct: float = Field(..., description="Annual discount rate in percent, compounded monthly")
+    pv: float
+    afterTaxPv: float | None = None
+    leveredPv: float | None = None
+
+
 class DealMetrics(BaseModel):
     totalCapex: float
     eur: float
     npv10: float
-    irr: float
+    irr: float | None = Field(..., description="Nominal annual IRR (monthly rate × 12); None when undefined")
     payoutMonths: int
     wellCount: int
     afterTaxNpv10: float | None = None
@@ -176,6 +187,7 @@ class DealMetrics(BaseModel):
     dscr: float | None = None
     riskedEur: float | None = None
     riskedNpv10: float | None = None
+    pvProfile: list[PvProfilePoint] | None = None
 
 
 class ScheduleParams(BaseModel):
@@ -225,6 +237,21 @@ class Scenario(BaseModel):
 
 
 SensitivityVariable = Literal["OIL_PRICE", "CAPEX_SCALAR", "EUR_SCALAR", "RIG_COUNT"]
+# Tornado bars also cover inputs that have no matrix axis.
+TornadoVariable = Literal[
+    "OIL_PRICE", "CAPEX_SCALAR", "EUR_SCALAR", "RIG_COUNT", "GAS_PRICE", "OPEX_SCALAR", "NRI"
+]
+
+
+GoalSeekTarget = Literal["NPV10", "AFTER_TAX_NPV10", "IRR"]
+
+# Monte Carlo inputs: *_SCALAR multiply each group's own value (QI/B/DI scale
+# every type-curve segment), prices are absolute, and DELAY_MONTHS shifts the
+# whole program later by whole months.
+MonteCarloVariable = Literal[
+    "QI_SCALAR", "B_SCALAR", "DI_SCALAR", "CAPEX_SCALAR", "OIL_PRICE", "GAS_PRICE", "DELAY_MONTHS"
+]
+DistributionKind = Literal["uniform", "triangular", "normal", "lognormal"]
 
 
 class SensitivityMatrixResult(BaseModel):
@@ -255,12 +282,114 @@ class CalculateEconomicsRequest(BaseModel):
     taxAssumptions: TaxAssumptions | None = None
     debtAssumptions: DebtAssumptions | None = None
     reserveCategory: ReserveCategory | None = None
+    pvRates: list[float] | None = Field(
+        None, description="Annual discount rates in percent for metrics.pvProfile, e.g. [0, 8, 10, 15, 20]"
+    )
+
+
+class WellEconomicsRequest(CalculateEconomicsRequest):
+    precision: Literal["float64", "float32"] = Field(
+        "float64", description="Storage dtype for the wells x months matrices; float32 halves memory"
+    )
+    includeFlows: bool = Field(False, description="Return per-well monthly streams, not just metrics")
+
+
+class WellMetrics(BaseModel):
+    wellId: str
+    startMonth: float = Field(..., description="Fractional rig start month (0-based)")
+    eur: float
+    totalCapex: float
+    npv10: float
+    irr: float | None = None
+    payoutMonths: int
+
+
+class WellEconomicsResponse(BaseModel):
+    wells: list[WellMetrics] = Field(..., description="Wells in drill order")
+    flows: dict[str, list[list[float]]] | None = Field(
+        None, description="Stream name -> rows aligned with `wells`, one value per month"
+    )
 
 
 class AggregateEconomicsRequest(BaseModel):
     groups: list[WellGroup]
 
 
+class BatchEconomicsRequest(BaseModel):
+    wells: list[Well] = Field(..., description="Shared well table referenced by each group's wellIds")
+    groups: list[WellGroup]
+    sessionId: str | None = Field(
+        None,
+        description="Caller-chosen scope for cached stage graphs; without it graphs are keyed by group content",
+    )
+
+
+class GroupEconomicsResult(BaseModel):
+    groupId: str
+    flow: list[MonthlyCashFlow]
+    metrics: DealMetrics
+
+
+class BatchEconomicsResponse(BaseModel):
+    groups: list[GroupEconomicsResult]
+    portfolio: EconomicsResponse
+
+
+class TornadoInput(BaseModel):
+    variable: TornadoVariable
+    low: float = Field(..., description="Absolute value (price, scalar, rig count or NRI) for the low case")
+    high: float
+
+
+class TornadoRequest(BaseModel):
+    baseGroups: list[WellGroup]
+    wells: list[Well]
+    variables: list[TornadoInput]
+
+
+class TornadoBar(BaseModel):
+    variable: TornadoVariable
+    lowValue: float
+    highValue: float
+    lowNpv: float
+    highNpv: float
+    swing: float = Field(..., description="|highNpv - lowNpv|; bars are sorted by this, largest first")
+
+
+class TornadoResponse(BaseModel):
+    baseNpv: float
+    bars: list[TornadoBar]
+
+
+class GoalSeekRequest(BaseModel):
+    baseGroups: list[WellGroup]
+    wells: list[Well]
+    variable: TornadoVariable
+    target: GoalSeekTarget = "NPV10"
+    targetValue: float = Field(0.0, description="Dollars for NPV targets; nominal annual fraction for IRR (0.2 = 20%)")
+    lowerBound: float | None = Field(None, description="Search range; defaults depend on the variable")
+    upperBound: float | None = None
+    maxEvaluations: int = Field(40, ge=2, le=200)
+
+
+class GoalSeekResult(BaseModel):
+    variable: TornadoVariable
+    target: GoalSeekTarget
+    targetValue: float
+    value: float | None = Field(None, description="Input value that hits the target; None if the range has no crossing")
+    achieved: float | None = Field(None, description="Target metric at `value`")
+    converged: bool = Field(..., description="`achieved` is within tolerance of the target")
+    bracket: tuple[float, float] | None = Field(None, description="Final range known to contain the crossing")
+    evaluations: int
+
+
+class BreakevenRequest(BaseModel):
+    baseGroups: list[WellGroup]
+    wells: list[Well]
+    variables: list[TornadoVariable]
+    target: GoalSeekTarget = "NPV10"
+
+
 class SensitivityMatrixRequest(BaseModel):
     baseGroups: list[WellGroup]
     wells: list[Well]
@@ -268,3 +397,66 @@ class SensitivityMatrixRequest(BaseModel):
     xSteps: list[float]
     yVar: SensitivityVariable
     ySteps: list[float]
+
+
+class MonteCarloDistribution(BaseModel):
+    variable: MonteCarloVariable
+    kind: DistributionKind
+    low: float | None = Field(None, description="uniform/triangular lower bound; optional clip for normal/lognormal")
+    mode: float | None = Field(None, description="triangular only")
+    high: float | None = Field(None, description="uniform/triangular upper bound; optional clip for normal/lognormal")
+    mean: float | None = Field(None, description="normal/lognormal mean of the variable itself")
+    stdDev: float | None = Field(None, ge=0, description="normal/lognormal standard deviation of the variable itself")
+
+    @model_validator(mode="after")
+    def _check_parameters(self):
+        if self.kind in ("uniform", "triangular"):
+            if self.low is None or self.high is None or self.low > self.high:
+                raise ValueError(f"{self.kind} needs low <= high")
+            if self.kind == "triangular" and (self.mode is None or not self.low <= self.mode <= self.high):
+                raise ValueError("triangular needs low <= mode <= high")
+        else:
+            if self.mean is None or self.stdDev is None:
+                raise ValueError(f"{self.kind} needs mean and stdDev")
+            if self.kind == "lognormal" and self.mean <= 0:
+                raise ValueError("lognormal needs mean > 0")
+        return self
+
+
+class MonteCarloRequest(BaseModel):
+    baseGroups: list[WellGroup]
+    wells: list[Well]
+    distributions: list[MonteCarloDistribution] = Field(
+        ..., description="One per uncertain input; inputs without a distribution stay at the group's value"
+    )
+    draws: int = Field(1000, ge=1, le=50_000)
+    seed: int | None = Field(None, ge=0, description="RNG seed; omitted = fresh entropy, echoed in the response")
+    chunkSize: int = Field(1000, ge=1, description="Draws evaluated per array pass (bounds peak memory)")
+
+
+class PercentileSummary(BaseModel):
+    """Reserve-style percentiles: P10 is the high case (exceeded by 10% of draws)."""
+
+    p10: float
+    p50: float
+    p90: float
+    mean: float
+
+
+class FanChartPoint(BaseModel):
+    month: int = Field(..., ge=1)
+    p10: float
+    p50: float
+    p90: float
+
+
+class MonteCarloResponse(BaseModel):
+    draws: int
+    seed: int
+    npv10: PercentileSummary
+    eur: PercentileSummary
+    irr: PercentileSummary | None = Field(None, description="Over draws with a defined IRR; None if there are none")
+    irrDefinedDraws: int
+    fan: dict[str, list[FanChartPoint]] = Field(
+        ..., description="Per-month percentiles of portfolio netCashFlow, cumulativeCashFlow and oilProduction"
+    )
@@ -0,0 +1,414 @@
+"""
+Monte Carlo portfolio economics: P10/P50/P90 of NPV10, EUR and IRR.
+
+Every draw's inputs are sampled up front from one seeded generator, so a run
+is reproducible from its seed regardless of chunk size or worker count. Draws
+are then evaluated as (draws × months) arrays, one chunk at a time, which keeps
+peak memory at a few chunk-sized matrices per group:
+
+- type curves with drawn qi/b/di come from `evaluate_production_curves_batch`;
+- placement is one matrix product with the group's start-month placement
+  matrix (the `place_curve` convolution written as a Toeplitz matrix);
+- a whole-month delay shifts every placed stream, which is exactly what
+  rescheduling every well that much later does;
+- ownership factors, including JV payout reversion, are solved per draw in one
+  broadcast call, and IRR comes from `solve_irr_batch`.
+
+Each chunk is reduced before it is returned: per-draw NPV10, EUR and IRR, plus
+per-month histograms of the fan-chart series. Histogram bins are fixed per
+month from a pilot of the first draws (a set that does not depend on chunk
+size), and counts plus exact per-month min/max merge by addition, so nothing
+of size draws × months is ever held or sent back from a worker. Fan
+percentiles are interpolated within a bin (1/256 of the pilot's range for
+that month), and tails outside the pilot range are bounded by the exact
+min/max.
+
+Economics are pre-tax, as in the sensitivity grids. Chunks can be spread over
+the long-lived Monte Carlo pool from `worker_pool.shared_pool`
+(MONTE_CARLO_WORKERS, or `workers=`), with plans cached per worker and inputs
+sent through `map_plan_jobs`, as for the sensitivity pool.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from itertools import repeat
+
+import numpy as np
+
+from .config import env_int
+from .economics import (
+    _compute_ownership_factors,
+    _legacy_opex,
+    _legacy_ownership,
+    evaluate_production_curve,
+    evaluate_production_curves_batch,
+)
+from .economics_engine import (
+    MONTHS_TO_PROJECT,
+    OpexRateTable,
+    compile_opex_table,
+    discount_factors,
+    place_amounts,
+    well_capex,
+)
+from .irr import solve_irr_batch
+from .models import (
+    FanChartPoint,
+    MonteCarloDistribution,
+    MonteCarloResponse,
+    MonteCarloVariable,
+    OwnershipAssumptions,
+    PercentileSummary,
+    Well,
+    WellGroup,
+)
+from .scheduling import schedule_wells
+from .worker_pool import PlanJob, WorkerPlans, map_plan_jobs, shared_pool
+
+_DEFAULT_MONTE_CARLO_WORKERS = 1
+# Draws whose fan-chart series fix the histogram bins, and bins per month.
+_FAN_PILOT_DRAWS = 1000
+_FAN_BINS = 256
+_CURVE_VARIABLES: frozenset[MonteCarloVariable] = frozenset({"QI_SCALAR", "B_SCALAR", "DI_SCALAR"})
+
+# Variable -> (draws,) array; variables without a distribution are absent.
+Samples = dict[MonteCarloVariable, np.ndarray]
+
+
+def sample_inputs(distributions: list[MonteCarloDistribution], draws: int, seed: int) -> Samples:
+    """Draw every distribution in request order from one generator seeded with `seed`."""
+    rng = np.random.default_rng(seed)
+    samples: Samples = {}
+    for dist in distributions:
+        if dist.kind == "uniform":
+            values = rng.uniform(dist.low, dist.high, draws)
+        elif dist.kind == "triangular":
+            values = (
+                rng.triangular(dist.low, dist.mode, dist.high, draws)
+                if dist.low < dist.high
+                else np.full(draws, dist.low)
+            )
+        else:
+            if dist.kind == "normal":
+                values = rng.normal(dist.mean, dist.stdDev, draws)
+            else:
+                # Moments of the variable itself -> parameters of its log.
+                sigma2 = np.log1p((dist.stdDev / dist.mean) ** 2)
+                values = rng.lognormal(np.log(dist.mean) - sigma2 / 2, np.sqrt(sigma2), draws)
+            if dist.low is not None or dist.high is not None:
+                values = np.clip(values, dist.low, dist.high)
+        samples[dist.variable] = _clip_to_domain(dist.variable, values)
+    return samples
+
+
+def _clip_to_domain(variable: MonteCarloVariable, values: np.ndarray) -> np.ndarray:
+    if variable == "DELAY_MONTHS":
+        return np.maximum(np.rint(values), 0).astype(np.int64)
+    # Prices and scalars are non-negative, matching the request models.
+    return np.maximum(values, 0.0)
+
+
+def _slice_samples(samples: Samples, lo: int, hi: int) -> Samples:
+    return {variable: values[lo:hi] for variable, values in samples.items()}
+
+
+def _delay(streams: np.ndarray, delay: np.ndarray | None) -> np.ndarray:
+    """Shift each (draws × months) row later by its draw's whole-month delay."""
+    if delay is None or not delay.any():
+        return streams
+    months = streams.shape[-1]
+    shifted = np.zeros(streams.shape)
+    # Delays are whole months from a short range, so shift by slicing per value.
+    for months_late in np.unique(delay).tolist():
+        rows = delay == months_late
+        if months_late < months:
+            shifted[rows, months_late:] = streams[rows, : months - months_late]
+    return shifted
+
+
+def _placement_matrix(prod_idx: np.ndarray, months: int) -> np.ndarray:
+    """(age × month) matrix P with ``curve @ P == place_curve(prod_idx, curve, months)``."""
+    counts = np.bincount(prod_idx[(prod_idx >= 0) & (prod_idx < months)], minlength=months).astype(float)
+    lag = np.arange(months)[None, :] - np.arange(months)[:, None]
+    return np.where(lag >= 0, counts[np.maximum(lag, 0)], 0.0)
+
+
+@dataclass
+class _GroupSimulation:
+    """Draw-invariant inputs for one group, resolved once per run."""
+
+    group: WellGroup
+    curve_key: str
+    """Canonical type curve; groups sharing one share each chunk's drawn curves."""
+    opex_table: OpexRateTable
+    ownership: OwnershipAssumptions
+    placement: np.ndarray
+    base_capex: np.ndarray
+    """Placed gross capex at capex scalar 1."""
+
+    @classmethod
+    def build(cls, group: WellGroup, wells: list[Well], months: int) -> _GroupSimulation:
+        schedule = schedule_wells(wells, group.capex, None)
+        capex_idx = np.floor(schedule.start_months).astype(np.int64)
+        return cls(
+            group=group,
+            curve_key=group.typeCurve.model_dump_json(),
+            opex_table=compile_opex_table(group.opex or _legacy_opex(group.pricing), months),
+            ownership=group.ownership or _legacy_ownership(group.pricing),
+            placement=_placement_matrix(capex_idx + 1, months),
+            base_capex=place_amounts(capex_idx, well_capex(schedule.wells, group.capex, 1.0), months),
+        )
+
+    def _oil_curves(self, samples: Samples, draws: int, months: int) -> np.ndarray:
+        tc = self.group.typeCurve
+        if not _CURVE_VARIABLES & samples.keys():
+            oil_curve, _ = evaluate_production_curve(tc, months, 1.0)
+            return oil_curve[None, :]
+        ones = np.ones(draws)
+        return evaluate_production_curves_batch(
+            tc,
+            months,
+            qi_scale=samples.get("QI_SCALAR", ones),
+            b_scale=samples.get("B_SCALAR", ones),
+            di_scale=samples.get("DI_SCALAR", ones),
+        )
+
+    def simulate(
+        self, samples: Samples, draws: int, months: int, curves: dict[str, np.ndarray]
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """(net cash flow, gross oil), each (draws × months); `curves` memoizes drawn curves."""
+        pricing = self.group.pricing
+        gor = self.group.typeCurve.gorMcfPerBbl or 0.0
+        oil_curves = curves.get(self.curve_key)
+        if oil_curves is None:
+            oil_curves = curves[self.curve_key] = self._oil_curves(samples, draws, months)
+        opex_curves = self.opex_table.opex_curve(oil_curves, oil_curves * gor)
+        oil, opex = np.split(np.concatenate([oil_curves, opex_curves]) @ self.placement, 2)
+
+        delay = samples.get("DELAY_MONTHS")
+        oil = _delay(np.broadcast_to(oil, (draws, months)), delay)
+        opex = _delay(np.broadcast_to(opex, (draws, months)), delay)
+        capex = _delay(np.outer(samples.get("CAPEX_SCALAR", np.ones(draws)), self.base_capex), delay)
+
+        realized_oil = samples.get("OIL_PRICE", np.full(draws, pricing.oilPrice)) - (pricing.oilDifferential or 0.0)
+        realized_gas = samples.get("GAS_PRICE", np.full(draws, pricing.gasPrice)) - (pricing.gasDifferential or 0.0)
+        revenue = oil * (realized_oil + gor * realized_gas)[:, None]
+
+        net_revenue_factor, net_cost_factor = _compute_ownership_factors(self.ownership, revenue, opex, capex)
+        return revenue * net_revenue_factor - (opex + capex) * net_cost_factor, oil
+
+
+@dataclass
+class _ChunkResult:
+    npv10: np.ndarray
+    eur: np.ndarray
+    irr: np.ndarray
+    """Nominal annual IRR per draw; NaN where undefined."""
+    net_cash_flow: np.ndarray
+    oil: np.ndarray
+
+    def fan_series(self) -> dict[str, np.ndarray]:
+        return {
+            "netCashFlow": self.net_cash_flow,
+            "cumulativeCashFlow": np.cumsum(self.net_cash_flow, axis=1),
+            "oilProduction": self.oil,
+        }
+
+
+@dataclass
+class _FanSketch:
+    counts: np.ndarray
+    """(months × bins) draw counts."""
+    low: np.ndarray
+    high: np.ndarray
+
+    def merge(self, other: _FanSketch) -> _FanSketch:
+        return _FanSketch(
+            counts=self.counts + other.counts,
+            low=np.minimum(self.low, other.low),
+            high=np.maximum(self.high, other.high),
+        )
+
+
+@dataclass
+class _FanBins:
+    """Fixed per-month bins; bins 0 and _FAN_BINS + 1 catch values outside [lo, lo + _FAN_BINS * width]."""
+
+    lo: np.ndarray
+    hi: np.ndarray
+    width: np.ndarray
+
+    @classmethod
+    def from_pilot(cls, values: np.ndarray) -> _FanBins:
+        lo, hi = values.min(axis=0), values.max(axis=0)
+        return cls(lo=lo, hi=hi, width=np.where(hi > lo, (hi - lo) / _FAN_BINS, 1.0))
+
+    def sketch(self, values: np.ndarray) -> _FanSketch:
+        months = values.shape[1]
+        index = np.floor((values - self.lo) / self.width) + 1
+        # The pilot maximum (often a point mass, e.g. zero flow) belongs to the last regular bin.
+        index = np.where(values <= self.hi, np.minimum(index, _FAN_BINS), _FAN_BINS + 1)
+        index = np.maximum(index, 0).astype(np.int64)
+        index += np.arange(months) * (_FAN_BINS + 2)
+        counts = np.bincount(index.ravel(), minlength=months * (_FAN_BINS + 2)).reshape(months, _FAN_BINS + 2)
+        return _FanSketch(counts=counts, low=values.min(axis=0), high=values.max(axis=0))
+
+    def percentiles(self, sketch: _FanSketch, qs: list[float]) -> list[np.ndarray]:
+        """Per-month percentiles (np.percentile's rank q * (n - 1)), interpolated within the bin."""
+        rows = np.arange(sketch.counts.shape[0])
+        cumulative = np.cumsum(sketch.counts, axis=1)
+        n = cumulative[0, -1]
+        out = []
+        for q in qs:
+            rank = q * (n - 1)
+            k = (cumulative <= rank).sum(axis=1)
+            count = sketch.counts[rows, k]
+            frac = np.clip((rank - (cumulative[rows, k] - count) + 0.5) / count, 0.0, 1.0)
+            bin_lo = np.where(k == 0, sketch.low, self.lo + (k - 1) * self.width)
+            bin_hi = np.where(k == _FAN_BINS + 1, sketch.high, self.lo + k * self.width)
+            out.append(np.clip(bin_lo + frac * (bin_hi - bin_lo), sketch.low, sketch.high))
+        return out
+
+
+@dataclass
+class _ChunkSummary:
+    """What a chunk sends back: per-draw scalars and mergeable fan histograms."""
+
+    npv10: np.ndarray
+    eur: np.ndarray
+    irr: np.ndarray
+    fans: dict[str, _FanSketch]
+
+    @classmethod
+    def reduce(cls, result: _ChunkResult, bins: dict[str, _FanBins]) -> _ChunkSummary:
+        fans = {name: bins[name].sketch(values) for name, values in result.fan_series().items()}
+        return cls(npv10=result.npv10, eur=result.eur, irr=result.irr, fans=fans)
+
+
+@dataclass
+class MonteCarloPlan:
+    """Per-group simulations for one portfolio, built once per run."""
+
+    groups: list[_GroupSimulation]
+    months: int = MONTHS_TO_PROJECT
+
+    @classmethod
+    def build(cls, base_groups: list[WellGroup], wells: list[Well], months: int = MONTHS_TO_PROJECT) -> MonteCarloPlan:
+        simulations = []
+        for group in base_groups:
+            group_well_ids = set(group.wellIds)
+            group_wells = [w for w in wells if w.id in group_well_ids]
+            if group_wells:
+                simulations.append(_GroupSimulation.build(group, group_wells, months))
+        return cls(groups=simulations, months=months)
+
+    def evaluate(self, samples: Samples, draws: int) -> _ChunkResult:
+        net = np.zeros((draws, self.months))
+        oil = np.zeros((draws, self.months))
+        curves: dict[str, np.ndarray] = {}
+        for simulation in self.groups:
+            group_net, group_oil = simulation.simulate(samples, draws, self.months, curves)
+            net += group_net
+            oil += group_oil
+        irr = solve_irr_batch(net)
+        return _ChunkResult(
+            npv10=net @ discount_factors(self.months),
+            eur=oil.sum(axis=1),
+            irr=np.where(irr.converged, irr.irr, np.nan),
+            net_cash_flow=net,
+            oil=oil,
+        )
+
+
+# Plans built in this process when it runs as a pool worker.
+_worker_plans: WorkerPlans[MonteCarloPlan] = WorkerPlans(MonteCarloPlan.build)
+
+
+def _evaluate_chunk(job: PlanJob, chunk: tuple[Samples, int]) -> _ChunkResult | None:
+    plan = _worker_plans.get(job)
+    return None if plan is None else plan.evaluate(*chunk)
+
+
+def _summarize_chunk(job: PlanJob, chunk: tuple[Samples, int], bins: dict[str, _FanBins]) -> _ChunkSummary | None:
+    result = _evaluate_chunk(job, chunk)
+    return None if result is None else _ChunkSummary.reduce(result, bins)
+
+
+def monte_carlo_workers() -> int:
+    return env_int("MONTE_CARLO_WORKERS", _DEFAULT_MONTE_CARLO_WORKERS)
+
+
+def _summary(values: np.ndarray) -> PercentileSummary:
+    p90, p50, p10 = np.percentile(values, [10, 50, 90])
+    return PercentileSummary(p10=p10, p50=p50, p90=p90, mean=float(values.mean()))
+
+
+def _fan(bins: _FanBins, sketch: _FanSketch) -> list[FanChartPoint]:
+    p90, p50, p10 = bins.percentiles(sketch, [0.1, 0.5, 0.9])
+    return [
+        FanChartPoint(month=i + 1, p10=high, p50=mid, p90=low)
+        for i, (high, mid, low) in enumerate(zip(p10.tolist(), p50.tolist(), p90.tolist()))
+    ]
+
+
+def _chunks(samples: Samples, lo: int, hi: int, chunk_size: int) -> list[tuple[Samples, int]]:
+    bounds = list(range(lo, hi, chunk_size)) + [hi]
+    return [(_slice_samples(samples, a, b), b - a) for a, b in zip(bounds[:-1], bounds[1:])]
+
+
+def _pilot_bins(pilot: list[_ChunkResult]) -> dict[str, _FanBins]:
+    """Fan bins from the pilot chunks (at most _FAN_PILOT_DRAWS draws)."""
+    series = [result.fan_series() for result in pilot]
+    return {name: _FanBins.from_pilot(np.concatenate([s[name] for s in series])) for name in series[0]}
+
+
+def run_monte_carlo(
+    base_groups: list[WellGroup],
+    wells: list[Well],
+    distributions: list[MonteCarloDistribution],
+    draws: int,
+    seed: int | None = None,
+    chunk_size: int = 1000,
+    workers: int | None = None,
+) -> MonteCarloResponse:
+    if seed is None:
+        seed = int(np.random.SeedSequence().generate_state(1)[0])
+    samples = sample_inputs(distributions, draws, seed)
+    pilot_draws = min(draws, _FAN_PILOT_DRAWS)
+    pilot_chunks = _chunks(samples, 0, pilot_draws, chunk_size)
+    chunks = _chunks(samples, pilot_draws, draws, chunk_size)
+
+    workers = monte_carlo_workers() if workers is None else workers
+    if workers > 1 and len(pilot_chunks) + len(chunks) > 1:
+        pool = shared_pool("monte_carlo", workers)
+        pilot = map_plan_jobs(pool, _evaluate_chunk, base_groups, wells, pilot_chunks)
+        bins = _pilot_bins(pilot)
+        summaries = map_plan_jobs(pool, _summarize_chunk, base_groups, wells, chunks, repeat(bins))
+    else:
+        plan = MonteCarloPlan.build(base_groups, wells)
+        pilot = [plan.evaluate(chunk_samples, n) for chunk_samples, n in pilot_chunks]
+        bins = _pilot_bins(pilot)
+        summaries = [_ChunkSummary.reduce(plan.evaluate(chunk_samples, n), bins) for chunk_samples, n in chunks]
+    summaries = [_ChunkSummary.reduce(result, bins) for result in pilot] + summaries
+
+    npv10 = np.concatenate([r.npv10 for r in summaries])
+    eur = np.concatenate([r.eur for r in summaries])
+    irr = np.concatenate([r.irr for r in summaries])
+    defined_irr = irr[np.isfinite(irr)]
+    fan = {}
+    for name, name_bins in bins.items():
+        sketch = summaries[0].fans[name]
+        for summary in summaries[1:]:
+            sketch = sketch.merge(summary.fans[name])
+        fan[name] = _fan(name_bins, sketch)
+    return MonteCarloResponse(
+        draws=draws,
+        seed=seed,
+        npv10=_summary(npv10),
+        eur=_summary(eur),
+        irr=_summary(defined_irr) if defined_irr.size else None,
+        irrDefinedDraws=int(defined_irr.size),
+        fan=fan,
+    )
+
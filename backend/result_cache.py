@@ -0,0 +1,172 @@
+"""
+Content-addressed response cache for the economics routes.
+
+The economics engine is deterministic, so a response is fully determined by
+the validated request body, the route and the negotiated encoding. The cache
+key is a SHA-256 over exactly those, and it doubles as the strong ETag:
+
+  * a request whose ``If-None-Match`` already names the key gets a 304 without
+    touching the engine or the cache;
+  * otherwise a cached body is returned as-is, or the engine runs once and the
+    serialized body is stored.
+
+Entries are serialized bytes, bounded by total size (LRU eviction) and by a
+TTL. Limits come from ECONOMICS_CACHE_MAX_BYTES / ECONOMICS_CACHE_TTL_SECONDS.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable
+
+from fastapi import Request, Response
+from pydantic import BaseModel
+
+from .config import env_float, env_int
+
+_DEFAULT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+_DEFAULT_CACHE_TTL_SECONDS = 300.0
+
+# Bump when engine output changes for the same input so stale ETags stop matching.
+CACHE_KEY_VERSION = "1"
+
+
+@dataclass(frozen=True)
+class CachedBody:
+    content: bytes
+    media_type: str
+
+
+def result_etag(route: str, payload: BaseModel, variant: str = "json") -> str:
+    """Strong ETag for `route` + canonical request JSON + response variant."""
+    canonical = json.dumps(payload.model_dump(mode="json"), sort_keys=True, separators=(",", ":"))
+    digest = hashlib.sha256(f"{CACHE_KEY_VERSION}|{route}|{variant}|{canonical}".encode("utf-8")).hexdigest()
+    return f'"{digest}"'
+
+
+def if_none_match(header: str | None, etag: str) -> bool:
+    """True when an If-None-Match header value matches `etag` (weak comparison)."""
+    if not header:
+        return False
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+class _ResultCache:
+    """Thread-safe LRU of serialized responses, bounded by total bytes, with TTL."""
+
+    def __init__(
+        self,
+        *,
+        max_bytes: int = _DEFAULT_CACHE_MAX_BYTES,
+        ttl_seconds: float = _DEFAULT_CACHE_TTL_SECONDS,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_bytes = max(1, max_bytes)
+        self.ttl_seconds = max(0.0, ttl_seconds)
+        self._timer = timer
+        self._lock = threading.Lock()
+        self._items: OrderedDict[str, tuple[float, CachedBody]] = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+            self._bytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def _drop(self, key: str) -> None:
+        _, body = self._items.pop(key)
+        self._bytes -= len(body.content)
+
+    def get(self, key: str) -> CachedBody | None:
+        with self._lock:
+            entry = self._items.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            created_at, body = entry
+            if self.ttl_seconds > 0 and self._timer() - created_at > self.ttl_seconds:
+                self._drop(key)
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self.hits += 1
+            return body
+
+    def set(self, key: str, body: CachedBody) -> None:
+        size = len(body.content)
+        with self._lock:
+            if key in self._items:
+                self._drop(key)
+            if size > self.max_bytes:
+                return
+            self._items[key] = (self._timer(), body)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                oldest = next(iter(self._items))
+                self._drop(oldest)
+                self.evictions += 1
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._items),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+_result_cache = _ResultCache(
+    max_bytes=env_int("ECONOMICS_CACHE_MAX_BYTES", _DEFAULT_CACHE_MAX_BYTES),
+    ttl_seconds=env_float("ECONOMICS_CACHE_TTL_SECONDS", _DEFAULT_CACHE_TTL_SECONDS),
+)
+
+
+def result_cache_stats() -> dict[str, int]:
+    return _result_cache.stats()
+
+
+def cached_response(
+    request: Request,
+    route: str,
+    payload: BaseModel,
+    compute: Callable[[], tuple[bytes, str]],
+    *,
+    variant: str = "json",
+) -> Response:
+    """Serve `route` for `payload` from the cache, or run `compute` and store it.
+
+    `compute` returns (body, media type) and only runs on a cache miss.
+    `variant` distinguishes encodings of the same request (e.g. Accept).
+    """
+    etag = result_etag(route, payload, variant)
+    headers = {"ETag": etag, "Vary": "Accept"}
+    if if_none_match(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+
+    body = _result_cache.get(etag)
+    if body is None:
+        content, media_type = compute()
+        body = CachedBody(content=content, media_type=media_type)
+        _result_cache.set(etag, body)
+    return Response(content=body.content, media_type=body.media_type, headers=headers)
@@ -1,109 +1,506 @@
+"""
+Sensitivity grids over SensitivityVariable axes (port of the TS helpers).
+
+A grid re-runs the same groups many times with one or two inputs changed, so
+`SensitivityPlan` resolves everything that does not depend on the cell once:
+each group's well list, resolved opex/ownership and base schedule. Schedules
+(which depend only on RIG_COUNT) and placed volumes (RIG_COUNT, EUR_SCALAR,
+CAPEX_SCALAR) are memoized per distinct value, so a cell that only changes
+OIL_PRICE just re-prices placed volumes and re-discounts.
+
+When both axes are OIL_PRICE / CAPEX_SCALAR, pre-tax NPV10 is affine in each
+as long as the ownership factors stay fixed:
+
+    NPV(p, c) = constant + oil_coef * p - capex_coef * c
+
+JV payout reversion changes those factors, so the payout months of every
+cell are solved in one batch first. Cells sharing a payout pattern share one
+affine basis, and the grid is filled from a handful of bases per group rather
+than a full engine run per cell. The result is exact (up to rounding) even
+when payout flips inside the grid. The grid NPV is pre-tax (as in TS), so
+tax non-linearity never enters here.
+
+Grids on the other axes can be spread over a process pool
+(SENSITIVITY_WORKERS, or `workers=`). Cells are split into contiguous chunks
+so each worker's memoized schedules and volumes stay hot. The pool is the
+long-lived one from `worker_pool.shared_pool`; chunks go out through
+`map_plan_jobs`, so a worker gets the groups and wells only when it has no
+plan for them yet.
+"""
+
 from __future__ import annotations
 
-from .economics import calculate_economics
+from collections import OrderedDict
+from collections.abc import Iterator
+from dataclasses import dataclass, field, replace
+from typing import TypeVar
+
+import numpy as np
+
+from .config import env_int
+from .economics import (
+    _compute_agreement_payout_months,
+    _compute_ownership_factors,
+    _legacy_opex,
+    _legacy_ownership,
+    evaluate_production_curve,
+    place_group_volumes,
+    tax_columns,
+)
+from .economics_engine import (
+    MONTHLY_DISCOUNT_RATE,
+    MONTHS_TO_PROJECT,
+    FlowColumns,
+    GrossStreams,
+    net_flow_columns,
+    npv,
+    price_gross_streams,
+)
 from .models import (
+    OpexAssumptions,
+    OwnershipAssumptions,
     PricingAssumptions,
     Scalars,
     ScheduleParams,
     SensitivityMatrixResult,
     SensitivityVariable,
+    TornadoBar,
+    TornadoInput,
+    TornadoResponse,
+    TornadoVariable,
     Well,
     WellGroup,
 )
+from .scheduling import WellSchedule, schedule_wells
+from .worker_pool import PlanJob, WorkerPlans, map_plan_jobs, shared_pool
+
+_DEFAULT_SENSITIVITY_WORKERS = 1
+# Chunks per worker: enough to balance uneven cells, few enough to keep each
+# chunk's schedule/volume memo useful.
+_CHUNKS_PER_WORKER = 2
+# Schedules / placed volumes kept per group. Plans live on in pool workers, so
+# the memos are LRU-bounded; grids visit cells grouped by volume key.
+_MEMO_MAX_ENTRIES = 16
+
+
+# Per-cell input changes, keyed by variable (a superset of matrix axes).
+Overrides = dict[TornadoVariable, float]
+
+
+@dataclass(frozen=True)
+class _StepValues:
+    """The inputs a cell's overrides can change, as plain values."""
+
+    oil_price: float
+    gas_price: float
+    capex_scalar: float
+    production_scalar: float
+    annual_rigs: tuple[float, ...]
+
+    @classmethod
+    def of(cls, scalars: Scalars, pricing: PricingAssumptions, schedule: ScheduleParams) -> _StepValues:
+        return cls(
+            oil_price=pricing.oilPrice,
+            gas_price=pricing.gasPrice,
+            capex_scalar=scalars.capex,
+            production_scalar=scalars.production,
+            annual_rigs=tuple(schedule.annualRigs),
+        )
+
+
+def _apply_step(values: _StepValues, variable: TornadoVariable, value: float) -> _StepValues:
+    # Mirrors TS helper `getParamsForStep`, plus GAS_PRICE for tornado bars.
+    # OPEX_SCALAR and NRI act on opex/ownership and are applied in `net_columns`.
+    if variable == "OIL_PRICE":
+        return replace(values, oil_price=value)
+    if variable == "GAS_PRICE":
+        return replace(values, gas_price=value)
+    if variable == "CAPEX_SCALAR":
+        return replace(values, capex_scalar=value)
+    if variable == "EUR_SCALAR":
+        return replace(values, production_scalar=value)
+    if variable == "RIG_COUNT":
+        # For Matrix, apply flat rig count override to the whole schedule array
+        return replace(values, annual_rigs=tuple(value for _ in range(10)))
+    return values
+
+
+def _resolve_steps(base: _StepValues, overrides: Overrides) -> _StepValues:
+    for variable, value in overrides.items():
+        base = _apply_step(base, variable, value)
+    return base
 
 
 def _get_params_for_step(
     *,
-    variable: SensitivityVariable,
+    variable: TornadoVariable,
     value: float,
     current_scalars: Scalars,
     current_pricing: PricingAssumptions,
     current_schedule: ScheduleParams,
 ) -> tuple[Scalars, PricingAssumptions, ScheduleParams]:
-    # Mirrors TS helper `getParamsForStep`
-    new_scalars = current_scalars.model_copy(deep=True)
-    new_pricing = current_pricing.model_copy(deep=True)
-    new_schedule = current_schedule.model_copy(deep=True)
+    """`_apply_step` on request models (the TS helper's signature)."""
+    step = _apply_step(_StepValues.of(current_scalars, current_pricing, current_schedule), variable, value)
+    return (
+        current_scalars.model_copy(update={"capex": step.capex_scalar, "production": step.production_scalar}),
+        current_pricing.model_copy(update={"oilPrice": step.oil_price, "gasPrice": step.gas_price}),
+        current_schedule.model_copy(update={"annualRigs": list(step.annual_rigs)}),
+    )
 
-    if variable == "OIL_PRICE":
-        new_pricing.oilPrice = value
-    if variable == "CAPEX_SCALAR":
-        new_scalars.capex = value
-    if variable == "EUR_SCALAR":
-        new_scalars.production = value
-    if variable == "RIG_COUNT":
-        # For Matrix, apply flat rig count override to the whole schedule array
-        new_schedule.annualRigs = [value for _ in range(10)]
 
-    return new_scalars, new_pricing, new_schedule
+# Axes on which pre-tax NPV10 is affine once ownership factors are fixed.
+_LINEAR_VARIABLES: frozenset[SensitivityVariable] = frozenset({"OIL_PRICE", "CAPEX_SCALAR"})
+# Group-independent start for resolving linear cells (oil price filled per group).
+_LINEAR_BASE = _StepValues(
+    oil_price=np.nan,
+    gas_price=np.nan,
+    capex_scalar=Scalars().capex,
+    production_scalar=Scalars().production,
+    annual_rigs=(),
+)
 
 
-def generate_sensitivity_matrix(
+@dataclass(frozen=True)
+class _LinearNpv:
+    """NPV10 = constant + oil_coef * oil_price - capex_coef * capex_scalar."""
+
+    constant: float
+    oil_coef: float
+    capex_coef: float
+
+    def evaluate(self, oil_prices: np.ndarray, capex_scalars: np.ndarray) -> np.ndarray:
+        return self.constant + self.oil_coef * oil_prices - self.capex_coef * capex_scalars
+
+
+def _base_schedule(group: WellGroup) -> ScheduleParams:
+    # Construct default schedule from group legacy/default
+    return ScheduleParams(
+        annualRigs=[(group.capex.rigCount or 1) for _ in range(10)],
+        drillDurationDays=group.capex.drillDurationDays,
+        stimDurationDays=group.capex.stimDurationDays,
+        rigStartDate=group.capex.rigStartDate,
+    )
+
+
+def _step_overrides(
+    x_var: SensitivityVariable,
+    x_val: float,
+    y_var: SensitivityVariable,
+    y_val: float,
+) -> Overrides:
+    # Y then X (same order as TS), so X wins when both axes name one variable.
+    return {y_var: y_val, x_var: x_val}
+
+
+# (annual rigs, production scalar, capex scalar): what placed volumes depend on.
+_VolumeKey = tuple[tuple[float, ...], float, float]
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+def _volume_key(step: _StepValues) -> _VolumeKey:
+    return (step.annual_rigs, step.production_scalar, step.capex_scalar)
+
+
+def _memo_get(memo: OrderedDict[K, V], key: K) -> V | None:
+    value = memo.get(key)
+    if value is not None:
+        memo.move_to_end(key)
+    return value
+
+
+def _memo_put(memo: OrderedDict[K, V], key: K, value: V) -> None:
+    memo[key] = value
+    while len(memo) > _MEMO_MAX_ENTRIES:
+        memo.popitem(last=False)
+
+
+@dataclass
+class _GroupPlan:
+    group: WellGroup
+    wells: list[Well]
+    opex: OpexAssumptions
+    ownership: OwnershipAssumptions
+    base_schedule: ScheduleParams
+    base_step: _StepValues
+    _schedules: OrderedDict[tuple[float, ...], WellSchedule] = field(default_factory=OrderedDict)
+    _volumes: OrderedDict[_VolumeKey, GrossStreams] = field(default_factory=OrderedDict)
+
+    def _schedule(self, annual_rigs: tuple[float, ...]) -> WellSchedule:
+        schedule = _memo_get(self._schedules, annual_rigs)
+        if schedule is None:
+            override = self.base_schedule.model_copy(update={"annualRigs": list(annual_rigs)})
+            schedule = schedule_wells(self.wells, self.group.capex, override)
+            _memo_put(self._schedules, annual_rigs, schedule)
+        return schedule
+
+    def step(self, overrides: Overrides) -> _StepValues:
+        """This group's inputs for one cell."""
+        return _resolve_steps(self.base_step, overrides)
+
+    def volumes(self, step: _StepValues) -> GrossStreams:
+        key = _volume_key(step)
+        volumes = _memo_get(self._volumes, key)
+        if volumes is None:
+            oil_curve, gas_curve = evaluate_production_curve(
+                self.group.typeCurve, MONTHS_TO_PROJECT, step.production_scalar
+            )
+            volumes = place_group_volumes(
+                self._schedule(step.annual_rigs),
+                oil_curve,
+                gas_curve,
+                self.group.capex,
+                self.opex,
+                step.capex_scalar,
+                MONTHS_TO_PROJECT,
+            )
+            _memo_put(self._volumes, key, volumes)
+        return volumes
+
+    def realized_prices(self, step: _StepValues) -> tuple[float, float]:
+        pricing = self.group.pricing
+        return (
+            step.oil_price - (pricing.oilDifferential or 0.0),
+            step.gas_price - (pricing.gasDifferential or 0.0),
+        )
+
+    def affine_npvs(self, oil_prices: np.ndarray, capex_scalars: np.ndarray) -> np.ndarray:
+        """NPV10 per cell from affine bases, one per distinct JV payout pattern."""
+        if not self.wells:
+            return np.zeros(oil_prices.size)
+        base = self.volumes(self.base_step)
+        oil_differential = self.group.pricing.oilDifferential or 0.0
+        _, realized_gas = self.realized_prices(self.base_step)
+        revenue = np.outer(oil_prices - oil_differential, base.oil) + base.gas * realized_gas
+        capex = np.outer(capex_scalars, base.capex)
+
+        if self.ownership.agreements:
+            # Payout months for every cell in one batch; cells sharing a
+            # pattern share ownership factors and hence one affine basis.
+            payouts = _compute_agreement_payout_months(self.ownership, revenue, base.opex, capex)
+            _, pattern = np.unique(payouts, axis=0, return_inverse=True)
+            pattern = pattern.reshape(-1)
+        else:
+            pattern = np.zeros(oil_prices.size, dtype=np.int64)
+
+        npvs = np.empty(oil_prices.size)
+        for k in range(int(pattern.max()) + 1 if pattern.size else 0):
+            cells = np.flatnonzero(pattern == k)
+            i = cells[0]
+            net_revenue_factor, net_cost_factor = _compute_ownership_factors(
+                self.ownership, revenue[i], base.opex, capex[i]
+            )
+            fixed_revenue = (base.gas * realized_gas - base.oil * oil_differential) * net_revenue_factor
+            model = _LinearNpv(
+                constant=npv(fixed_revenue - base.opex * net_cost_factor, MONTHLY_DISCOUNT_RATE),
+                oil_coef=npv(base.oil * net_revenue_factor, MONTHLY_DISCOUNT_RATE),
+                capex_coef=npv(base.capex * net_cost_factor, MONTHLY_DISCOUNT_RATE),
+            )
+            npvs[cells] = model.evaluate(oil_prices[cells], capex_scalars[cells])
+        return npvs
+
+    def npv10(self, overrides: Overrides, step: _StepValues | None = None) -> float:
+        if not self.wells:
+            return 0.0
+        return npv(self.net_columns(overrides, step)["netCashFlow"], MONTHLY_DISCOUNT_RATE)
+
+    def net_columns(self, overrides: Overrides, step: _StepValues | None = None) -> FlowColumns:
+        """Pre-tax net columns for one cell (the group must have wells).
+
+        `step` is `self.step(overrides)` when the caller has already resolved it.
+        """
+        step = self.step(overrides) if step is None else step
+        gross = price_gross_streams(self.volumes(step), *self.realized_prices(step))
+        if "OPEX_SCALAR" in overrides:
+            # Fixed and variable rates both scale, so scaling placed opex is exact.
+            gross = replace(gross, opex=gross.opex * overrides["OPEX_SCALAR"])
+        ownership = self.ownership
+        if "NRI" in overrides:
+            ownership = ownership.model_copy(update={"baseNri": overrides["NRI"]})
+        net_revenue_factor, net_cost_factor = _compute_ownership_factors(
+            ownership, gross.revenue, gross.opex, gross.capex
+        )
+        return net_flow_columns(gross, net_revenue_factor, net_cost_factor)
+
+
+@dataclass
+class SensitivityPlan:
+    """Cell-invariant work for one set of groups, built once per grid."""
+
+    groups: list[_GroupPlan]
+
+    @classmethod
+    def build(cls, base_groups: list[WellGroup], wells: list[Well]) -> SensitivityPlan:
+        plans: list[_GroupPlan] = []
+        for group in base_groups:
+            group_well_ids = set(group.wellIds)
+            base_schedule = _base_schedule(group)
+            plans.append(
+                _GroupPlan(
+                    group=group,
+                    wells=[w for w in wells if w.id in group_well_ids],
+                    opex=group.opex or _legacy_opex(group.pricing),
+                    ownership=group.ownership or _legacy_ownership(group.pricing),
+                    base_schedule=base_schedule,
+                    base_step=_StepValues.of(Scalars(), group.pricing, base_schedule),
+                )
+            )
+        return cls(groups=plans)
+
+    def portfolio_npvs(self, cells: list[Overrides]) -> np.ndarray:
+        """Portfolio NPV10 per cell, filled algebraically when both axes are linear."""
+        totals = np.zeros(len(cells))
+        if all(set(cell) <= _LINEAR_VARIABLES for cell in cells):
+            # Resolved once per grid; NaN marks cells that keep each group's own oil price.
+            steps = [_resolve_steps(_LINEAR_BASE, cell) for cell in cells]
+            oil_overrides = np.array([step.oil_price for step in steps], dtype=float)
+            capex_scalars = np.array([step.capex_scalar for step in steps], dtype=float)
+            for plan in self.groups:
+                oil_prices = np.where(np.isnan(oil_overrides), plan.base_step.oil_price, oil_overrides)
+                totals += plan.affine_npvs(oil_prices, capex_scalars)
+            return totals
+
+        for plan in self.groups:
+            if not plan.wells:
+                continue
+            steps = [plan.step(cell) for cell in cells]
+            # Cells sharing placed volumes run back to back, so the bounded memo
+            # places each distinct volume key once per call.
+            for i in sorted(range(len(cells)), key=lambda i: _volume_key(steps[i])):
+                totals[i] += plan.npv10(cells[i], steps[i])
+        return totals
+
+    def portfolio_cash_flows(self, overrides: Overrides) -> tuple[np.ndarray, np.ndarray]:
+        """(pre-tax, after-tax) portfolio net cash flow for one cell.
+
+        Groups without TaxAssumptions add their pre-tax flow to the after-tax
+        total, as in `aggregate_economics`.
+        """
+        pre_tax = np.zeros(MONTHS_TO_PROJECT)
+        after_tax = np.zeros(MONTHS_TO_PROJECT)
+        for plan in self.groups:
+            if not plan.wells:
+                continue
+            columns = plan.net_columns(overrides)
+            pre_tax += columns["netCashFlow"]
+            tax = plan.group.taxAssumptions
+            if tax is None:
+                after_tax += columns["netCashFlow"]
+            else:
+                after_tax += tax_columns(columns, MONTHS_TO_PROJECT, tax)["afterTaxCashFlow"]
+        return pre_tax, after_tax
+
+
+# Plans built in this process when it runs as a pool worker.
+_worker_plans: WorkerPlans[SensitivityPlan] = WorkerPlans(SensitivityPlan.build)
+
+
+def _evaluate_chunk(job: PlanJob, cells: list[Overrides]) -> np.ndarray | None:
+    plan = _worker_plans.get(job)
+    return None if plan is None else plan.portfolio_npvs(cells)
+
+
+def sensitivity_workers() -> int:
+    return env_int("SENSITIVITY_WORKERS", _DEFAULT_SENSITIVITY_WORKERS)
+
+
+def _parallel_npvs(
+    base_groups: list[WellGroup],
+    wells: list[Well],
+    cells: list[Overrides],
+    workers: int,
+) -> np.ndarray:
+    bounds = np.linspace(0, len(cells), min(len(cells), workers * _CHUNKS_PER_WORKER) + 1).astype(int)
+    chunks = [cells[lo:hi] for lo, hi in zip(bounds[:-1], bounds[1:])]
+    pool = shared_pool("sensitivity", workers)
+    return np.concatenate(map_plan_jobs(pool, _evaluate_chunk, base_groups, wells, chunks))
+
+
+def iter_sensitivity_rows(
     base_groups: list[WellGroup],
     wells: list[Well],
     x_var: SensitivityVariable,
     x_steps: list[float],
     y_var: SensitivityVariable,
     y_steps: list[float],
-) -> list[list[SensitivityMatrixResult]]:
-    """
-    Python port of `utils/economics.ts::generateSensitivityMatrix` (keep parity).
-    """
-    matrix: list[list[SensitivityMatrixResult]] = []
+) -> Iterator[list[SensitivityMatrixResult]]:
+    """Yield matrix rows (one per Y step) as each completes, sharing one plan.
 
-    # Rows (Y)
+    Same values as `generate_sensitivity_matrix`; stopping the iteration early
+    skips the remaining rows.
+    """
+    plan = SensitivityPlan.build(base_groups, wells)
     for y_val in y_steps:
-        row: list[SensitivityMatrixResult] = []
+        cells = [_step_overrides(x_var, x_val, y_var, y_val) for x_val in x_steps]
+        npvs = plan.portfolio_npvs(cells).tolist()
+        yield [
+            SensitivityMatrixResult(xValue=x_val, yValue=y_val, npv=npv_value)
+            for x_val, npv_value in zip(x_steps, npvs)
+        ]
 
-        # Cols (X)
-        for x_val in x_steps:
-            portfolio_npv = 0.0
 
-            for group in base_groups:
-                group_well_ids = set(group.wellIds)
-                group_wells = [w for w in wells if w.id in group_well_ids]
-
-                scalars = Scalars(capex=1.0, production=1.0)
-                pricing = group.pricing.model_copy(deep=True)
-
-                # Construct default schedule from group legacy/default
-                schedule = ScheduleParams(
-                    annualRigs=[(group.capex.rigCount or 1) for _ in range(10)],
-                    drillDurationDays=group.capex.drillDurationDays,
-                    stimDurationDays=group.capex.stimDurationDays,
-                    rigStartDate=group.capex.rigStartDate,
-                )
+def generate_sensitivity_matrix(
+    base_groups: list[WellGroup],
+    wells: list[Well],
+    x_var: SensitivityVariable,
+    x_steps: list[float],
+    y_var: SensitivityVariable,
+    y_steps: list[float],
+    workers: int | None = None,
+) -> list[list[SensitivityMatrixResult]]:
+    """
+    Python port of `utils/economics.ts::generateSensitivityMatrix` (keep parity).
 
-                # Apply Y then X modification (same order as TS)
-                scalars, pricing, schedule = _get_params_for_step(
-                    variable=y_var,
-                    value=y_val,
-                    current_scalars=scalars,
-                    current_pricing=pricing,
-                    current_schedule=schedule,
-                )
-                scalars, pricing, schedule = _get_params_for_step(
-                    variable=x_var,
-                    value=x_val,
-                    current_scalars=scalars,
-                    current_pricing=pricing,
-                    current_schedule=schedule,
-                )
+    Pre-tax NPV10 per cell with default scalars and a flat rig schedule built
+    from each group's capex, as in TS; only the two axis variables change.
+    `workers` > 1 evaluates cells in a process pool (default: SENSITIVITY_WORKERS);
+    linear OIL_PRICE / CAPEX_SCALAR grids always run in-process.
+    """
+    workers = sensitivity_workers() if workers is None else workers
+    cells = [_step_overrides(x_var, x_val, y_var, y_val) for y_val in y_steps for x_val in x_steps]
+    if workers > 1 and len(cells) > 1 and not {x_var, y_var} <= _LINEAR_VARIABLES:
+        npvs = _parallel_npvs(base_groups, wells, cells, workers).tolist()
+    else:
+        npvs = SensitivityPlan.build(base_groups, wells).portfolio_npvs(cells).tolist()
+    return [
+        [
+            SensitivityMatrixResult(xValue=x_val, yValue=y_val, npv=npvs[row * len(x_steps) + col])
+            for col, x_val in enumerate(x_steps)
+        ]
+        for row, y_val in enumerate(y_steps)
+    ]
 
-                result = calculate_economics(
-                    group_wells,
-                    group.typeCurve,
-                    group.capex,
-                    pricing,
-                    group.opex,
-                    group.ownership,
-                    scalars,
-                    schedule,
-                )
-                portfolio_npv += result.metrics.npv10
 
-            row.append(SensitivityMatrixResult(xValue=x_val, yValue=y_val, npv=portfolio_npv))
+def generate_tornado(
+    base_groups: list[WellGroup],
+    wells: list[Well],
+    variables: list[TornadoInput],
+) -> TornadoResponse:
+    """One-at-a-time low/high perturbations around the matrix base case.
 
-        matrix.append(row)
+    The base case matches `generate_sensitivity_matrix` (default scalars, flat
+    rig schedule). All perturbations are evaluated in one `portfolio_npvs` pass
+    over a shared plan, so every bar reuses the base schedule and production
+    curves unless its own variable changes them.
+    """
+    plan = SensitivityPlan.build(base_groups, wells)
+    cells: list[Overrides] = [{}]
+    for item in variables:
+        cells.append({item.variable: item.low})
+        cells.append({item.variable: item.high})
+    npvs = plan.portfolio_npvs(cells).tolist()
 
-    return matrix
+    bars = [
+        TornadoBar(
+            variable=item.variable,
+            lowValue=item.low,
+            highValue=item.high,
+            lowNpv=npvs[1 + 2 * i],
+            highNpv=npvs[2 + 2 * i],
+            swing=abs(npvs[2 + 2 * i] - npvs[1 + 2 * i]),
+        )
+        for i, item in enumerate(variables)
+    ]
+    bars.sort(key=lambda bar: bar.swing, reverse=True)
+    return TornadoResponse(baseNpv=npvs[0], bars=bars)
@@ -0,0 +1,100 @@
+"""
+Streaming transport for /api/sensitivity/matrix/stream.
+
+Rows are computed one at a time in the threadpool and written as soon as they
+finish, so the matrix fills in progressively instead of arriving all at once.
+Two framings, picked from the Accept header:
+
+  application/x-ndjson (default)   one JSON object per line
+  text/event-stream                SSE, ``event: <type>`` + ``data: <json>``
+
+Frame types:
+
+  {"type": "row", "rowIndex": i, "cells": [SensitivityMatrixResult...],
+   "completed": cells_done, "total": total_cells}
+  {"type": "done", "completed": total_cells, "total": total_cells,
+   "rows": n_rows, "minNpv": ..., "maxNpv": ..., "elapsedMs": ...}
+
+The client connection is checked before each row; once it is gone the
+generator stops and no further rows are computed.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from collections.abc import AsyncIterator
+from typing import Any, Literal
+
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
+
+from .models import SensitivityMatrixRequest
+from .sensitivity import iter_sensitivity_rows
+
+StreamFraming = Literal["ndjson", "sse"]
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+SSE_MEDIA_TYPE = "text/event-stream"
+
+
+def negotiate_stream_framing(accept: str | None) -> StreamFraming:
+    return "sse" if SSE_MEDIA_TYPE in (accept or "").lower() else "ndjson"
+
+
+def encode_frame(frame: dict[str, Any], framing: StreamFraming) -> bytes:
+    payload = json.dumps(frame, separators=(",", ":"))
+    if framing == "sse":
+        return f"event: {frame['type']}\ndata: {payload}\n\n".encode("utf-8")
+    return (payload + "\n").encode("utf-8")
+
+
+async def sensitivity_frames(request: Request, req: SensitivityMatrixRequest) -> AsyncIterator[dict[str, Any]]:
+    started = time.perf_counter()
+    rows = iter_sensitivity_rows(req.baseGroups, req.wells, req.xVar, req.xSteps, req.yVar, req.ySteps)
+    total = len(req.xSteps) * len(req.ySteps)
+    completed = 0
+    min_npv: float | None = None
+    max_npv: float | None = None
+
+    for row_index in range(len(req.ySteps)):
+        if await request.is_disconnected():
+            return
+        cells = await run_in_threadpool(next, rows)
+        completed += len(cells)
+        for cell in cells:
+            min_npv = cell.npv if min_npv is None else min(min_npv, cell.npv)
+            max_npv = cell.npv if max_npv is None else max(max_npv, cell.npv)
+        yield {
+            "type": "row",
+            "rowIndex": row_index,
+            "cells": [cell.model_dump() for cell in cells],
+            "completed": completed,
+            "total": total,
+        }
+
+    yield {
+        "type": "done",
+        "completed": completed,
+        "total": total,
+        "rows": len(req.ySteps),
+        "minNpv": min_npv,
+        "maxNpv": max_npv,
+        "elapsedMs": (time.perf_counter() - started) * 1000.0,
+    }
+
+
+def sensitivity_stream_response(request: Request, req: SensitivityMatrixRequest) -> StreamingResponse:
+    framing = negotiate_stream_framing(request.headers.get("accept"))
+
+    async def body() -> AsyncIterator[bytes]:
+        async for frame in sensitivity_frames(request, req):
+            yield encode_frame(frame, framing)
+
+    headers = {"Cache-Control": "no-cache", "Vary": "Accept"}
+    if framing == "sse":
+        # Disable proxy buffering so events reach the browser immediately.
+        headers["X-Accel-Buffering"] = "no"
+        return StreamingResponse(body(), media_type=SSE_MEDIA_TYPE, headers=headers)
+    return StreamingResponse(body(), media_type=NDJSON_MEDIA_TYPE, headers=headers)
@@ -22,8 +22,7 @@ from collections.abc import Callable
 from decimal import Decimal
 from typing import Any, Literal
 
-from dotenv import load_dotenv
-
+from .config import env_float, env_int
 from .models import Well, WellStatus, WellTrajectory, WellTrajectoryPoint
 from .spatial_models import (
     DetailLevel,
@@ -35,12 +34,6 @@ from .spatial_models import (
     ViewportBounds,
 )
 
-_BACKEND_DIR = os.path.dirname(__file__)
-_PROJECT_ROOT = os.path.dirname(_BACKEND_DIR)
-load_dotenv(os.path.join(_PROJECT_ROOT, ".env"))
-load_dotenv(os.path.join(_PROJECT_ROOT, ".env.local"), override=True)
-load_dotenv(os.path.join(_PROJECT_ROOT, ".env.backend.local"), override=True)
-load_dotenv(os.path.join(_BACKEND_DIR, ".env"))
 
 logger = logging.getLogger(__name__)
 
@@ -293,20 +286,6 @@ _conn_mgr = ConnectionManager()
 # delegates to the manager.
 
 
-def _env_int(name: str, default: int) -> int:
-    try:
-        return max(1, int(os.getenv(name, str(default))))
-    except ValueError:
-        return default
-
-
-def _env_float(name: str, default: float) -> float:
-    try:
-        return max(0.0, float(os.getenv(name, str(default))))
-    except ValueError:
-        return default
-
-
 class _SpatialResponseCache:
     """Small in-process LRU cache with TTL for viewport responses."""
 
@@ -358,8 +337,8 @@ class _SpatialResponseCache:
 
 
 _cache = _SpatialResponseCache(
-    max_entries=_env_int("SPATIAL_CACHE_MAX_ENTRIES", _DEFAULT_CACHE_MAX_ENTRIES),
-    ttl_seconds=_env_float("SPATIAL_CACHE_TTL_SECONDS", _DEFAULT_CACHE_TTL_SECONDS),
+    max_entries=env_int("SPATIAL_CACHE_MAX_ENTRIES", _DEFAULT_CACHE_MAX_ENTRIES),
+    ttl_seconds=env_float("SPATIAL_CACHE_TTL_SECONDS", _DEFAULT_CACHE_TTL_SECONDS),
 )
 
 # ---------------------------------------------------------------------------
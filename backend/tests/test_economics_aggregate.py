@@ -0,0 +1,119 @@
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from backend.economics import calculate_economics
+from backend.economics_aggregate import aggregate_economics, aggregate_groups, merge_aggregates
+from backend.models import CalculateEconomicsRequest, WellGroup
+
+
+FIXTURE_PATH = Path(__file__).resolve().parents[2] / "fixtures" / "economics" / "dual-parity-rich.json"
+
+
+def _computed_group(group_id: str, oil_price: float, *, tax: bool, debt: bool) -> WellGroup:
+    request = CalculateEconomicsRequest(**json.loads(FIXTURE_PATH.read_text())["input"])
+    pricing = request.pricing.model_copy(update={"oilPrice": oil_price})
+    result = calculate_economics(
+        request.wells,
+        request.typeCurve,
+        request.capex,
+        pricing,
+        request.opex,
+        request.ownership,
+        tax_assumptions=request.taxAssumptions if tax else None,
+        debt_assumptions=request.debtAssumptions if debt else None,
+        reserve_category="PUD",
+    )
+    return WellGroup(
+        id=group_id,
+        name=group_id,
+        color="#000000",
+        wellIds=[w.id for w in request.wells],
+        typeCurve=request.typeCurve,
+        capex=request.capex,
+        pricing=pricing,
+        flow=result.flow,
+        metrics=result.metrics,
+    )
+
+
+def _column(flow, name: str) -> np.ndarray:
+    return np.array([getattr(row, name) for row in flow], dtype=float)
+
+
+def test_single_group_aggregate_keeps_tax_and_debt_layers():
+    group = _computed_group("g1", 75.0, tax=True, debt=True)
+
+    portfolio = aggregate_economics([group])
+
+    for name in ("netCashFlow", "afterTaxCashFlow", "cumulativeAfterTaxCashFlow", "leveredCashFlow", "outstandingDebt"):
+        np.testing.assert_allclose(_column(portfolio.flow, name), _column(group.flow, name), rtol=1e-12, atol=1e-6)
+    for key in ("npv10", "afterTaxNpv10", "afterTaxPayoutMonths", "leveredNpv10", "dscr", "riskedNpv10"):
+        assert getattr(portfolio.metrics, key) == pytest.approx(getattr(group.metrics, key), rel=1e-9)
+    assert portfolio.metrics.irr == pytest.approx(group.metrics.irr, rel=1e-9)
+
+
+def test_groups_without_a_layer_contribute_their_unlayered_flow():
+    taxed = _computed_group("g1", 75.0, tax=True, debt=False)
+    plain = _computed_group("g2", 60.0, tax=False, debt=False)
+
+    portfolio = aggregate_economics([taxed, plain])
+
+    expected = _column(taxed.flow, "afterTaxCashFlow") + _column(plain.flow, "netCashFlow")
+    np.testing.assert_allclose(_column(portfolio.flow, "afterTaxCashFlow"), expected, rtol=1e-12, atol=1e-6)
+    assert portfolio.flow[0].leveredCashFlow is None
+    assert portfolio.metrics.leveredNpv10 is None
+
+
+def test_short_flow_without_a_layer_does_not_read_as_having_one():
+    taxed = _computed_group("g1", 75.0, tax=True, debt=False)
+    short = _computed_group("g2", 60.0, tax=False, debt=False)
+    short = short.model_copy(update={"flow": short.flow[:60]})
+
+    alone = aggregate_economics([short])
+    portfolio = aggregate_economics([taxed, short])
+
+    assert alone.flow[0].afterTaxCashFlow is None
+    assert alone.metrics.afterTaxNpv10 is None
+    padded = np.zeros(len(taxed.flow))
+    padded[:60] = _column(short.flow, "netCashFlow")
+    expected = _column(taxed.flow, "afterTaxCashFlow") + padded
+    np.testing.assert_allclose(_column(portfolio.flow, "afterTaxCashFlow"), expected, rtol=1e-12, atol=1e-6)
+
+
+def test_pre_tax_only_portfolio_matches_field_by_field_sum():
+    groups = [_computed_group(f"g{i}", 50.0 + 10 * i, tax=False, debt=False) for i in range(3)]
+
+    portfolio = aggregate_economics(groups)
+
+    for name in ("oilProduction", "revenue", "capex", "opex", "netCashFlow", "cumulativeCashFlow"):
+        expected = sum(_column(group.flow, name) for group in groups)
+        np.testing.assert_allclose(_column(portfolio.flow, name), expected, rtol=1e-12, atol=1e-6)
+    assert portfolio.flow[0].afterTaxCashFlow is None
+    assert portfolio.metrics.wellCount == sum(group.metrics.wellCount for group in groups)
+
+
+def test_merged_chunks_equal_one_shot_aggregate():
+    groups = [
+        _computed_group("g1", 75.0, tax=True, debt=True),
+        _computed_group("g2", 60.0, tax=False, debt=False),
+        _computed_group("g3", 90.0, tax=True, debt=False),
+    ]
+
+    merged = merge_aggregates([aggregate_groups(groups[:1]), aggregate_groups(groups[1:])]).to_columns()
+    one_shot = aggregate_groups(groups).to_columns()
+
+    assert merged.columns.keys() == one_shot.columns.keys()
+    for name, column in one_shot.columns.items():
+        np.testing.assert_allclose(merged.columns[name], column, rtol=1e-12, atol=1e-6)
+    assert merged.metrics.model_dump() == pytest.approx(one_shot.metrics.model_dump())
+
+
+def test_empty_portfolio_has_zero_flow():
+    portfolio = aggregate_economics([])
+
+    assert len(portfolio.flow) == 120
+    assert portfolio.metrics.wellCount == 0
+    assert portfolio.metrics.irr is None
@@ -0,0 +1,103 @@
+import json
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.economics import calculate_economics
+from backend.economics_aggregate import aggregate_economics
+from backend.economics_graph import group_graph, group_graph_key
+from backend.main import create_app
+from backend.models import CalculateEconomicsRequest, WellGroup
+
+
+FIXTURE_PATH = Path(__file__).resolve().parents[2] / "fixtures" / "economics" / "dual-parity-rich.json"
+
+
+def _group(group_id: str, well_ids: list[str], fixture_input: dict, oil_price: float) -> dict:
+    return {
+        "id": group_id,
+        "name": group_id,
+        "color": "#000000",
+        "wellIds": well_ids,
+        "typeCurve": fixture_input["typeCurve"],
+        "capex": fixture_input["capex"],
+        "pricing": {**fixture_input["pricing"], "oilPrice": oil_price},
+        "opex": fixture_input["opex"],
+        "ownership": fixture_input["ownership"],
+        "taxAssumptions": fixture_input["taxAssumptions"],
+        "reserveCategory": "PDP",
+    }
+
+
+def test_batch_endpoint_matches_per_group_calculate_and_aggregate():
+    fixture_input = json.loads(FIXTURE_PATH.read_text())["input"]
+    wells = fixture_input["wells"]
+    well_ids = [w["id"] for w in wells]
+    groups = [
+        _group("g1", well_ids, fixture_input, 76.0),
+        _group("g2", well_ids[:1] + ["missing-well"], fixture_input, 60.0),
+        _group("g3", [], fixture_input, 70.0),
+    ]
+
+    client = TestClient(create_app())
+    response = client.post("/api/economics/batch", json={"wells": wells, "groups": groups})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [g["groupId"] for g in body["groups"]] == ["g1", "g2", "g3"]
+
+    request = CalculateEconomicsRequest(**fixture_input)
+    expected_groups = []
+    for raw, result in zip(groups, body["groups"], strict=True):
+        group = WellGroup(**raw)
+        group_wells = [w for w in request.wells if w.id in set(group.wellIds)]
+        expected = calculate_economics(
+            group_wells,
+            group.typeCurve,
+            group.capex,
+            group.pricing,
+            group.opex,
+            group.ownership,
+            tax_assumptions=group.taxAssumptions,
+            reserve_category=group.reserveCategory,
+        )
+        assert result["metrics"]["npv10"] == pytest.approx(expected.metrics.npv10, rel=1e-12)
+        assert result["metrics"]["wellCount"] == len(group_wells)
+        expected_groups.append(group.model_copy(update={"flow": expected.flow, "metrics": expected.metrics}))
+
+    portfolio = aggregate_economics(expected_groups)
+    assert body["portfolio"]["metrics"]["npv10"] == pytest.approx(portfolio.metrics.npv10, rel=1e-12)
+    assert body["portfolio"]["metrics"]["wellCount"] == 3
+    assert len(body["portfolio"]["flow"]) == 120
+
+
+def test_same_group_id_from_different_callers_gets_separate_graphs():
+    fixture_input = json.loads(FIXTURE_PATH.read_text())["input"]
+    well_ids = [w["id"] for w in fixture_input["wells"]]
+    mine = WellGroup(**_group("g1", well_ids, fixture_input, 76.0))
+    theirs = WellGroup(**_group("g1", well_ids[:1], fixture_input, 50.0))
+
+    assert group_graph_key(mine, "a") != group_graph_key(mine, "b")
+    assert group_graph_key(mine, "a") == group_graph_key(theirs, "a")
+    assert group_graph_key(mine) != group_graph_key(theirs)
+    assert group_graph_key(mine) == group_graph_key(WellGroup(**_group("g1", well_ids, fixture_input, 76.0)))
+
+
+def test_session_batches_reuse_a_group_graph_across_edits():
+    fixture_input = json.loads(FIXTURE_PATH.read_text())["input"]
+    wells = fixture_input["wells"]
+    well_ids = [w["id"] for w in wells]
+    client = TestClient(create_app())
+
+    for oil_price in (70.0, 75.0):
+        group = _group("g1", well_ids, fixture_input, oil_price)
+        body = {"wells": wells, "groups": [group], "sessionId": "batch-session-test"}
+        assert client.post("/api/economics/batch", json=body).status_code == 200
+    # Another caller's "g1" neither shares nor evicts this session's graph.
+    other = _group("g1", well_ids[:1], fixture_input, 1.0)
+    client.post("/api/economics/batch", json={"wells": wells, "groups": [other]})
+
+    graph = group_graph(group_graph_key(WellGroup(**group), "batch-session-test"))
+    assert graph.recomputed["schedule"] == 1
+    assert graph.recomputed["gross"] == 2
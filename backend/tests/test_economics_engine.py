@@ -0,0 +1,224 @@
+import json
+import logging
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from backend.economics import (
+    apply_debt_layer,
+    apply_post_processing_layers,
+    apply_tax_layer,
+    calculate_economics,
+    calculate_economics_columns,
+)
+from backend.economics_engine import (
+    DEFAULT_PV_RATES_PCT,
+    build_gross_streams,
+    compile_opex_table,
+    npv,
+    place_amounts,
+    place_curve,
+    pv_profile,
+)
+from backend.models import (
+    CalculateEconomicsRequest,
+    CapexAssumptions,
+    OpexAssumptions,
+    OpexSegment,
+    PricingAssumptions,
+    TypeCurveParams,
+    Well,
+)
+
+
+FIXTURE_PATH = Path(__file__).resolve().parents[2] / "fixtures" / "economics" / "dual-parity-rich.json"
+
+
+def _mk_wells(n: int) -> list[Well]:
+    return [
+        Well(
+            id=f"w{i}",
+            name=f"Well {i}",
+            lat=0.0,
+            lng=0.0,
+            lateralLength=8000.0 + 250.0 * i,
+            status="PERMIT",
+            operator="TestCo",
+        )
+        for i in range(n)
+    ]
+
+
+def test_place_curve_matches_per_well_shifted_add():
+    months = 24
+    curve = np.linspace(100.0, 10.0, months)
+    starts = np.array([0, 0, 3, 7, 23, 24, 40], dtype=np.int64)
+
+    expected = np.zeros(months)
+    for s in starts:
+        if 0 <= s < months:
+            expected[s:] += curve[: months - s]
+
+    assert np.allclose(place_curve(starts, curve, months), expected, rtol=0, atol=1e-9)
+
+
+def test_place_amounts_drops_out_of_horizon_items():
+    out = place_amounts(np.array([0, 2, 2, 130]), np.array([1.0, 2.0, 3.0, 99.0]), 12)
+    assert out.shape == (12,)
+    assert out[0] == 1.0
+    assert out[2] == 5.0
+    assert out.sum() == 6.0
+
+
+def test_gross_streams_put_capex_before_first_production():
+    curve = np.full(6, 10.0)
+    gross = build_gross_streams(
+        start_months=np.array([0.0, 2.5]),
+        capex_per_well=np.array([100.0, 200.0]),
+        oil_curve=curve,
+        gas_curve=curve * 2.0,
+        opex_curve=np.full(6, 1.0),
+        realized_oil=50.0,
+        realized_gas=2.0,
+        months=6,
+    )
+    assert gross.capex.tolist() == [100.0, 0.0, 200.0, 0.0, 0.0, 0.0]
+    assert gross.oil.tolist() == [0.0, 10.0, 10.0, 20.0, 20.0, 20.0]
+    assert gross.revenue[3] == 2 * (10.0 * 50.0 + 20.0 * 2.0)
+
+
+def test_large_program_eur_scales_with_well_count():
+    tc = TypeCurveParams(qi=800.0, b=1.1, di=65.0, terminalDecline=6.0, gorMcfPerBbl=1.5)
+    capex = CapexAssumptions(
+        rigCount=0.0,
+        drillDurationDays=0.0,
+        stimDurationDays=0.0,
+        rigStartDate="2026-01-01",
+        items=[],
+    )
+    pricing = PricingAssumptions(oilPrice=70.0, gasPrice=3.0, oilDifferential=0.0, gasDifferential=0.0)
+
+    one = calculate_economics(_mk_wells(1), tc, capex, pricing)
+    many = calculate_economics(_mk_wells(2500), tc, capex, pricing)
+
+    assert many.metrics.wellCount == 2500
+    assert np.isclose(many.metrics.eur, 2500 * one.metrics.eur, rtol=1e-12)
+    assert len(many.flow) == 120
+
+
+def _opex(*segments: tuple[str, int, int, float]) -> OpexAssumptions:
+    return OpexAssumptions(
+        segments=[
+            OpexSegment(
+                id=seg_id,
+                label=seg_id,
+                startMonth=start,
+                endMonth=end,
+                fixedPerWellPerMonth=fixed,
+                variableOilPerBbl=fixed / 1000.0,
+            )
+            for seg_id, start, end, fixed in segments
+        ]
+    )
+
+
+def test_opex_table_earliest_start_wins_on_overlap_and_records_it(caplog):
+    with caplog.at_level(logging.WARNING, logger="backend.economics_engine"):
+        table = compile_opex_table(_opex(("late", 6, 12, 200.0), ("early", 1, 8, 100.0)), months=12)
+
+    assert table.fixed.tolist() == [100.0] * 8 + [200.0] * 4
+    assert table.var_oil[7] == 0.1
+    assert table.overlaps == (("early", "late"),)
+    assert table.gaps == ()
+    assert [record.getMessage() for record in caplog.records] == [
+        "Opex segments overlap (earliest start wins): [('early', 'late')]"
+    ]
+
+
+def test_opex_table_reports_gaps_and_costs_nothing_there(caplog):
+    with caplog.at_level(logging.WARNING, logger="backend.economics_engine"):
+        table = compile_opex_table(_opex(("a", 1, 3, 10.0), ("b", 6, 8, 20.0)), months=10)
+
+    assert table.gaps == ((4, 5), (9, 10))
+    assert table.overlaps == ()
+    assert [record.getMessage() for record in caplog.records] == [
+        "Opex segments leave well-age months without opex: [(4, 5), (9, 10)]"
+    ]
+    curve = table.opex_curve(np.full(10, 1000.0), np.zeros(10))
+    assert curve[3] == 0.0 and curve[9] == 0.0
+    assert curve[0] == 10.0 + 1000.0 * 0.01
+
+
+def test_post_processing_layers_extend_one_column_buffer_in_place():
+    fixture = json.loads(FIXTURE_PATH.read_text())
+    request = CalculateEconomicsRequest(**fixture["input"])
+    result = calculate_economics_columns(
+        request.wells, request.typeCurve, request.capex, request.pricing, request.opex, request.ownership
+    )
+    revenue = result.columns["revenue"]
+
+    layered = apply_post_processing_layers(result, request.taxAssumptions, request.debtAssumptions, "PUD")
+
+    assert layered is result
+    assert result.columns["revenue"] is revenue
+    for name in ("afterTaxCashFlow", "incomeTax", "leveredCashFlow", "outstandingDebt"):
+        assert result.columns[name].shape == (120,)
+    assert result.metrics.afterTaxNpv10 is not None
+    assert result.metrics.riskedNpv10 == result.metrics.npv10 * 0.85
+
+
+def test_layer_wrappers_leave_their_inputs_untouched():
+    fixture = json.loads(FIXTURE_PATH.read_text())
+    request = CalculateEconomicsRequest(**fixture["input"])
+    base = calculate_economics(
+        request.wells, request.typeCurve, request.capex, request.pricing, request.opex, request.ownership
+    )
+    before = base.model_dump()
+
+    taxed = apply_tax_layer(base.flow, base.metrics, request.taxAssumptions)
+    levered = apply_debt_layer(taxed.flow, taxed.metrics, request.debtAssumptions)
+
+    assert base.model_dump() == before
+    assert taxed.flow[5].afterTaxCashFlow is not None and base.flow[5].afterTaxCashFlow is None
+    assert levered.flow[5].leveredCashFlow is not None and taxed.flow[5].leveredCashFlow is None
+
+
+def test_pv_profile_matches_per_rate_npv():
+    rng = np.random.default_rng(3)
+    flows = rng.normal(size=(3, 120)) * 1e5
+
+    profile = pv_profile(flows, DEFAULT_PV_RATES_PCT)
+
+    assert profile.shape == (3, len(DEFAULT_PV_RATES_PCT))
+    np.testing.assert_allclose(profile[:, 0], flows.sum(axis=1))
+    for j, rate in enumerate(DEFAULT_PV_RATES_PCT):
+        for i, row in enumerate(flows):
+            assert profile[i, j] == pytest.approx(npv(row, rate / 100.0 / 12.0), rel=1e-12)
+
+
+def test_pv_profile_covers_pre_tax_after_tax_and_levered_flows():
+    fixture = json.loads(FIXTURE_PATH.read_text())
+    request = CalculateEconomicsRequest(**fixture["input"])
+    result = calculate_economics(
+        request.wells,
+        request.typeCurve,
+        request.capex,
+        request.pricing,
+        request.opex,
+        request.ownership,
+        request.scalars,
+        request.scheduleOverride,
+        request.taxAssumptions,
+        request.debtAssumptions,
+        request.reserveCategory,
+        pv_rates=list(DEFAULT_PV_RATES_PCT),
+    )
+
+    profile = {point.ratePct: point for point in result.metrics.pvProfile}
+    assert list(profile) == list(DEFAULT_PV_RATES_PCT)
+    assert profile[10.0].pv == pytest.approx(result.metrics.npv10, rel=1e-12)
+    assert profile[10.0].afterTaxPv == pytest.approx(result.metrics.afterTaxNpv10, rel=1e-12)
+    assert profile[10.0].leveredPv == pytest.approx(result.metrics.leveredNpv10, rel=1e-12)
+    assert profile[0.0].pv == pytest.approx(sum(row.netCashFlow for row in result.flow), rel=1e-12)
+    assert profile[0.0].pv > profile[8.0].pv > profile[15.0].pv > profile[20.0].pv
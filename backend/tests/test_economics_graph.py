@@ -0,0 +1,93 @@
+import json
+from pathlib import Path
+
+import numpy as np
+
+from backend.economics import calculate_economics_columns
+from backend.economics_graph import GroupEconomicsGraph
+from backend.models import CalculateEconomicsRequest
+
+
+FIXTURE_PATH = Path(__file__).resolve().parents[2] / "fixtures" / "economics" / "dual-parity-rich.json"
+
+
+def _request(**overrides) -> CalculateEconomicsRequest:
+    fixture_input = json.loads(FIXTURE_PATH.read_text())["input"]
+    return CalculateEconomicsRequest(**{**fixture_input, **overrides})
+
+
+def _args(req: CalculateEconomicsRequest) -> tuple:
+    return (
+        req.wells,
+        req.typeCurve,
+        req.capex,
+        req.pricing,
+        req.opex,
+        req.ownership,
+        req.scalars,
+        req.scheduleOverride,
+        req.taxAssumptions,
+        req.debtAssumptions,
+        req.reserveCategory,
+    )
+
+
+def _assert_same(actual, expected) -> None:
+    assert actual.columns.keys() == expected.columns.keys()
+    for name, column in expected.columns.items():
+        np.testing.assert_allclose(actual.columns[name], column, rtol=1e-12, atol=1e-6)
+    assert actual.metrics.model_dump() == expected.metrics.model_dump()
+
+
+def test_graph_matches_full_calculation():
+    req = _request()
+    graph = GroupEconomicsGraph()
+
+    _assert_same(graph.evaluate(*_args(req)), calculate_economics_columns(*_args(req)))
+
+
+def test_price_change_reuses_schedule_production_and_volumes():
+    req = _request()
+    graph = GroupEconomicsGraph()
+    graph.evaluate(*_args(req))
+
+    repriced = _request(pricing={**req.pricing.model_dump(), "oilPrice": req.pricing.oilPrice + 5.0})
+    result = graph.evaluate(*_args(repriced))
+
+    assert graph.recomputed == {
+        "schedule": 1,
+        "production": 1,
+        "volumes": 1,
+        "gross": 2,
+        "net": 2,
+        "tax": 2,
+        "debt": 2,
+    }
+    _assert_same(result, calculate_economics_columns(*_args(repriced)))
+
+
+def test_tax_change_only_recomputes_tax_and_debt():
+    req = _request()
+    graph = GroupEconomicsGraph()
+    graph.evaluate(*_args(req))
+
+    taxed = _request(taxAssumptions={**req.taxAssumptions.model_dump(), "federalTaxRate": 35.0})
+    graph.evaluate(*_args(taxed))
+
+    assert graph.recomputed["net"] == 1
+    assert graph.recomputed["tax"] == 2
+    assert graph.recomputed["debt"] == 2
+
+
+def test_unchanged_inputs_recompute_nothing_and_results_stay_independent():
+    req = _request()
+    graph = GroupEconomicsGraph()
+    first = graph.evaluate(*_args(req))
+    first.metrics.npv10 = 0.0
+    first.columns["extra"] = np.zeros(first.months)
+
+    second = graph.evaluate(*_args(req))
+
+    assert all(count == 1 for count in graph.recomputed.values())
+    assert "extra" not in second.columns
+    assert second.metrics.npv10 != 0.0
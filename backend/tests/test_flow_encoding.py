@@ -0,0 +1,106 @@
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.flow_encoding import (
+    COLUMNAR_JSON_MEDIA_TYPE,
+    PACKED_F64_MEDIA_TYPE,
+    decode_packed_f64,
+    negotiate_flow_encoding,
+)
+from backend.main import create_app
+
+
+FIXTURE_PATH = Path(__file__).resolve().parents[2] / "fixtures" / "economics" / "dual-parity-rich.json"
+
+client = TestClient(create_app())
+
+
+def test_negotiation_defaults_to_json_and_honors_q_values():
+    assert negotiate_flow_encoding(None) == "json"
+    assert negotiate_flow_encoding("*/*") == "json"
+    assert negotiate_flow_encoding(COLUMNAR_JSON_MEDIA_TYPE) == "columnar-json"
+    assert negotiate_flow_encoding(f"application/json;q=0.5, {PACKED_F64_MEDIA_TYPE}") == "packed-f64"
+    assert negotiate_flow_encoding(f"{PACKED_F64_MEDIA_TYPE};q=0, application/json") == "json"
+
+
+def test_calculate_columnar_json_matches_row_response():
+    fixture = json.loads(FIXTURE_PATH.read_text())
+    rows = client.post("/api/economics/calculate", json=fixture["input"]).json()
+
+    response = client.post(
+        "/api/economics/calculate",
+        json=fixture["input"],
+        headers={"Accept": COLUMNAR_JSON_MEDIA_TYPE},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith(COLUMNAR_JSON_MEDIA_TYPE)
+    body = response.json()
+    assert body["months"] == 120
+    assert body["metrics"] == rows["metrics"]
+    for name in ("revenue", "afterTaxCashFlow", "leveredCashFlow", "outstandingDebt"):
+        assert body["columns"][name] == [row[name] for row in rows["flow"]]
+    assert len(response.content) < len(json.dumps(rows))
+
+
+def test_calculate_packed_f64_round_trips():
+    fixture = json.loads(FIXTURE_PATH.read_text())
+    rows = client.post("/api/economics/calculate", json=fixture["input"]).json()
+
+    response = client.post(
+        "/api/economics/calculate",
+        json=fixture["input"],
+        headers={"Accept": PACKED_F64_MEDIA_TYPE},
+    )
+
+    assert response.headers["content-type"] == PACKED_F64_MEDIA_TYPE
+    columns, metrics = decode_packed_f64(response.content)
+    assert metrics["npv10"] == pytest.approx(rows["metrics"]["npv10"], rel=0)
+    assert np.array_equal(columns["netCashFlow"], [row["netCashFlow"] for row in rows["flow"]])
+    assert "month" not in columns and "date" not in columns
+
+
+def test_aggregate_supports_columnar_json(monkeypatch):
+    flow = [
+        {
+            "month": m,
+            "date": f"Month {m}",
+            "oilProduction": 1.0,
+            "revenue": 10.0,
+            "capex": 0.0,
+            "opex": 2.0,
+            "netCashFlow": 8.0,
+            "cumulativeCashFlow": 8.0 * m,
+        }
+        for m in range(1, 121)
+    ]
+    group = {
+        "id": "g",
+        "name": "g",
+        "color": "#fff",
+        "wellIds": [],
+        "typeCurve": {"qi": 1, "b": 0, "di": 1, "terminalDecline": 1},
+        "capex": {"rigCount": 1, "drillDurationDays": 1, "stimDurationDays": 1, "rigStartDate": "2026-01-01", "items": []},
+        "pricing": {"oilPrice": 70, "gasPrice": 3, "oilDifferential": 0, "gasDifferential": 0},
+        "metrics": {"totalCapex": 0, "eur": 120, "npv10": 5, "irr": 0, "payoutMonths": 1, "wellCount": 1},
+        "flow": flow,
+    }
+
+    def no_rows(columns):
+        raise AssertionError("columnar responses must not build MonthlyCashFlow rows")
+
+    monkeypatch.setattr("backend.economics_engine.flow_models", no_rows)
+    response = client.post(
+        "/api/economics/aggregate",
+        json={"groups": [group, group]},
+        headers={"Accept": COLUMNAR_JSON_MEDIA_TYPE},
+    )
+
+    body = response.json()
+    assert body["columns"]["revenue"] == [20.0] * 120
+    assert body["columns"]["cumulativeCashFlow"][-1] == 16.0 * 120
+    assert body["metrics"]["wellCount"] == 2
@@ -0,0 +1,132 @@
+import json
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.economics import calculate_economics
+from backend.goal_seek import _solve, goal_seek, portfolio_metric
+from backend.main import create_app
+from backend.models import Scalars, Well, WellGroup
+from backend.sensitivity import SensitivityPlan, _base_schedule
+
+
+FIXTURE_PATH = Path(__file__).resolve().parents[2] / "fixtures" / "economics" / "dual-parity-rich.json"
+
+
+def _fixture():
+    fixture_input = json.loads(FIXTURE_PATH.read_text())["input"]
+    wells = [Well(**w) for w in fixture_input["wells"]]
+    group = WellGroup(
+        id="g1",
+        name="g1",
+        color="#000000",
+        wellIds=[w.id for w in wells],
+        typeCurve=fixture_input["typeCurve"],
+        capex=fixture_input["capex"],
+        pricing=fixture_input["pricing"],
+        opex=fixture_input["opex"],
+        ownership=fixture_input["ownership"],
+        taxAssumptions=fixture_input["taxAssumptions"],
+    )
+    return group, wells
+
+
+def _engine(group: WellGroup, wells: list[Well], **changes):
+    return calculate_economics(
+        wells,
+        group.typeCurve,
+        group.capex,
+        changes.get("pricing", group.pricing),
+        changes.get("opex", group.opex),
+        group.ownership,
+        changes.get("scalars", Scalars()),
+        _base_schedule(group),
+        tax_assumptions=group.taxAssumptions,
+    )
+
+
+def test_oil_price_breakeven_zeroes_engine_npv_in_few_evaluations():
+    group, wells = _fixture()
+
+    result = goal_seek(SensitivityPlan.build([group], wells), "OIL_PRICE")
+
+    assert result.converged
+    assert result.evaluations <= 10
+    pricing = group.pricing.model_copy(update={"oilPrice": result.value})
+    assert _engine(group, wells, pricing=pricing).metrics.npv10 == pytest.approx(0.0, abs=1.0)
+
+
+def test_capex_scalar_hits_after_tax_npv_target():
+    group, wells = _fixture()
+
+    result = goal_seek(
+        SensitivityPlan.build([group], wells), "CAPEX_SCALAR", "AFTER_TAX_NPV10", 5e6, upper_bound=50.0
+    )
+
+    assert result.converged
+    metrics = _engine(group, wells, scalars=Scalars(capex=result.value)).metrics
+    assert metrics.afterTaxNpv10 == pytest.approx(5e6, abs=1.0)
+
+
+def test_opex_scalar_hits_irr_target():
+    group, wells = _fixture()
+
+    result = goal_seek(SensitivityPlan.build([group], wells), "OPEX_SCALAR", "IRR", 0.2, upper_bound=50.0)
+
+    assert result.converged
+    opex = group.opex.model_copy(deep=True)
+    for segment in opex.segments:
+        segment.fixedPerWellPerMonth *= result.value
+        segment.variableOilPerBbl *= result.value
+        segment.variableGasPerMcf *= result.value
+    assert _engine(group, wells, opex=opex).metrics.irr == pytest.approx(0.2, abs=1e-7)
+
+
+def test_rig_count_is_bisected_on_whole_rigs():
+    group, wells = _fixture()
+    plan = SensitivityPlan.build([group], wells)
+    npv_1, npv_2 = (portfolio_metric(plan, "RIG_COUNT", rigs, "NPV10") for rigs in (1.0, 2.0))
+
+    result = goal_seek(plan, "RIG_COUNT", "NPV10", 0.75 * npv_1 + 0.25 * npv_2, upper_bound=6.0)
+
+    assert not result.converged
+    assert result.bracket == (1.0, 2.0)
+    assert result.value == 1.0
+
+
+def test_discrete_solve_reports_the_closer_whole_value_with_its_true_residual():
+    value, residual, converged, bracket, _ = _solve(
+        lambda x: (x - 1.9) * 10, 1, 20, tolerance=1e-9, discrete=True, max_evaluations=40
+    )
+
+    assert not converged
+    assert bracket == (1.0, 2.0)
+    assert value == 2.0 and isinstance(value, float)
+    assert residual == pytest.approx(1.0)
+
+
+def test_no_crossing_in_range_reports_no_value():
+    group, wells = _fixture()
+
+    result = goal_seek(SensitivityPlan.build([group], wells), "OIL_PRICE", lower_bound=60.0, upper_bound=90.0)
+
+    assert result.value is None
+    assert not result.converged
+    assert result.evaluations == 2
+
+
+def test_breakeven_endpoint_solves_each_variable():
+    group, wells = _fixture()
+    body = {
+        "baseGroups": [group.model_dump(mode="json")],
+        "wells": [w.model_dump(mode="json") for w in wells],
+        "variables": ["OIL_PRICE", "NRI"],
+    }
+
+    response = TestClient(create_app()).post("/api/sensitivity/breakeven", json=body)
+
+    assert response.status_code == 200
+    results = response.json()
+    assert [r["variable"] for r in results] == ["OIL_PRICE", "NRI"]
+    assert all(r["converged"] and abs(r["achieved"]) <= 1e-2 for r in results)
@@ -0,0 +1,52 @@
+import math
+
+import numpy as np
+
+from backend.economics_engine import npv
+from backend.irr import solve_irr, solve_irr_batch
+
+
+def _investment_flows(n: int, months: int = 120, seed: int = 7) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    flows = np.zeros((n, months))
+    flows[:, :2] = -rng.uniform(1e6, 4e6, size=(n, 2))
+    decline = np.exp(-np.arange(months - 2) / rng.uniform(15, 60, size=(n, 1)))
+    flows[:, 2:] = rng.uniform(5e4, 4e5, size=(n, 1)) * decline
+    return flows
+
+
+def test_batch_irr_zeroes_npv_at_the_solved_rate():
+    flows = _investment_flows(441)
+    result = solve_irr_batch(flows)
+
+    assert result.converged.all()
+    assert not result.no_sign_change.any()
+    for row, rate in zip(flows, result.irr):
+        assert abs(npv(row, rate / 12.0)) < 1e-9 * np.abs(row).sum()
+
+
+def test_irr_known_answer_matches_engine_discount_convention():
+    # -100 discounted one month, +110 discounted two months => 10%/month.
+    assert math.isclose(solve_irr(np.array([-100.0, 110.0])), 1.2, rel_tol=1e-12)
+
+
+def test_no_sign_change_is_reported_explicitly():
+    flows = np.array([
+        [1.0, 2.0, 3.0],
+        [0.0, 0.0, 0.0],
+        [-5.0, -1.0, 0.0],
+        [-10.0, 4.0, 8.0],
+    ])
+    result = solve_irr_batch(flows)
+
+    assert result.no_sign_change.tolist() == [True, True, True, False]
+    assert np.isnan(result.irr[:3]).all()
+    assert result.converged.tolist() == [False, False, False, True]
+    assert solve_irr(flows[0]) is None
+
+
+def test_negative_irr_is_found():
+    flows = np.array([-1000.0] + [5.0] * 119)
+    rate = solve_irr(flows)
+    assert rate is not None and rate < 0
+    assert abs(npv(flows, rate / 12.0)) < 1e-8
@@ -0,0 +1,204 @@
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.economics import (
+    _evaluate_multi_segment_production,
+    calculate_economics_columns,
+    evaluate_production_curves_batch,
+)
+from backend.main import create_app
+from backend.models import MonteCarloDistribution, Scalars, TypeCurveParams, Well, WellGroup
+from backend.monte_carlo import MonteCarloPlan, run_monte_carlo, sample_inputs
+
+
+FIXTURE_PATH = Path(__file__).resolve().parents[2] / "fixtures" / "economics" / "dual-parity-rich.json"
+
+
+def _fixture():
+    fixture_input = json.loads(FIXTURE_PATH.read_text())["input"]
+    wells = [Well(**w) for w in fixture_input["wells"]]
+    group = WellGroup(
+        id="g1",
+        name="g1",
+        color="#000000",
+        wellIds=[w.id for w in wells],
+        typeCurve=fixture_input["typeCurve"],
+        capex=fixture_input["capex"],
+        pricing=fixture_input["pricing"],
+        opex=fixture_input["opex"],
+        ownership=fixture_input["ownership"],
+    )
+    return group, wells
+
+
+def _assert_same_run(actual, expected):
+    for name in ("npv10", "eur", "irr"):
+        assert getattr(actual, name).model_dump() == pytest.approx(getattr(expected, name).model_dump(), rel=1e-12)
+    for name, points in expected.fan.items():
+        assert [p.model_dump() for p in actual.fan[name]] == [
+            pytest.approx(p.model_dump(), rel=1e-12, abs=1e-6) for p in points
+        ]
+
+
+def _fixed(variable: str, value: float) -> MonteCarloDistribution:
+    return MonteCarloDistribution(variable=variable, kind="uniform", low=value, high=value)
+
+
+def _scaled_type_curve(tc: TypeCurveParams, qi: float, b: float, di: float) -> TypeCurveParams:
+    scaled = tc.model_copy(deep=True)
+    scaled.qi *= qi
+    scaled.b *= b
+    scaled.di *= di
+    for segment in scaled.segments:
+        if segment.qi is not None:
+            segment.qi *= qi
+        if segment.b is not None:
+            segment.b *= b
+        if segment.initialDecline is not None:
+            segment.initialDecline *= di
+    return scaled
+
+
+_CHAINED_CURVE = TypeCurveParams(
+    qi=800,
+    b=1.1,
+    di=70,
+    terminalDecline=6,
+    gorMcfPerBbl=2,
+    segments=[
+        {"id": "a", "name": "a", "qi": 800, "b": 1.2, "initialDecline": 70, "cutoffKind": "rate", "cutoffValue": 300},
+        {"id": "b", "name": "b", "b": 0.5, "initialDecline": 30, "cutoffKind": "cum", "cutoffValue": 40000},
+        {"id": "c", "name": "c", "b": 0, "initialDecline": 10, "cutoffKind": "time_days", "cutoffValue": 900},
+        {"id": "d", "name": "d", "b": 0, "initialDecline": 6},
+    ],
+)
+
+
+@pytest.mark.parametrize(
+    "tc",
+    [
+        _fixture()[0].typeCurve,
+        _CHAINED_CURVE,
+        _CHAINED_CURVE.model_copy(update={"terminalDecline": 25.0, "modifiedHyperbolic": True}),
+        TypeCurveParams(qi=600, b=0.9, di=55, terminalDecline=6),
+    ],
+)
+def test_batched_curves_match_stepping_loop(tc):
+    rng = np.random.default_rng(3)
+    qi, b, di = rng.uniform(0.5, 1.5, 20), rng.uniform(0.5, 1.5, 20), rng.uniform(0.5, 1.3, 20)
+
+    curves = evaluate_production_curves_batch(tc, 120, 1.3, qi_scale=qi, b_scale=b, di_scale=di)
+
+    for i in range(qi.size):
+        expected, _ = _evaluate_multi_segment_production(_scaled_type_curve(tc, qi[i], b[i], di[i]), 120, 1.3)
+        np.testing.assert_allclose(curves[i], expected, rtol=1e-12, atol=1e-9)
+
+
+def test_fixed_draw_matches_full_engine():
+    group, wells = _fixture()
+    draws = [
+        _fixed("QI_SCALAR", 1.2),
+        _fixed("B_SCALAR", 0.9),
+        _fixed("DI_SCALAR", 1.1),
+        _fixed("CAPEX_SCALAR", 1.1),
+        _fixed("OIL_PRICE", 70.0),
+        _fixed("GAS_PRICE", 3.0),
+    ]
+
+    result = MonteCarloPlan.build([group], wells).evaluate(sample_inputs(draws, 1, seed=0), 1)
+
+    expected = calculate_economics_columns(
+        wells,
+        _scaled_type_curve(group.typeCurve, 1.2, 0.9, 1.1),
+        group.capex,
+        group.pricing.model_copy(update={"oilPrice": 70.0, "gasPrice": 3.0}),
+        group.opex,
+        group.ownership,
+        Scalars(capex=1.1),
+    )
+    np.testing.assert_allclose(result.net_cash_flow[0], expected.columns["netCashFlow"], rtol=1e-9, atol=1e-6)
+    assert result.npv10[0] == pytest.approx(expected.metrics.npv10, rel=1e-9)
+    assert result.eur[0] == pytest.approx(expected.metrics.eur, rel=1e-9)
+    assert result.irr[0] == pytest.approx(expected.metrics.irr, rel=1e-9)
+
+
+def test_delay_shifts_the_whole_program():
+    group, wells = _fixture()
+    group = group.model_copy(update={"ownership": group.ownership.model_copy(update={"agreements": []})})
+    plan = MonteCarloPlan.build([group], wells)
+
+    base = plan.evaluate(sample_inputs([], 1, seed=0), 1)
+    delayed = plan.evaluate(sample_inputs([_fixed("DELAY_MONTHS", 3.0)], 1, seed=0), 1)
+
+    np.testing.assert_array_equal(delayed.net_cash_flow[0, :3], 0.0)
+    np.testing.assert_allclose(delayed.net_cash_flow[0, 3:], base.net_cash_flow[0, :-3])
+
+
+def test_seeded_run_is_independent_of_chunking():
+    group, wells = _fixture()
+    distributions = [
+        MonteCarloDistribution(variable="QI_SCALAR", kind="lognormal", mean=1.0, stdDev=0.2),
+        MonteCarloDistribution(variable="OIL_PRICE", kind="normal", mean=75.0, stdDev=12.0, low=20.0),
+        MonteCarloDistribution(variable="CAPEX_SCALAR", kind="triangular", low=0.9, mode=1.0, high=1.3),
+        MonteCarloDistribution(variable="DELAY_MONTHS", kind="uniform", low=0.0, high=4.0),
+    ]
+
+    one_chunk = run_monte_carlo([group], wells, distributions, 200, seed=11, chunk_size=200)
+    many_chunks = run_monte_carlo([group], wells, distributions, 200, seed=11, chunk_size=30)
+
+    _assert_same_run(many_chunks, one_chunk)
+    assert one_chunk.npv10.p90 <= one_chunk.npv10.p50 <= one_chunk.npv10.p10
+    assert len(one_chunk.fan["cumulativeCashFlow"]) == 120
+
+
+def test_fan_percentiles_from_merged_histograms_are_within_one_bin_of_exact():
+    group, wells = _fixture()
+    distributions = [
+        MonteCarloDistribution(variable="QI_SCALAR", kind="lognormal", mean=1.0, stdDev=0.3),
+        MonteCarloDistribution(variable="OIL_PRICE", kind="normal", mean=75.0, stdDev=15.0, low=10.0),
+        MonteCarloDistribution(variable="DELAY_MONTHS", kind="uniform", low=0.0, high=6.0),
+    ]
+
+    result = run_monte_carlo([group], wells, distributions, 3000, seed=3, chunk_size=400)
+
+    exact = MonteCarloPlan.build([group], wells).evaluate(sample_inputs(distributions, 3000, seed=3), 3000)
+    for name, values in exact.fan_series().items():
+        low, mid, high = np.percentile(values, [10, 50, 90], axis=0)
+        fan = np.array([[p.p10, p.p50, p.p90] for p in result.fan[name]]).T
+        bin_width = (values[:1000].max(axis=0) - values[:1000].min(axis=0)) / 256
+        assert (np.abs(fan - [high, mid, low]) <= bin_width + 1e-6).all()
+
+
+def test_process_pool_matches_in_process_run():
+    group, wells = _fixture()
+    distributions = [MonteCarloDistribution(variable="OIL_PRICE", kind="uniform", low=50.0, high=90.0)]
+    args = ([group], wells, distributions, 60)
+
+    serial = run_monte_carlo(*args, seed=5, chunk_size=20, workers=1)
+    parallel = run_monte_carlo(*args, seed=5, chunk_size=20, workers=2)
+
+    _assert_same_run(parallel, serial)
+
+
+def test_monte_carlo_endpoint_echoes_seed_and_rejects_bad_distributions():
+    group, wells = _fixture()
+    body = {
+        "baseGroups": [group.model_dump(mode="json")],
+        "wells": [w.model_dump(mode="json") for w in wells],
+        "distributions": [{"variable": "OIL_PRICE", "kind": "uniform", "low": 60.0, "high": 80.0}],
+        "draws": 50,
+    }
+    client = TestClient(create_app())
+
+    response = client.post("/api/sensitivity/monte-carlo", json=body)
+    assert response.status_code == 200
+    assert response.json()["draws"] == 50
+    repeat = client.post("/api/sensitivity/monte-carlo", json={**body, "seed": response.json()["seed"]})
+    assert repeat.json() == response.json()
+
+    bad = {**body, "distributions": [{"variable": "OIL_PRICE", "kind": "triangular", "low": 60.0, "high": 80.0}]}
+    assert client.post("/api/sensitivity/monte-carlo", json=bad).status_code == 422
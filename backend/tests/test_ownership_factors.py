@@ -0,0 +1,97 @@
+import math
+
+import numpy as np
+
+from backend.economics import _clamp01, _compute_agreement_payout_months, _compute_ownership_factors
+from backend.models import JvAgreement, JvAgreementTerms, OwnershipAssumptions
+
+
+def _reference_factors(ownership, revenue, opex, capex):
+    """Month-by-month loop the vectorized factors must reproduce exactly."""
+    months = len(revenue)
+    base_nri = _clamp01(ownership.baseNri)
+    base_cost = _clamp01(ownership.baseCostInterest)
+
+    payout_months = {}
+    for agreement in ownership.agreements:
+        start_idx = max(0, math.floor((agreement.startMonth or 1) - 1))
+        rev_factor = base_nri * _clamp01(agreement.prePayout.conveyRevenuePctOfBase)
+        cost_factor = base_cost * _clamp01(agreement.prePayout.conveyCostPctOfBase)
+        cumulative, payout = 0.0, None
+        for i in range(start_idx, months):
+            cumulative += (revenue[i] * rev_factor) - ((opex[i] + capex[i]) * cost_factor)
+            if cumulative >= 0:
+                payout = i + 1
+                break
+        payout_months[agreement.id] = payout
+
+    rev_out, cost_out = [], []
+    for i in range(months):
+        conveyed_rev = conveyed_cost = 0.0
+        for agreement in ownership.agreements:
+            if i < max(0, math.floor((agreement.startMonth or 1) - 1)):
+                continue
+            payout = payout_months.get(agreement.id)
+            terms = agreement.postPayout if payout is not None and i >= payout else agreement.prePayout
+            conveyed_rev += _clamp01(terms.conveyRevenuePctOfBase)
+            conveyed_cost += _clamp01(terms.conveyCostPctOfBase)
+        rev_out.append(base_nri * (1 - _clamp01(conveyed_rev)))
+        cost_out.append(base_cost * (1 - _clamp01(conveyed_cost)))
+    return rev_out, cost_out
+
+
+def _agreement(agreement_id: str, start: int, pre: tuple[float, float], post: tuple[float, float]) -> JvAgreement:
+    return JvAgreement(
+        id=agreement_id,
+        name=agreement_id,
+        startMonth=start,
+        prePayout=JvAgreementTerms(conveyRevenuePctOfBase=pre[0], conveyCostPctOfBase=pre[1]),
+        postPayout=JvAgreementTerms(conveyRevenuePctOfBase=post[0], conveyCostPctOfBase=post[1]),
+    )
+
+
+def _streams(seed: int, months: int = 120):
+    rng = np.random.default_rng(seed)
+    capex = np.where(rng.random(months) < 0.15, rng.uniform(1e6, 6e6, months), 0.0)
+    revenue = rng.uniform(0, 9e5, months) * np.exp(-np.arange(months) / 50)
+    opex = rng.uniform(1e4, 8e4, months)
+    return revenue, opex, capex
+
+
+def test_vectorized_factors_match_month_loop_for_many_agreements():
+    rng = np.random.default_rng(11)
+    for seed in range(25):
+        revenue, opex, capex = _streams(seed)
+        agreements = [
+            _agreement(
+                f"a{k % 9}",  # repeated ids share a payout month by design
+                int(rng.integers(1, 140)),
+                tuple(rng.uniform(0, 0.6, 2)),
+                tuple(rng.uniform(0, 0.4, 2)),
+            )
+            for k in range(int(rng.integers(1, 30)))
+        ]
+        ownership = OwnershipAssumptions(baseNri=0.8, baseCostInterest=0.95, agreements=agreements)
+
+        expected_rev, expected_cost = _reference_factors(ownership, revenue, opex, capex)
+        rev, cost = _compute_ownership_factors(ownership, revenue, opex, capex)
+
+        assert np.allclose(rev, expected_rev, rtol=0, atol=1e-15)
+        assert np.allclose(cost, expected_cost, rtol=0, atol=1e-15)
+
+
+def test_payout_months_respect_start_month_and_never_paying_out():
+    revenue = np.array([0.0, 100.0, 100.0, 100.0])
+    opex = np.zeros(4)
+    capex = np.array([150.0, 0.0, 0.0, 0.0])
+    ownership = OwnershipAssumptions(
+        baseNri=1.0,
+        baseCostInterest=1.0,
+        agreements=[
+            _agreement("from-start", 1, (0.5, 0.5), (0.1, 0.1)),
+            _agreement("late", 3, (0.5, 0.5), (0.1, 0.1)),
+            _agreement("never", 1, (0.0, 1.0), (0.0, 0.0)),
+        ],
+    )
+
+    assert _compute_agreement_payout_months(ownership, revenue, opex, capex).tolist() == [3, 3, 0]
@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+import backend.economics as econ
+from backend.economics import _ProductionCurveCache, evaluate_production_curve, production_cache_stats
+from backend.models import ForecastSegment, TypeCurveParams
+
+
+def setup_function():
+    econ._production_cache.clear()
+
+
+def _tc(**overrides) -> TypeCurveParams:
+    params = {"qi": 900.0, "b": 1.1, "di": 65.0, "terminalDecline": 6.0, "gorMcfPerBbl": 2.0}
+    params.update(overrides)
+    return TypeCurveParams(**params)
+
+
+def test_repeat_evaluation_hits_cache_and_returns_read_only_arrays():
+    oil_a, gas_a = evaluate_production_curve(_tc(), 120, 1.0)
+    oil_b, gas_b = evaluate_production_curve(_tc(), 120, 1.0)
+
+    assert oil_a is oil_b and gas_a is gas_b
+    assert production_cache_stats()["hits"] == 1
+    assert production_cache_stats()["misses"] == 1
+    with pytest.raises(ValueError):
+        oil_a[0] = 0.0
+
+
+def test_cached_curve_matches_direct_evaluation():
+    tc = _tc(segments=[
+        ForecastSegment(id="a", name="A", qi=900.0, b=1.1, initialDecline=65.0, cutoffKind="rate", cutoffValue=200.0),
+        ForecastSegment(id="b", name="B", b=0.0, initialDecline=8.0),
+    ])
+    oil, gas = evaluate_production_curve(tc, 120, 0.9)
+    ref_oil, ref_gas = econ._evaluate_multi_segment_production(tc, 120, 0.9)
+
+    assert np.array_equal(oil, np.asarray(ref_oil))
+    assert np.array_equal(gas, np.asarray(ref_gas))
+
+
+def test_key_distinguishes_segments_gor_horizon_and_scalar():
+    base = _ProductionCurveCache.key(_tc(), 120, 1.0)
+    assert base == _ProductionCurveCache.key(_tc(), 120, 1.0)
+    assert base != _ProductionCurveCache.key(_tc(gorMcfPerBbl=2.5), 120, 1.0)
+    assert base != _ProductionCurveCache.key(_tc(), 60, 1.0)
+    assert base != _ProductionCurveCache.key(_tc(), 120, 1.01)
+    assert base != _ProductionCurveCache.key(
+        _tc(segments=[ForecastSegment(id="a", name="A", cutoffKind="cum", cutoffValue=1.0)]), 120, 1.0
+    )
+
+
+def test_lru_bound_evicts_least_recently_used():
+    cache = _ProductionCurveCache(max_entries=2)
+    empty = (np.zeros(1), np.zeros(1))
+    cache.set("a", empty)
+    cache.set("b", empty)
+    assert cache.get("a") is empty
+    cache.set("c", empty)
+
+    assert cache.get("b") is None
+    assert cache.get("a") is empty
+    assert cache.stats() == {"hits": 2, "misses": 1, "evictions": 1, "size": 2, "maxEntries": 2}
@@ -0,0 +1,180 @@
+import math
+
+import numpy as np
+import pytest
+
+from backend.economics import _evaluate_multi_segment_production
+from backend.models import ForecastSegment, TypeCurveParams
+
+
+def _stepping_reference(tc: TypeCurveParams, months_to_project: int, production_scalar: float) -> list[float]:
+    """The original month-by-month loop, kept as the behavioral reference."""
+    segments = tc.segments or [
+        ForecastSegment(id="default", name="Default", qi=tc.qi, b=tc.b, initialDecline=tc.di)
+    ]
+    oil_by_month = [0.0 for _ in range(months_to_project)]
+    current_month = 0
+    first_qi = segments[0].qi
+    current_rate = (first_qi if first_qi is not None else tc.qi) * 30.4 * production_scalar
+
+    for segment in segments:
+        if current_month >= months_to_project:
+            break
+        qi = segment.qi * 30.4 * production_scalar if segment.qi is not None else current_rate
+        b = segment.b if segment.b is not None else 0.0
+        di_annual = segment.initialDecline if segment.initialDecline is not None else 8.0
+        di_monthly = 1 - math.pow(1 - (di_annual / 100.0), 1 / 12.0)
+        value = segment.cutoffValue or 0.0
+
+        local_t = 0
+        cum_prod = 0.0
+        while current_month < months_to_project:
+            local_t += 1
+            if b == 0:
+                q_t = qi * math.exp(-di_monthly * local_t)
+            else:
+                q_t = qi / math.pow(1 + b * di_monthly * local_t, 1 / b)
+
+            cut = (
+                (segment.cutoffKind == "rate" and q_t <= value * 30.4)
+                or (segment.cutoffKind == "time_days" and local_t * 30.4 >= value)
+                or (segment.cutoffKind == "cum" and cum_prod >= value)
+            )
+            if cut:
+                current_rate = q_t
+                break
+
+            oil_by_month[current_month] = q_t
+            cum_prod += q_t
+            current_rate = q_t
+            current_month += 1
+
+    return oil_by_month
+
+
+def _segment(seg_id: str, **fields) -> ForecastSegment:
+    return ForecastSegment(id=seg_id, name=seg_id, **fields)
+
+
+_CURVES = {
+    "single_default": TypeCurveParams(qi=900.0, b=1.1, di=65.0, terminalDecline=6.0, gorMcfPerBbl=2.0),
+    "exponential": TypeCurveParams(qi=500.0, b=0.0, di=20.0, terminalDecline=6.0),
+    "harmonic": TypeCurveParams(qi=500.0, b=1.0, di=50.0, terminalDecline=6.0),
+    "rate_then_tail": TypeCurveParams(
+        qi=940.0,
+        b=1.15,
+        di=68.0,
+        terminalDecline=6.0,
+        segments=[
+            _segment("a", qi=940.0, b=1.15, initialDecline=68.0, cutoffKind="rate", cutoffValue=220.0),
+            _segment("b", b=0.0, initialDecline=8.0),
+        ],
+    ),
+    "rate_cum_time_chain": TypeCurveParams(
+        qi=800.0,
+        b=1.2,
+        di=70.0,
+        terminalDecline=6.0,
+        segments=[
+            _segment("a", qi=800.0, b=1.2, initialDecline=70.0, cutoffKind="rate", cutoffValue=300.0),
+            _segment("b", b=0.5, initialDecline=30.0, cutoffKind="cum", cutoffValue=40000.0),
+            _segment("c", b=0.0, initialDecline=10.0, cutoffKind="time_days", cutoffValue=900.0),
+            _segment("d", qi=150.0, b=0.0, initialDecline=6.0),
+        ],
+    ),
+    "cutoff_in_first_month": TypeCurveParams(
+        qi=100.0,
+        b=0.8,
+        di=40.0,
+        terminalDecline=6.0,
+        segments=[
+            _segment("a", qi=100.0, b=0.8, initialDecline=40.0, cutoffKind="rate", cutoffValue=500.0),
+            _segment("b", b=0.0, initialDecline=12.0, cutoffKind="time_days", cutoffValue=0.0),
+            _segment("c", b=0.3, initialDecline=15.0),
+        ],
+    ),
+    "time_on_month_boundary": TypeCurveParams(
+        qi=600.0,
+        b=0.9,
+        di=55.0,
+        terminalDecline=6.0,
+        segments=[
+            _segment("a", qi=600.0, b=0.9, initialDecline=55.0, cutoffKind="time_days", cutoffValue=30.4 * 12),
+            _segment("b", b=0.0, initialDecline=9.0, cutoffKind="cum", cutoffValue=0.0),
+            _segment("c", b=0.0, initialDecline=7.0),
+        ],
+    ),
+    "inclining_rate_cutoff": TypeCurveParams(
+        qi=200.0,
+        b=0.0,
+        di=5.0,
+        terminalDecline=6.0,
+        segments=[
+            _segment("a", qi=200.0, b=0.0, initialDecline=-30.0, cutoffKind="rate", cutoffValue=150.0),
+            _segment("b", b=0.0, initialDecline=-30.0, cutoffKind="time_days", cutoffValue=200.0),
+            _segment("c", b=1.4, initialDecline=60.0),
+        ],
+    ),
+    "horizon_reached_before_last_segment": TypeCurveParams(
+        qi=700.0,
+        b=1.0,
+        di=60.0,
+        terminalDecline=6.0,
+        segments=[
+            _segment("a", qi=700.0, b=1.0, initialDecline=60.0, cutoffKind="cum", cutoffValue=1e12),
+            _segment("b", qi=50.0, b=0.0, initialDecline=6.0),
+        ],
+    ),
+}
+
+
+@pytest.mark.parametrize("name", sorted(_CURVES))
+@pytest.mark.parametrize("months, scalar", [(120, 1.0), (120, 0.85), (37, 1.3)])
+def test_closed_form_segments_match_stepping_loop(name, months, scalar):
+    tc = _CURVES[name]
+
+    oil, gas = _evaluate_multi_segment_production(tc, months, scalar)
+
+    expected = np.array(_stepping_reference(tc, months, scalar))
+    np.testing.assert_array_equal(oil == 0, expected == 0)
+    np.testing.assert_allclose(oil, expected, rtol=1e-13, atol=0)
+    np.testing.assert_allclose(gas, expected * (tc.gorMcfPerBbl or 0.0), rtol=1e-13, atol=0)
+
+
+def _monthly(annual_pct: float) -> float:
+    return 1 - (1 - annual_pct / 100.0) ** (1 / 12.0)
+
+
+def test_modified_hyperbolic_turns_exponential_at_terminal_decline():
+    tc = TypeCurveParams(qi=900.0, b=1.3, di=70.0, terminalDecline=8.0, modifiedHyperbolic=True)
+    di, terminal = _monthly(70.0), _monthly(8.0)
+    t_switch = (di / terminal - 1) / (1.3 * di)
+    assert di / (1 + 1.3 * di * t_switch) == pytest.approx(terminal)
+    assert 12 < t_switch < 120
+
+    oil, _ = _evaluate_multi_segment_production(tc, 120, 1.0)
+    plain, _ = _evaluate_multi_segment_production(tc.model_copy(update={"modifiedHyperbolic": False}), 120, 1.0)
+
+    before = np.arange(1, 121) <= t_switch
+    np.testing.assert_allclose(oil[before], plain[before], rtol=1e-14)
+    after = np.flatnonzero(~before)
+    np.testing.assert_allclose(oil[after[1:]] / oil[after[:-1]], np.exp(-terminal), rtol=1e-12)
+    assert oil[after].sum() < plain[after].sum()
+
+
+def test_initial_decline_below_terminal_declines_at_terminal_from_the_start():
+    tc = TypeCurveParams(qi=300.0, b=0.5, di=5.0, terminalDecline=10.0, modifiedHyperbolic=True)
+
+    oil, _ = _evaluate_multi_segment_production(tc, 24, 1.0)
+
+    expected = 300.0 * 30.4 * np.exp(-_monthly(10.0) * np.arange(1, 25))
+    np.testing.assert_allclose(oil, expected, rtol=1e-12)
+
+
+def test_exponential_segments_ignore_the_terminal_switch():
+    tc = _CURVES["exponential"].model_copy(update={"terminalDecline": 35.0})
+
+    oil, _ = _evaluate_multi_segment_production(tc.model_copy(update={"modifiedHyperbolic": True}), 120, 1.0)
+    plain, _ = _evaluate_multi_segment_production(tc, 120, 1.0)
+
+    np.testing.assert_array_equal(oil, plain)
@@ -0,0 +1,107 @@
+import json
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.flow_encoding import PACKED_F64_MEDIA_TYPE
+from backend.main import create_app
+from backend.result_cache import CachedBody, _result_cache, _ResultCache, if_none_match
+
+
+FIXTURE_PATH = Path(__file__).resolve().parents[2] / "fixtures" / "economics" / "dual-parity-rich.json"
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    _result_cache.clear()
+    yield
+    _result_cache.clear()
+
+
+def _payload() -> dict:
+    return json.loads(FIXTURE_PATH.read_text())["input"]
+
+
+def test_calculate_returns_etag_and_serves_repeats_from_cache():
+    client = TestClient(create_app())
+    first = client.post("/api/economics/calculate", json=_payload())
+    second = client.post("/api/economics/calculate", json=_payload())
+
+    assert first.status_code == 200
+    assert first.headers["etag"] == second.headers["etag"]
+    assert first.content == second.content
+    assert _result_cache.stats()["hits"] == 1
+
+
+def test_if_none_match_returns_304_without_body():
+    client = TestClient(create_app())
+    etag = client.post("/api/economics/calculate", json=_payload()).headers["etag"]
+
+    response = client.post("/api/economics/calculate", json=_payload(), headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+
+def test_etag_depends_on_request_and_encoding():
+    client = TestClient(create_app())
+    base = client.post("/api/economics/calculate", json=_payload())
+    packed = client.post("/api/economics/calculate", json=_payload(), headers={"Accept": PACKED_F64_MEDIA_TYPE})
+    changed = client.post(
+        "/api/economics/calculate",
+        json={**_payload(), "pricing": {**_payload()["pricing"], "oilPrice": 55.0}},
+    )
+
+    assert len({base.headers["etag"], packed.headers["etag"], changed.headers["etag"]}) == 3
+    assert packed.headers["content-type"] == PACKED_F64_MEDIA_TYPE
+
+
+def test_sensitivity_matrix_honors_if_none_match():
+    fixture_input = _payload()
+    group = {
+        "id": "g1",
+        "name": "g1",
+        "color": "#000000",
+        "wellIds": [w["id"] for w in fixture_input["wells"]],
+        "typeCurve": fixture_input["typeCurve"],
+        "capex": fixture_input["capex"],
+        "pricing": fixture_input["pricing"],
+    }
+    body = {
+        "baseGroups": [group],
+        "wells": fixture_input["wells"],
+        "xVar": "OIL_PRICE",
+        "xSteps": [60.0, 70.0],
+        "yVar": "CAPEX_SCALAR",
+        "ySteps": [1.0],
+    }
+    client = TestClient(create_app())
+    first = client.post("/api/sensitivity/matrix", json=body)
+    assert first.status_code == 200
+    assert len(first.json()) == 1
+
+    again = client.post("/api/sensitivity/matrix", json=body, headers={"If-None-Match": first.headers["etag"]})
+    assert again.status_code == 304
+
+
+def test_cache_evicts_by_bytes_and_expires_by_ttl():
+    now = [0.0]
+    cache = _ResultCache(max_bytes=10, ttl_seconds=5.0, timer=lambda: now[0])
+    cache.set("a", CachedBody(b"12345", "application/json"))
+    cache.set("b", CachedBody(b"12345", "application/json"))
+    assert cache.get("a") is not None
+    cache.set("c", CachedBody(b"123", "application/json"))
+
+    assert cache.get("b") is None
+    assert cache.stats()["bytes"] == 8
+    now[0] = 6.0
+    assert cache.get("a") is None
+
+
+def test_if_none_match_parsing():
+    assert if_none_match('W/"abc", "def"', '"abc"')
+    assert if_none_match("*", '"abc"')
+    assert not if_none_match('"abd"', '"abc"')
+    assert not if_none_match(None, '"abc"')
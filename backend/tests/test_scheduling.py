@@ -0,0 +1,59 @@
+import numpy as np
+
+from backend.models import CapexAssumptions, ScheduleParams, Well
+from backend.scheduling import assign_start_months, rig_slots, schedule_wells
+
+
+def _linear_scan(well_count: int, slots: list[float], cycle: float) -> list[float]:
+    availability = list(slots)
+    starts = []
+    for _ in range(well_count):
+        best = 0
+        for i in range(1, len(availability)):
+            if availability[i] < availability[best]:
+                best = i
+        starts.append(availability[best])
+        availability[best] += cycle
+    return starts
+
+
+def _capex(rig_count: float = 2.0) -> CapexAssumptions:
+    return CapexAssumptions(
+        rigCount=rig_count,
+        drillDurationDays=20.0,
+        stimDurationDays=10.0,
+        rigStartDate="2026-01-01",
+        items=[],
+    )
+
+
+def test_heap_assignment_matches_linear_scan_including_ties():
+    rng = np.random.default_rng(3)
+    for _ in range(20):
+        slots = rng.choice([0.0, 12.0, 24.0, 36.0], size=int(rng.integers(1, 40))).tolist()
+        cycle = float(rng.uniform(0.2, 3.0))
+        expected = _linear_scan(500, slots, cycle)
+        assert assign_start_months(500, slots, cycle).tolist() == expected
+
+
+def test_rig_slots_from_override_add_rigs_at_year_boundaries():
+    override = ScheduleParams(
+        annualRigs=[1.5, 1.5, 3.0, 2.0, 4.0],
+        drillDurationDays=20.0,
+        stimDurationDays=10.0,
+        rigStartDate="2026-01-01",
+    )
+    assert rig_slots(_capex(), override) == [0.0, 0.0, 24.0, 24.0, 48.0, 48.0]
+    assert rig_slots(_capex(0.0)) == [0.0]
+
+
+def test_schedule_orders_longest_laterals_first_and_is_read_only():
+    wells = [
+        Well(id=f"w{i}", name="", lat=0, lng=0, lateralLength=length, status="PERMIT", operator="x")
+        for i, length in enumerate([5000.0, 12000.0, 9000.0])
+    ]
+    schedule = schedule_wells(wells, _capex(1.0))
+
+    assert [w.id for w in schedule.wells] == ["w1", "w2", "w0"]
+    assert np.allclose(schedule.start_months, [0.0, 30.0 / 30.4, 60.0 / 30.4])
+    assert not schedule.start_months.flags.writeable
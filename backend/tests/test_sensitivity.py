@@ -0,0 +1,225 @@
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.economics import calculate_economics
+from backend.main import create_app
+from backend.models import Scalars, ScheduleParams, TornadoInput, Well, WellGroup
+from backend.sensitivity import (
+    SensitivityPlan,
+    _MEMO_MAX_ENTRIES,
+    _get_params_for_step,
+    generate_sensitivity_matrix,
+    generate_tornado,
+)
+
+
+FIXTURE_PATH = Path(__file__).resolve().parents[2] / "fixtures" / "economics" / "dual-parity-rich.json"
+
+
+def _fixture():
+    fixture_input = json.loads(FIXTURE_PATH.read_text())["input"]
+    well_ids = [w["id"] for w in fixture_input["wells"]]
+    groups = [
+        WellGroup(
+            id=f"g{i}",
+            name=f"g{i}",
+            color="#000000",
+            wellIds=ids,
+            typeCurve=fixture_input["typeCurve"],
+            capex=fixture_input["capex"],
+            pricing={**fixture_input["pricing"], "oilPrice": 60.0 + 10 * i},
+            opex=fixture_input["opex"],
+            ownership=fixture_input["ownership"],
+        )
+        for i, ids in enumerate([well_ids, well_ids[:2], []])
+    ]
+    return groups, fixture_input["wells"]
+
+
+def _reference_npv(groups, wells, x_var, x_val, y_var, y_val) -> float:
+    """Per-cell, per-group full engine run (the original implementation)."""
+    total = 0.0
+    for group in groups:
+        group_wells = [w for w in wells if w.id in set(group.wellIds)]
+        scalars = Scalars(capex=1.0, production=1.0)
+        pricing = group.pricing.model_copy(deep=True)
+        schedule = ScheduleParams(
+            annualRigs=[(group.capex.rigCount or 1) for _ in range(10)],
+            drillDurationDays=group.capex.drillDurationDays,
+            stimDurationDays=group.capex.stimDurationDays,
+            rigStartDate=group.capex.rigStartDate,
+        )
+        for var, val in ((y_var, y_val), (x_var, x_val)):
+            scalars, pricing, schedule = _get_params_for_step(
+                variable=var,
+                value=val,
+                current_scalars=scalars,
+                current_pricing=pricing,
+                current_schedule=schedule,
+            )
+        result = calculate_economics(
+            group_wells, group.typeCurve, group.capex, pricing, group.opex, group.ownership, scalars, schedule
+        )
+        total += result.metrics.npv10
+    return total
+
+
+@pytest.mark.parametrize(
+    ("x_var", "x_steps", "y_var", "y_steps"),
+    [
+        ("OIL_PRICE", [40.0, 70.0, 100.0], "CAPEX_SCALAR", [0.8, 1.2]),
+        ("EUR_SCALAR", [0.7, 1.3], "RIG_COUNT", [1.0, 3.0]),
+        ("OIL_PRICE", [50.0, 80.0], "OIL_PRICE", [10.0]),
+    ],
+)
+def test_plan_matches_per_cell_full_evaluation(x_var, x_steps, y_var, y_steps):
+    groups, raw_wells = _fixture()
+    wells = [Well(**w) for w in raw_wells]
+
+    matrix = generate_sensitivity_matrix(groups, wells, x_var, x_steps, y_var, y_steps)
+
+    assert [[(c.xValue, c.yValue) for c in row] for row in matrix] == [[(x, y) for x in x_steps] for y in y_steps]
+    for row in matrix:
+        for cell in row:
+            expected = _reference_npv(groups, wells, x_var, cell.xValue, y_var, cell.yValue)
+            assert cell.npv == pytest.approx(expected, rel=1e-9)
+
+
+def test_affine_fill_matches_per_cell_engine_across_payout_patterns():
+    groups, raw_wells = _fixture()
+    wells = [Well(**w) for w in raw_wells]
+    plan = SensitivityPlan.build(groups[:1], wells).groups[0]
+    prices, scalars = np.meshgrid(np.linspace(20.0, 150.0, 9), np.linspace(0.5, 1.6, 7))
+
+    npvs = plan.affine_npvs(prices.ravel(), scalars.ravel())
+
+    for price, scalar, value in zip(prices.ravel(), scalars.ravel(), npvs):
+        expected = plan.npv10({"OIL_PRICE": price, "CAPEX_SCALAR": scalar})
+        assert value == pytest.approx(expected, rel=1e-9, abs=1e-3)
+
+
+def test_linear_grid_with_payout_flip_still_matches_full_evaluation():
+    groups, raw_wells = _fixture()
+    wells = [Well(**w) for w in raw_wells]
+    x_steps = [5.0, 40.0, 120.0, 200.0]
+    y_steps = [0.5, 1.0, 3.0]
+
+    matrix = generate_sensitivity_matrix(groups, wells, "OIL_PRICE", x_steps, "CAPEX_SCALAR", y_steps)
+
+    for row in matrix:
+        for cell in row:
+            expected = _reference_npv(groups, wells, "OIL_PRICE", cell.xValue, "CAPEX_SCALAR", cell.yValue)
+            assert cell.npv == pytest.approx(expected, rel=1e-9)
+
+
+def test_volume_memo_stays_bounded_on_wide_grids():
+    groups, raw_wells = _fixture()
+    wells = [Well(**w) for w in raw_wells]
+    plan = SensitivityPlan.build(groups[:1], wells)
+    cells = [{"CAPEX_SCALAR": c, "EUR_SCALAR": e} for c in (0.9, 1.1) for e in np.linspace(0.5, 1.5, 25)]
+
+    npvs = plan.portfolio_npvs(cells)
+
+    assert len(plan.groups[0]._volumes) <= _MEMO_MAX_ENTRIES
+    for cell, value in zip(cells[::7], npvs[::7]):
+        assert value == pytest.approx(SensitivityPlan.build(groups[:1], wells).portfolio_npvs([cell])[0], rel=1e-12)
+
+
+def test_process_pool_matches_in_process_grid():
+    groups, raw_wells = _fixture()
+    wells = [Well(**w) for w in raw_wells]
+    args = (groups, wells, "EUR_SCALAR", [0.6, 0.8, 1.0, 1.2, 1.4], "RIG_COUNT", [1.0, 2.0, 3.0])
+
+    serial = generate_sensitivity_matrix(*args, workers=1)
+    parallel = generate_sensitivity_matrix(*args, workers=2)
+
+    assert [[c.model_dump() for c in row] for row in parallel] == [[c.model_dump() for c in row] for row in serial]
+
+
+def _reference_tornado_npv(groups, wells, variable, value) -> float:
+    total = 0.0
+    for group in groups:
+        group_wells = [w for w in wells if w.id in set(group.wellIds)]
+        if not group_wells:
+            continue
+        scalars = Scalars(capex=1.0, production=1.0)
+        pricing = group.pricing.model_copy(deep=True)
+        opex = group.opex.model_copy(deep=True)
+        ownership = group.ownership.model_copy(deep=True)
+        schedule = ScheduleParams(
+            annualRigs=[(group.capex.rigCount or 1) for _ in range(10)],
+            drillDurationDays=group.capex.drillDurationDays,
+            stimDurationDays=group.capex.stimDurationDays,
+            rigStartDate=group.capex.rigStartDate,
+        )
+        if variable == "OPEX_SCALAR":
+            for seg in opex.segments:
+                seg.fixedPerWellPerMonth *= value
+                seg.variableOilPerBbl *= value
+                seg.variableGasPerMcf *= value
+        elif variable == "NRI":
+            ownership.baseNri = value
+        else:
+            scalars, pricing, schedule = _get_params_for_step(
+                variable=variable,
+                value=value,
+                current_scalars=scalars,
+                current_pricing=pricing,
+                current_schedule=schedule,
+            )
+        result = calculate_economics(
+            group_wells, group.typeCurve, group.capex, pricing, opex, ownership, scalars, schedule
+        )
+        total += result.metrics.npv10
+    return total
+
+
+def test_tornado_bars_match_engine_and_are_sorted_by_swing():
+    groups, raw_wells = _fixture()
+    wells = [Well(**w) for w in raw_wells]
+    variables = [
+        TornadoInput(variable="OIL_PRICE", low=55.0, high=95.0),
+        TornadoInput(variable="CAPEX_SCALAR", low=0.8, high=1.2),
+        TornadoInput(variable="EUR_SCALAR", low=0.8, high=1.2),
+        TornadoInput(variable="RIG_COUNT", low=1.0, high=3.0),
+        TornadoInput(variable="GAS_PRICE", low=2.0, high=5.0),
+        TornadoInput(variable="OPEX_SCALAR", low=0.8, high=1.2),
+        TornadoInput(variable="NRI", low=0.75, high=0.875),
+    ]
+
+    tornado = generate_tornado(groups, wells, variables)
+
+    assert tornado.baseNpv == pytest.approx(
+        _reference_tornado_npv(groups, wells, "EUR_SCALAR", 1.0), rel=1e-9
+    )
+    swings = [bar.swing for bar in tornado.bars]
+    assert swings == sorted(swings, reverse=True)
+    assert {bar.variable for bar in tornado.bars} == {item.variable for item in variables}
+    for bar in tornado.bars:
+        assert bar.lowNpv == pytest.approx(_reference_tornado_npv(groups, wells, bar.variable, bar.lowValue), rel=1e-9)
+        assert bar.highNpv == pytest.approx(
+            _reference_tornado_npv(groups, wells, bar.variable, bar.highValue), rel=1e-9
+        )
+
+
+def test_tornado_endpoint_returns_bars_sorted_by_swing():
+    groups, raw_wells = _fixture()
+    body = {
+        "baseGroups": [group.model_dump(mode="json") for group in groups],
+        "wells": raw_wells,
+        "variables": [
+            {"variable": "NRI", "low": 0.75, "high": 0.875},
+            {"variable": "OIL_PRICE", "low": 55.0, "high": 95.0},
+        ],
+    }
+
+    response = TestClient(create_app()).post("/api/sensitivity/tornado", json=body)
+
+    assert response.status_code == 200
+    swings = [bar["swing"] for bar in response.json()["bars"]]
+    assert len(swings) == 2
+    assert swings == sorted(swings, reverse=True)
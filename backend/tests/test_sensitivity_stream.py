@@ -0,0 +1,90 @@
+import asyncio
+import json
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+from backend.main import create_app
+from backend.models import SensitivityMatrixRequest
+from backend.sensitivity_stream import encode_frame, negotiate_stream_framing, sensitivity_frames
+
+
+FIXTURE_PATH = Path(__file__).resolve().parents[2] / "fixtures" / "economics" / "dual-parity-rich.json"
+
+
+def _body() -> dict:
+    fixture_input = json.loads(FIXTURE_PATH.read_text())["input"]
+    group = {
+        "id": "g1",
+        "name": "g1",
+        "color": "#000000",
+        "wellIds": [w["id"] for w in fixture_input["wells"]],
+        "typeCurve": fixture_input["typeCurve"],
+        "capex": fixture_input["capex"],
+        "pricing": fixture_input["pricing"],
+        "ownership": fixture_input["ownership"],
+    }
+    return {
+        "baseGroups": [group],
+        "wells": fixture_input["wells"],
+        "xVar": "OIL_PRICE",
+        "xSteps": [50.0, 70.0, 90.0],
+        "yVar": "RIG_COUNT",
+        "ySteps": [1.0, 2.0],
+    }
+
+
+def test_ndjson_stream_matches_matrix_endpoint():
+    client = TestClient(create_app())
+    expected = client.post("/api/sensitivity/matrix", json=_body()).json()
+
+    response = client.post("/api/sensitivity/matrix/stream", json=_body())
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    frames = [json.loads(line) for line in response.text.splitlines()]
+    rows = [frame for frame in frames if frame["type"] == "row"]
+    assert [frame["cells"] for frame in rows] == expected
+    assert [frame["completed"] for frame in rows] == [3, 6]
+    assert frames[-1]["type"] == "done"
+    assert frames[-1]["completed"] == frames[-1]["total"] == 6
+    assert frames[-1]["minNpv"] == min(cell["npv"] for row in expected for cell in row)
+
+
+def test_sse_framing_when_requested():
+    client = TestClient(create_app())
+
+    response = client.post(
+        "/api/sensitivity/matrix/stream", json=_body(), headers={"Accept": "text/event-stream"}
+    )
+
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = [block for block in response.text.split("\n\n") if block]
+    assert events[0].startswith("event: row\ndata: ")
+    assert events[-1].startswith("event: done\ndata: ")
+
+
+class _DisconnectAfter:
+    def __init__(self, checks: int) -> None:
+        self.checks = checks
+
+    async def is_disconnected(self) -> bool:
+        self.checks -= 1
+        return self.checks < 0
+
+
+def test_disconnect_stops_remaining_rows():
+    req = SensitivityMatrixRequest(**_body())
+
+    async def collect() -> list[dict]:
+        return [frame async for frame in sensitivity_frames(_DisconnectAfter(1), req)]
+
+    frames = asyncio.run(collect())
+
+    assert [frame["type"] for frame in frames] == ["row"]
+
+
+def test_frame_encoding_and_negotiation():
+    assert negotiate_stream_framing("text/event-stream") == "sse"
+    assert negotiate_stream_framing(None) == "ndjson"
+    assert encode_frame({"type": "done"}, "ndjson") == b'{"type":"done"}\n'
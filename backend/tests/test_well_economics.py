@@ -0,0 +1,74 @@
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.economics import calculate_economics_columns
+from backend.economics_engine import place_curve, place_curve_matrix
+from backend.main import create_app
+from backend.models import CalculateEconomicsRequest
+from backend.well_economics import calculate_well_economics
+
+
+FIXTURE_PATH = Path(__file__).resolve().parents[2] / "fixtures" / "economics" / "dual-parity-rich.json"
+
+
+def _request() -> CalculateEconomicsRequest:
+    return CalculateEconomicsRequest(**json.loads(FIXTURE_PATH.read_text())["input"])
+
+
+def _args(req: CalculateEconomicsRequest) -> tuple:
+    return (
+        req.wells, req.typeCurve, req.capex, req.pricing, req.opex, req.ownership, req.scalars, req.scheduleOverride
+    )
+
+
+def test_curve_matrix_rows_sum_to_placed_curve():
+    start_idx = np.array([0, 3, 3, 7, 130])
+    curve = np.linspace(100.0, 1.0, 50)
+
+    matrix = place_curve_matrix(start_idx, curve, 60)
+
+    np.testing.assert_allclose(matrix.sum(axis=0), place_curve(start_idx, curve, 60))
+    assert matrix[1, 3] == curve[0] and matrix[1, 2] == 0.0
+    assert not matrix[4].any()
+
+
+def test_well_rows_sum_to_group_pre_tax_columns():
+    req = _request()
+    group = calculate_economics_columns(*_args(req))
+
+    wells = calculate_well_economics(*_args(req))
+
+    assert len(wells.well_ids) == len(req.wells)
+    for name, matrix in wells.streams.items():
+        np.testing.assert_allclose(matrix.sum(axis=0), group.columns[name], rtol=1e-9, atol=1e-6)
+    assert wells.eur.sum() == pytest.approx(group.metrics.eur, rel=1e-12)
+    assert wells.npv10.sum() == pytest.approx(group.metrics.npv10, rel=1e-9)
+    assert wells.total_capex.sum() == pytest.approx(group.metrics.totalCapex, rel=1e-12)
+
+
+def test_float32_storage_halves_memory_and_keeps_metrics_close():
+    req = _request()
+    full = calculate_well_economics(*_args(req))
+    compact = calculate_well_economics(*_args(req), dtype=np.float32)
+
+    assert compact.streams["netCashFlow"].dtype == np.float32
+    assert compact.streams["netCashFlow"].nbytes * 2 == full.streams["netCashFlow"].nbytes
+    np.testing.assert_allclose(compact.npv10, full.npv10, rtol=1e-4)
+    np.testing.assert_array_equal(compact.payout_months, full.payout_months)
+
+
+def test_wells_endpoint_returns_per_well_metrics():
+    payload = json.loads(FIXTURE_PATH.read_text())["input"]
+    client = TestClient(create_app())
+
+    response = client.post("/api/economics/wells", json={**payload, "precision": "float32", "includeFlows": True})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert {w["wellId"] for w in body["wells"]} == {w["id"] for w in payload["wells"]}
+    assert len(body["flows"]["netCashFlow"]) == len(payload["wells"])
+    assert len(body["flows"]["netCashFlow"][0]) == 120
@@ -0,0 +1,88 @@
+import json
+import pickle
+from pathlib import Path
+
+import pytest
+
+from backend.models import Well, WellGroup
+from backend.worker_pool import WorkerPlans, map_plan_jobs, plan_key, shared_pool, shutdown_pools
+
+
+FIXTURE_PATH = Path(__file__).resolve().parents[2] / "fixtures" / "economics" / "dual-parity-rich.json"
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _shutdown_pools():
+    yield
+    shutdown_pools()
+
+
+def _inputs():
+    fixture_input = json.loads(FIXTURE_PATH.read_text())["input"]
+    wells = [Well(**w) for w in fixture_input["wells"]]
+    group = WellGroup(
+        id="g0",
+        name="g0",
+        color="#000000",
+        wellIds=[w.id for w in wells],
+        typeCurve=fixture_input["typeCurve"],
+        capex=fixture_input["capex"],
+        pricing=fixture_input["pricing"],
+        opex=fixture_input["opex"],
+        ownership=fixture_input["ownership"],
+    )
+    return [group], wells
+
+
+def test_plan_key_tracks_group_and_well_content():
+    groups, wells = _inputs()
+    edited = groups[0].model_copy(update={"pricing": groups[0].pricing.model_copy(update={"oilPrice": 1.0})})
+
+    assert plan_key(groups, wells) == plan_key(*_inputs())
+    assert plan_key([edited], wells) != plan_key(groups, wells)
+    assert plan_key(groups, wells[:1]) != plan_key(groups, wells)
+
+
+def test_worker_plans_build_once_per_key_and_evict_least_recent():
+    groups, wells = _inputs()
+    inputs = pickle.dumps((groups, wells))
+    plans = WorkerPlans(lambda g, w: (len(g), len(w)), max_entries=2)
+
+    built = [plans.get((key, inputs)) for key in ("a", "b", "a", "c")]
+
+    assert built == [(1, len(wells))] * 4
+    assert plans.get(("a", None)) == (1, len(wells))
+    # "a" was used after "b", so "c" evicted "b", and a bare key cannot rebuild it.
+    assert plans.get(("b", None)) is None
+    assert plans.builds == 3
+
+
+_test_plans: WorkerPlans[int] = WorkerPlans(lambda groups, wells: len(wells))
+
+
+def _shipped(job, offset: int):
+    plan = _test_plans.get(job)
+    return None if plan is None else (plan + offset, job[1] is not None)
+
+
+def test_map_plan_jobs_ships_inputs_only_to_workers_without_the_plan():
+    groups, wells = _inputs()
+    pool = shared_pool("test", 1)
+
+    first = map_plan_jobs(pool, _shipped, groups, wells, [0, 1, 2])
+    second = map_plan_jobs(pool, _shipped, groups, wells, [3, 4])
+
+    assert [value for value, _ in first] == [len(wells), len(wells) + 1, len(wells) + 2]
+    assert all(shipped for _, shipped in first)
+    assert second == [(len(wells) + 3, False), (len(wells) + 4, False)]
+    assert map_plan_jobs(pool, _shipped, groups, wells, []) == []
+
+
+def test_shared_pool_is_reused_until_its_size_changes():
+    first = shared_pool("test", 1)
+
+    assert shared_pool("test", 1) is first
+    assert first.submit(sum, [1, 2]).result() == 3
+    resized = shared_pool("test", 2)
+    assert resized is not first
+    assert shared_pool("test", 2) is resized
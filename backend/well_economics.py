@@ -0,0 +1,167 @@
+"""
+Well-level economics: one (wells × months) matrix per stream.
+
+Each well's row is the shared age-indexed curve shifted to its scheduled start,
+so the whole matrix is one gather rather than N engine runs. Ownership factors
+are computed from the group totals exactly as in `calculate_economics` (JV
+payout is a group-level event) and applied to every row, so the rows sum to
+the group's pre-tax columns. Tax and debt are group-level layers and are not
+allocated to wells.
+
+Per-well metrics come from the matrices directly: NPV10 is one matrix-vector
+product, payout one cumulative sum along months, and IRR one batched solve.
+`dtype=np.float32` halves the matrix footprint; metrics are still accumulated
+in float64.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from .economics import (
+    _compute_ownership_factors,
+    _legacy_opex,
+    _legacy_ownership,
+    evaluate_production_curve,
+    realized_prices,
+)
+from .economics_engine import (
+    MONTHS_TO_PROJECT,
+    compile_opex_table,
+    discount_factors,
+    place_amounts_matrix,
+    place_curve_matrix,
+    place_gross_volumes,
+    price_gross_streams,
+    well_capex,
+)
+from .irr import solve_irr_batch
+from .models import (
+    CapexAssumptions,
+    OpexAssumptions,
+    OwnershipAssumptions,
+    PricingAssumptions,
+    Scalars,
+    ScheduleParams,
+    TypeCurveParams,
+    Well,
+    WellEconomicsResponse,
+    WellMetrics,
+)
+from .scheduling import schedule_wells
+
+
+@dataclass
+class WellEconomicsMatrix:
+    well_ids: list[str]
+    """Wells in drill order; row ``i`` of every matrix belongs to ``well_ids[i]``."""
+    start_months: np.ndarray
+    streams: dict[str, np.ndarray]
+    """Stream name -> (wells × months) matrix (net of ownership for money streams)."""
+    eur: np.ndarray
+    total_capex: np.ndarray
+    npv10: np.ndarray
+    irr: np.ndarray
+    """Nominal annual IRR per well; NaN where undefined."""
+    payout_months: np.ndarray
+
+    def to_response(self, include_flows: bool = False) -> WellEconomicsResponse:
+        wells = [
+            WellMetrics(
+                wellId=well_id,
+                startMonth=start,
+                eur=eur,
+                totalCapex=capex,
+                npv10=npv10,
+                irr=irr if np.isfinite(irr) else None,
+                payoutMonths=payout,
+            )
+            for well_id, start, eur, capex, npv10, irr, payout in zip(
+                self.well_ids,
+                self.start_months.tolist(),
+                self.eur.tolist(),
+                self.total_capex.tolist(),
+                self.npv10.tolist(),
+                self.irr.tolist(),
+                self.payout_months.tolist(),
+            )
+        ]
+        flows = {name: matrix.tolist() for name, matrix in self.streams.items()} if include_flows else None
+        return WellEconomicsResponse(wells=wells, flows=flows)
+
+
+def calculate_well_economics(
+    selected_wells: list[Well],
+    tc: TypeCurveParams,
+    capex: CapexAssumptions,
+    pricing: PricingAssumptions,
+    opex: OpexAssumptions | None = None,
+    ownership: OwnershipAssumptions | None = None,
+    scalars: Scalars | None = None,
+    schedule_override: ScheduleParams | None = None,
+    dtype: type[np.floating] = np.float64,
+) -> WellEconomicsMatrix:
+    months = MONTHS_TO_PROJECT
+    scalars = scalars or Scalars()
+    opex = opex or _legacy_opex(pricing)
+    ownership = ownership or _legacy_ownership(pricing)
+
+    schedule = schedule_wells(selected_wells, capex, schedule_override)
+    oil_curve, gas_curve = evaluate_production_curve(tc, months, scalars.production)
+    opex_curve = compile_opex_table(opex, months).opex_curve(oil_curve, gas_curve)
+    capex_per_well = well_capex(schedule.wells, capex, scalars.capex)
+    realized_oil, realized_gas = realized_prices(pricing)
+
+    # Ownership (incl. JV payout reversion) is decided on the group totals.
+    gross = price_gross_streams(
+        place_gross_volumes(
+            start_months=schedule.start_months,
+            capex_per_well=capex_per_well,
+            oil_curve=oil_curve,
+            gas_curve=gas_curve,
+            opex_curve=opex_curve,
+            months=months,
+        ),
+        realized_oil,
+        realized_gas,
+    )
+    net_revenue_factor, net_cost_factor = _compute_ownership_factors(
+        ownership, gross.revenue, gross.opex, gross.capex
+    )
+
+    capex_idx = np.floor(schedule.start_months).astype(np.int64)
+    prod_idx = capex_idx + 1
+    oil = place_curve_matrix(prod_idx, oil_curve, months, dtype)
+    gas = place_curve_matrix(prod_idx, gas_curve, months, dtype)
+    revenue = place_curve_matrix(prod_idx, oil_curve * realized_oil + gas_curve * realized_gas, months, dtype)
+    revenue *= net_revenue_factor.astype(dtype)
+    well_opex = place_curve_matrix(prod_idx, opex_curve, months, dtype)
+    well_opex *= net_cost_factor.astype(dtype)
+    well_capex_matrix = place_amounts_matrix(capex_idx, capex_per_well, months, dtype)
+    well_capex_matrix *= net_cost_factor.astype(dtype)
+    net_cash_flow = revenue - well_opex - well_capex_matrix
+
+    cumulative = np.cumsum(net_cash_flow, axis=1, dtype=np.float64)
+    paid_out = cumulative >= 0
+    payout_months = np.where(paid_out.any(axis=1), paid_out.argmax(axis=1) + 1, 0)
+    irr = solve_irr_batch(net_cash_flow)
+
+    return WellEconomicsMatrix(
+        well_ids=[well.id for well in schedule.wells],
+        start_months=schedule.start_months,
+        streams={
+            "oilProduction": oil,
+            "gasProduction": gas,
+            "revenue": revenue,
+            "capex": well_capex_matrix,
+            "opex": well_opex,
+            "netCashFlow": net_cash_flow,
+        },
+        eur=oil.sum(axis=1, dtype=np.float64),
+        total_capex=well_capex_matrix.sum(axis=1, dtype=np.float64),
+        npv10=net_cash_flow.astype(np.float64, copy=False) @ discount_factors(months),
+        irr=np.where(irr.converged, irr.irr, np.nan),
+        payout_months=payout_months,
+    )
@@ -0,0 +1,128 @@
+"""
+Long-lived process pools for the batch routes (sensitivity, Monte Carlo).
+
+Each caller gets one spawn pool per process, created on first use and reused by
+later requests, so worker start-up and imports are paid once rather than once
+per request. Each worker keeps the last few plans it built in a `WorkerPlans`,
+keyed by a fingerprint of the request's groups and wells. `map_plan_jobs`
+sends chunks with that key alone and resends the inputs only to calls whose
+worker had no plan for it, so unchanged inputs are never shipped again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import multiprocessing
+import pickle
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Any, Callable, Generic, Iterable, TypeVar
+
+from .models import Well, WellGroup
+
+P = TypeVar("P")
+R = TypeVar("R")
+
+_DEFAULT_WORKER_PLANS_MAX_ENTRIES = 4
+
+# name -> (max_workers, pool)
+_pools: dict[str, tuple[int, ProcessPoolExecutor]] = {}
+_pools_lock = threading.Lock()
+
+
+def shared_pool(name: str, workers: int) -> ProcessPoolExecutor:
+    """The process-wide pool for `name`, (re)created when `workers` changes."""
+    with _pools_lock:
+        entry = _pools.get(name)
+        if entry is not None and entry[0] == workers:
+            return entry[1]
+        if entry is not None:
+            # Work already submitted to the old pool still runs to completion.
+            entry[1].shutdown(wait=False)
+        # spawn: the API process is multi-threaded, and forking it is not safe.
+        pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+        _pools[name] = (workers, pool)
+        return pool
+
+
+def shutdown_pools() -> None:
+    with _pools_lock:
+        for _, pool in _pools.values():
+            pool.shutdown(wait=True)
+        _pools.clear()
+
+
+def plan_key(base_groups: list[WellGroup], wells: list[Well]) -> str:
+    """SHA-256 over the canonical JSON of a request's groups and wells."""
+    payload = json.dumps(
+        [[group.model_dump(mode="json") for group in base_groups], [well.model_dump(mode="json") for well in wells]],
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+# (plan key, pickled (groups, wells) or None): a job names its plan and carries
+# the inputs only when it is resent to a worker that did not have the plan.
+PlanJob = tuple[str, bytes | None]
+
+
+class WorkerPlans(Generic[P]):
+    """Per-worker LRU of built plans keyed by `plan_key`."""
+
+    def __init__(
+        self,
+        build: Callable[[list[WellGroup], list[Well]], P],
+        *,
+        max_entries: int = _DEFAULT_WORKER_PLANS_MAX_ENTRIES,
+    ) -> None:
+        self._build = build
+        self.max_entries = max(1, max_entries)
+        self._plans: OrderedDict[str, P] = OrderedDict()
+        self.builds = 0
+
+    def get(self, job: PlanJob) -> P | None:
+        """The plan for the job's key, built from its inputs on a miss; None if it has none."""
+        key, inputs = job
+        plan = self._plans.get(key)
+        if plan is not None:
+            self._plans.move_to_end(key)
+            return plan
+        if inputs is None:
+            return None
+        plan = self._build(*pickle.loads(inputs))
+        self.builds += 1
+        self._plans[key] = plan
+        while len(self._plans) > self.max_entries:
+            self._plans.popitem(last=False)
+        return plan
+
+
+def map_plan_jobs(
+    pool: ProcessPoolExecutor,
+    fn: Callable[..., R | None],
+    base_groups: list[WellGroup],
+    wells: list[Well],
+    *iterables: Iterable[Any],
+) -> list[R]:
+    """`pool.map(fn, job, *iterables)` that sends the groups and wells only where needed.
+
+    Every call first gets the plan key alone; `fn` returns None when its worker
+    has no plan for it. Only those calls are resent, with the inputs pickled
+    once, so a repeated request ships nothing but its key.
+    """
+    args = list(zip(*iterables))
+    if not args:
+        return []
+    key = plan_key(base_groups, wells)
+    results = list(pool.map(fn, repeat((key, None)), *zip(*args)))
+    missing = [i for i, result in enumerate(results) if result is None]
+    if missing:
+        inputs = pickle.dumps((base_groups, wells), protocol=pickle.HIGHEST_PROTOCOL)
+        retried = pool.map(fn, repeat((key, inputs)), *zip(*(args[i] for i in missing)))
+        for i, result in zip(missing, retried):
+            results[i] = result
+    return results
@@ -0,0 +1,507 @@
+"""
+Batch decline-curve fitting: Arps (or power-law) parameters for many wells'
+rate histories in one pass.
+
+Histories are (wells × samples) arrays of rates against time in years, the
+units of the rate functions in `decline_multiseg`; NaN or non-positive samples
+(e.g. padding after a short history) are masked out. Fits minimize squared
+log-rate residuals, so flush production and the late tail weigh alike, with a
+bounded Levenberg-Marquardt iteration that advances every well together:
+analytic Jacobians, batched normal-equation solves, per-well damping, and steps
+projected onto the parameter bounds (a parameter on a bound is held there while
+the gradient points outward). Each well starts from the best point of a
+coarse shape × decline grid, with qi solved in closed form at every grid point,
+so the local solver does not start in the wrong b valley.
+
+Multi-segment fits split the history at shared break times. Every later
+segment starts from the previous segment's fitted end rate, the way chained
+`ForecastSegment`s continue from the current rate. `DeclineFit.to_type_curves`
+converts Arps fits to `TypeCurveParams`-shaped dicts. Chunks of wells can be
+spread over a process pool (`workers=`).
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Literal, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .decline_multiseg import _DAYS_PER_YEAR, hyperbolic_rate, power_law_rate
+
+FitMethod = Literal["Exp", "Hyperbolic", "Harmonic", "PowerLaw"]
+
+# The economics engine steps type curves in 30.4-day months.
+_ENGINE_DAYS_PER_MONTH = 30.4
+
+_DEFAULT_BOUNDS: Dict[str, Tuple[float, float]] = {
+    "qi": (0.0, np.inf),
+    "b": (0.0, 2.0),
+    # Nominal 1/yr; the upper bound keeps the engine's monthly decline below 1.
+    "Di": (1e-3, 10.0),
+    "m": (0.0, 5.0),
+    "tau": (1e-3, 50.0),
+}
+# Names of the (shape, scale) parameters behind each method's (ln qi, shape, ln scale) vector.
+_SHAPE_SCALE: Dict[str, Tuple[str, str]] = {
+    "Exp": ("b", "Di"),
+    "Hyperbolic": ("b", "Di"),
+    "Harmonic": ("b", "Di"),
+    "PowerLaw": ("m", "tau"),
+}
+_FIXED_B: Dict[str, float] = {"Exp": 0.0, "Harmonic": 1.0}
+_SHAPE_GRID_POINTS = 9
+_SCALE_GRID_POINTS = 25
+# Below this b * Di * t the b-derivative switches to its series (the closed form cancels).
+_SERIES_BELOW = 1e-3
+_MIN_CURVATURE = 1e-12
+_MAX_DAMPING = 1e10
+
+Kernel = Callable[[np.ndarray, np.ndarray, bool], Tuple[np.ndarray, Optional[np.ndarray]]]
+
+
+def _arps_log_rate(theta: np.ndarray, t: np.ndarray, jacobian: bool = True):
+    """ln q and its Jacobian in (ln qi, b, ln Di); b = 0 is the exponential limit."""
+    b = theta[:, 1:2]
+    x = np.exp(theta[:, 2:3]) * t
+    y = b * x
+    log_u = np.log1p(y)
+    hyperbolic = b > 0
+    log_rate = theta[:, :1] + np.where(hyperbolic, -log_u / np.where(hyperbolic, b, 1.0), -x)
+    if not jacobian:
+        return log_rate, None
+
+    # d/db of -ln(1 + y)/b is x^2 * g(y), g(y) = (ln(1 + y)/y - 1/(1 + y))/y.
+    small = y < _SERIES_BELOW
+    y_safe = np.where(small, 1.0, y)
+    g = np.where(small, 0.5 - y * (2.0 / 3.0 - 0.75 * y), (log_u / y_safe - 1.0 / (1.0 + y)) / y_safe)
+    out = np.empty(t.shape + (3,))
+    out[..., 0] = 1.0
+    out[..., 1] = x * x * g
+    out[..., 2] = -x / (1.0 + y)
+    return log_rate, out
+
+
+def _power_law_log_rate(theta: np.ndarray, t: np.ndarray, jacobian: bool = True):
+    """ln q and its Jacobian in (ln qi, m, ln tau)."""
+    m = theta[:, 1:2]
+    s = t * np.exp(-theta[:, 2:3])
+    log_u = np.log1p(s)
+    log_rate = theta[:, :1] - m * log_u
+    if not jacobian:
+        return log_rate, None
+
+    out = np.empty(t.shape + (3,))
+    out[..., 0] = 1.0
+    out[..., 1] = -log_u
+    out[..., 2] = m * s / (1.0 + s)
+    return log_rate, out
+
+
+_KERNELS: Dict[str, Kernel] = {
+    "Exp": _arps_log_rate,
+    "Hyperbolic": _arps_log_rate,
+    "Harmonic": _arps_log_rate,
+    "PowerLaw": _power_law_log_rate,
+}
+
+
+def _parameter_bounds(
+    method: FitMethod, bounds: Mapping[str, Tuple[float, float]]
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(lower, upper, free) of the (ln qi, shape, ln scale) vector."""
+    shape, scale = _SHAPE_SCALE[method]
+    limits = [bounds[name] for name in ("qi", shape, scale)]
+    for name, (lo, hi) in zip(("qi", shape, scale), limits):
+        if not lo <= hi:
+            raise ValueError(f"{name} bounds must satisfy lower <= upper")
+    if limits[2][0] <= 0:
+        raise ValueError(f"{scale} lower bound must be > 0")
+    with np.errstate(divide="ignore"):
+        lower = np.array([np.log(limits[0][0]), limits[1][0], np.log(limits[2][0])])
+        upper = np.array([np.log(limits[0][1]), limits[1][1], np.log(limits[2][1])])
+    free = np.ones(3, dtype=bool)
+    if method in _FIXED_B:
+        lower[1] = upper[1] = _FIXED_B[method]
+        free[1] = False
+    return lower, upper, free
+
+
+def _grid_start(
+    kernel: Kernel,
+    lower: np.ndarray,
+    upper: np.ndarray,
+    t: np.ndarray,
+    log_rates: np.ndarray,
+    mask: np.ndarray,
+    level: Optional[np.ndarray],
+) -> np.ndarray:
+    """
+    Best grid point per well; ln qi is the mean log residual there (least
+    squares for fixed shape and scale) unless pinned by `level`.
+    """
+    wells = t.shape[0]
+    count = np.maximum(mask.sum(axis=1), 1)
+    shapes = np.unique(np.linspace(lower[1], upper[1], _SHAPE_GRID_POINTS))
+    scales = np.linspace(lower[2], upper[2], _SCALE_GRID_POINTS)
+    theta = np.zeros((wells, 3))
+    best = np.zeros((wells, 3))
+    best_cost = np.full(wells, np.inf)
+    for shape in shapes:
+        for scale in scales:
+            theta[:, 1] = shape
+            theta[:, 2] = scale
+            log_rate, _ = kernel(theta, t, False)
+            residual = np.where(mask, log_rates - log_rate, 0.0)
+            if level is None:
+                start = residual.sum(axis=1) / count
+                cost = np.einsum("wn,wn->w", residual, residual) - count * start * start
+            else:
+                start = level
+                residual = np.where(mask, residual - level[:, None], 0.0)
+                cost = np.einsum("wn,wn->w", residual, residual)
+            better = cost < best_cost
+            best_cost[better] = cost[better]
+            best[better] = np.stack([start[better], np.full(better.sum(), shape), np.full(better.sum(), scale)], 1)
+    best[:, 0] = np.clip(best[:, 0], lower[0], upper[0])
+    return best
+
+
+def _levenberg_marquardt(
+    kernel: Kernel,
+    theta: np.ndarray,
+    t: np.ndarray,
+    log_rates: np.ndarray,
+    mask: np.ndarray,
+    lower: np.ndarray,
+    upper: np.ndarray,
+    free: np.ndarray,
+    max_iterations: int,
+    tolerance: float,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Bounded LM over all rows at once: (theta, cost, iterations, converged)."""
+
+    def residuals(rows: np.ndarray, params: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        log_rate, jacobian = kernel(params, t[rows], True)
+        weight = mask[rows]
+        residual = np.where(weight, log_rate - log_rates[rows], 0.0)
+        return residual, jacobian * weight[..., None]
+
+    wells = theta.shape[0]
+    active = np.arange(wells)
+    residual, jacobian = residuals(active, theta)
+    cost = np.einsum("wn,wn->w", residual, residual)
+    damping = np.full(wells, 1e-3)
+    iterations = np.zeros(wells, dtype=int)
+    converged = np.zeros(wells, dtype=bool)
+    identity = np.eye(3)
+
+    for _ in range(max_iterations):
+        if not active.size:
+            break
+        j = jacobian[active]
+        current = theta[active]
+        gradient = np.einsum("wnp,wn->wp", j, residual[active])
+        # Active set: a parameter on a bound that the gradient pushes outward sits this step out.
+        held = ((current <= lower) & (gradient > 0)) | ((current >= upper) & (gradient < 0)) | ~free
+        moving = ~held
+        normal = np.einsum("wnp,wnq->wpq", j, j) * (moving[:, :, None] & moving[:, None, :])
+        gradient = np.where(moving, gradient, 0.0)
+        curvature = np.maximum(np.diagonal(normal, axis1=1, axis2=2), _MIN_CURVATURE)
+        system = normal + (damping[active, None] * curvature + held)[:, :, None] * identity
+        step = np.linalg.solve(system, -gradient[..., None])[..., 0]
+        trial = np.clip(current + step, lower, upper)
+        moved = np.abs(trial - current).max(axis=1)
+
+        trial_residual, trial_jacobian = residuals(active, trial)
+        trial_cost = np.einsum("wn,wn->w", trial_residual, trial_residual)
+        better = trial_cost < cost[active]
+        accepted = active[better]
+        decrease = cost[accepted] - trial_cost[better]
+        theta[accepted] = trial[better]
+        residual[accepted] = trial_residual[better]
+        jacobian[accepted] = trial_jacobian[better]
+        cost[accepted] = trial_cost[better]
+        damping[active] = np.where(better, np.maximum(damping[active] / 3.0, 1e-12), damping[active] * 4.0)
+        iterations[active] += 1
+
+        done = moved <= tolerance * (1.0 + np.abs(theta[active]).max(axis=1))
+        done[better] |= decrease <= tolerance * (cost[accepted] + tolerance)
+        done |= damping[active] > _MAX_DAMPING
+        converged[active[done]] = True
+        active = active[~done]
+
+    return theta, cost, iterations, converged
+
+
+@dataclass(frozen=True)
+class _FitPlan:
+    methods: Tuple[FitMethod, ...]
+    breaks: Tuple[float, ...]
+    bounds: Dict[str, Tuple[float, float]]
+    max_iterations: int
+    tolerance: float
+
+
+def _fit_chunk(task: Tuple[np.ndarray, np.ndarray, _FitPlan]) -> Tuple[List[Dict[str, np.ndarray]], np.ndarray]:
+    """Per-segment result arrays and log-space R^2 for one chunk of wells."""
+    t, rates, plan = task
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_rates = np.log(rates)
+    mask = np.isfinite(rates) & (rates > 0) & np.isfinite(t)
+    starts = (0.0,) + plan.breaks
+    ends = plan.breaks + (np.inf,)
+    wells = t.shape[0]
+
+    segments: List[Dict[str, np.ndarray]] = []
+    level: Optional[np.ndarray] = None
+    total_cost = np.zeros(wells)
+    for method, start, end in zip(plan.methods, starts, ends):
+        kernel = _KERNELS[method]
+        lower, upper, free = _parameter_bounds(method, plan.bounds)
+        if level is not None:
+            free[0] = False
+        in_segment = mask & (t >= start) & (t < end)
+        local_t = np.where(in_segment, t - start, 0.0)
+        n_points = in_segment.sum(axis=1)
+
+        theta = np.full((wells, 3), np.nan)
+        cost = np.full(wells, np.nan)
+        iterations = np.zeros(wells, dtype=int)
+        converged = np.zeros(wells, dtype=bool)
+        rows = n_points >= free.sum()
+        if level is not None:
+            rows &= np.isfinite(level)
+        rows = np.flatnonzero(rows)
+        if rows.size:
+            row_level = None if level is None else level[rows]
+            start_theta = _grid_start(
+                kernel, lower, upper, local_t[rows], log_rates[rows], in_segment[rows], row_level
+            )
+            if row_level is not None:
+                start_theta[:, 0] = row_level
+            theta[rows], cost[rows], iterations[rows], converged[rows] = _levenberg_marquardt(
+                kernel,
+                start_theta,
+                local_t[rows],
+                log_rates[rows],
+                in_segment[rows],
+                lower,
+                upper,
+                free,
+                plan.max_iterations,
+                plan.tolerance,
+            )
+        total_cost += np.where(n_points > 0, cost, 0.0)
+        if np.isfinite(end):
+            level, _ = kernel(theta, np.full((wells, 1), end - start), False)
+            level = level[:, 0]
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            rmse = np.sqrt(cost / n_points)
+        segments.append(
+            {
+                "theta": theta,
+                "rmse_log": rmse,
+                "n_points": n_points,
+                "iterations": iterations,
+                "converged": converged,
+            }
+        )
+
+    observed = np.where(mask, log_rates, 0.0)
+    count = mask.sum(axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = observed.sum(axis=1) / count
+        spread = np.where(mask, observed - mean[:, None], 0.0)
+        r_squared = 1.0 - total_cost / np.einsum("wn,wn->w", spread, spread)
+    return segments, r_squared
+
+
+@dataclass(frozen=True)
+class SegmentFit:
+    method: FitMethod
+    start_years: float
+    end_years: float  # inf for the last segment
+    params: Dict[str, np.ndarray]  # `SegmentSpec.params` names -> (wells,) values
+    rmse_log: np.ndarray  # root-mean-square log-rate residual
+    n_points: np.ndarray
+    iterations: np.ndarray
+    converged: np.ndarray
+
+
+def _b_values(segment: SegmentFit) -> np.ndarray:
+    if segment.method in _FIXED_B:
+        return np.full(segment.n_points.size, _FIXED_B[segment.method])
+    return segment.params["b"]
+
+
+@dataclass(frozen=True)
+class DeclineFit:
+    segments: Tuple[SegmentFit, ...]
+    r_squared_log: np.ndarray  # over all of a well's samples, in log-rate space
+
+    @property
+    def wells(self) -> int:
+        return self.segments[0].n_points.size
+
+    @property
+    def converged(self) -> np.ndarray:
+        return np.logical_and.reduce([segment.converged for segment in self.segments])
+
+    def rates(self, t_years: np.ndarray) -> np.ndarray:
+        """Fitted rates (wells × len(t_years)) from the rate functions."""
+        t = np.asarray(t_years, dtype=float)
+        out = np.full((self.wells, t.size), np.nan)
+        for segment in self.segments:
+            columns = (t >= segment.start_years) & (t < segment.end_years)
+            local_t = t[columns] - segment.start_years
+            p = {name: values[:, None] for name, values in segment.params.items()}
+            if segment.method == "PowerLaw":
+                out[:, columns] = power_law_rate(p["qi"], p["m"], p["tau"], local_t)
+            else:
+                out[:, columns] = hyperbolic_rate(p["qi"], _b_values(segment)[:, None], p["Di"], local_t)
+        return out
+
+    def to_type_curves(
+        self, *, terminal_decline: float = 8.0, gor_mcf_per_bbl: float = 0.0
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        `TypeCurveParams` payloads, one per well (None where the fit failed).
+
+        Rates stay bbl/d. Nominal Di (1/yr) becomes the engine's annual
+        effective percent: the engine's monthly decline is Di over one 30.4-day
+        month, compounded over 12 months. Later segments become `time_days`
+        cutoffs with qi left open, so they continue from the current rate; the
+        engine places those breaks on whole months.
+        """
+        if any(segment.method == "PowerLaw" for segment in self.segments):
+            raise ValueError("PowerLaw fits have no Arps type-curve equivalent")
+
+        monthly = [segment.params["Di"] * _ENGINE_DAYS_PER_MONTH / _DAYS_PER_YEAR for segment in self.segments]
+        decline_pct = [100.0 * (1.0 - np.power(1.0 - dm, 12)) for dm in monthly]
+        b_values = [_b_values(segment) for segment in self.segments]
+        qi = self.segments[0].params["qi"]
+
+        curves: List[Optional[Dict[str, Any]]] = []
+        for well in range(self.wells):
+            if not all(np.isfinite(d[well]) for d in decline_pct):
+                curves.append(None)
+                continue
+            segments: List[Dict[str, Any]] = []
+            if len(self.segments) > 1:
+                for k, segment in enumerate(self.segments):
+                    last = k == len(self.segments) - 1
+                    segments.append(
+                        {
+                            "id": f"fit-{k + 1}",
+                            "name": f"Segment {k + 1}",
+                            "method": "arps",
+                            "qi": float(qi[well]) if k == 0 else None,
+                            "b": float(b_values[k][well]),
+                            "initialDecline": float(decline_pct[k][well]),
+                            "cutoffKind": "default" if last else "time_days",
+                            "cutoffValue": None if last else (segment.end_years - segment.start_years) * _DAYS_PER_YEAR,
+                        }
+                    )
+            curves.append(
+                {
+                    "qi": float(qi[well]),
+                    "b": float(b_values[0][well]),
+                    "di": float(decline_pct[0][well]),
+                    "terminalDecline": terminal_decline,
+                    "gorMcfPerBbl": gor_mcf_per_bbl,
+                    "segments": segments,
+                }
+            )
+        return curves
+
+
+def _segment_params(method: FitMethod, theta: np.ndarray) -> Dict[str, np.ndarray]:
+    shape, scale = _SHAPE_SCALE[method]
+    params = {"qi": np.exp(theta[:, 0])}
+    if method not in _FIXED_B:
+        params[shape] = theta[:, 1]
+    params[scale] = np.exp(theta[:, 2])
+    return params
+
+
+def fit_decline_curves(
+    t_years: np.ndarray,
+    rates: np.ndarray,
+    *,
+    methods: Union[FitMethod, Sequence[FitMethod]] = "Hyperbolic",
+    segment_breaks: Sequence[float] = (),
+    bounds: Optional[Mapping[str, Tuple[float, float]]] = None,
+    max_iterations: int = 100,
+    tolerance: float = 1e-12,
+    chunk_size: int = 2000,
+    workers: int = 1,
+) -> DeclineFit:
+    """
+    Fit every row of `rates` (wells × samples, bbl/d; NaN = no sample) against
+    `t_years` (shared (samples,) or per-well (wells × samples), years on
+    production).
+
+    `methods` is one method for every segment or one per segment; segments
+    break at `segment_breaks` (years, increasing). `bounds` overrides the
+    defaults per parameter name ("qi", "b", "Di", "m", "tau"; Di and tau per
+    year). Chunks of `chunk_size` wells are fitted independently, on a spawn
+    process pool when `workers` > 1.
+    """
+    rates = np.atleast_2d(np.asarray(rates, dtype=float))
+    t = np.broadcast_to(np.asarray(t_years, dtype=float), rates.shape)
+    breaks = tuple(float(x) for x in segment_breaks)
+    if any(x <= 0 for x in breaks) or any(b <= a for a, b in zip(breaks, breaks[1:])):
+        raise ValueError("segment_breaks must be positive and strictly increasing")
+    method_list = (methods,) * (len(breaks) + 1) if isinstance(methods, str) else tuple(methods)
+    if len(method_list) != len(breaks) + 1:
+        raise ValueError("methods must be one method or one per segment")
+    for method in method_list:
+        if method not in _KERNELS:
+            raise ValueError(f"Unknown method: {method}")
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be > 0")
+
+    plan = _FitPlan(
+        methods=method_list,
+        breaks=breaks,
+        bounds={**_DEFAULT_BOUNDS, **(bounds or {})},
+        max_iterations=max_iterations,
+        tolerance=tolerance,
+    )
+    for method in method_list:
+        _parameter_bounds(method, plan.bounds)
+
+    tasks = [
+        (t[lo : lo + chunk_size], rates[lo : lo + chunk_size], plan) for lo in range(0, rates.shape[0], chunk_size)
+    ]
+    if workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(tasks)), mp_context=multiprocessing.get_context("spawn")
+        ) as pool:
+            results = list(pool.map(_fit_chunk, tasks))
+    else:
+        results = [_fit_chunk(task) for task in tasks]
+
+    starts = (0.0,) + breaks
+    ends = breaks + (np.inf,)
+    segments = []
+    for k, method in enumerate(method_list):
+        pieces = [chunk_segments[k] for chunk_segments, _ in results]
+        merged = {name: np.concatenate([piece[name] for piece in pieces]) for name in pieces[0]}
+        segments.append(
+            SegmentFit(
+                method=method,
+                start_years=starts[k],
+                end_years=ends[k],
+                params=_segment_params(method, merged["theta"]),
+                rmse_log=merged["rmse_log"],
+                n_points=merged["n_points"],
+                iterations=merged["iterations"],
+                converged=merged["converged"],
+            )
+        )
+    return DeclineFit(segments=tuple(segments), r_squared_log=np.concatenate([r2 for _, r2 in results]))
@@ -1,8 +1,7 @@
 from __future__ import annotations
 
-import math
 from dataclasses import dataclass
-from typing import Any, Dict, List, Literal, Mapping, Optional, Sequence
+from typing import Any, Dict, Literal, Mapping, Optional, Sequence, Tuple
 
 import numpy as np
 
@@ -13,11 +12,14 @@ def exponential_rate(qi: float, Di: float, t: np.ndarray) -> np.ndarray:
     """
     Arps exponential decline:
         q(t) = qi * exp(-Di * t)
+
+    Parameters may be arrays that broadcast against `t` (e.g. shape (wells, 1)
+    against (wells, n)) to evaluate many curves at once.
     """
     t = np.asarray(t, dtype=float)
-    qi = float(qi)
-    Di = float(Di)
-    if Di < 0:
+    qi = np.asarray(qi, dtype=float)
+    Di = np.asarray(Di, dtype=float)
+    if np.any(Di < 0):
         raise ValueError("Di must be >= 0")
     return qi * np.exp(-Di * t)
 
@@ -26,20 +28,27 @@ def hyperbolic_rate(qi: float, b: float, Di: float, t: np.ndarray) -> np.ndarray
     """
     Arps hyperbolic decline:
         q(t) = qi / (1 + b * Di * t) ** (1 / b)
+
+    Parameters broadcast against `t`; curves with b ~ 0 fall back to the
+    exponential limit.
     """
     t = np.asarray(t, dtype=float)
-    qi = float(qi)
-    b = float(b)
-    Di = float(Di)
-    if Di < 0:
+    qi = np.asarray(qi, dtype=float)
+    b = np.asarray(b, dtype=float)
+    Di = np.asarray(Di, dtype=float)
+    if np.any(Di < 0):
         raise ValueError("Di must be >= 0")
-    if b < 0:
+    if np.any(b < 0):
         raise ValueError("b must be >= 0")
 
     eps = 1e-12
-    if abs(b) < eps:
+    exponential = b < eps
+    if np.all(exponential):
         return exponential_rate(qi, Di, t)
-    return qi / np.power(1.0 + b * Di * t, 1.0 / b)
+    if not np.any(exponential):
+        return qi / np.power(1.0 + b * Di * t, 1.0 / b)
+    b_safe = np.where(exponential, 1.0, b)
+    return np.where(exponential, qi * np.exp(-Di * t), qi / np.power(1.0 + b_safe * Di * t, 1.0 / b_safe))
 
 
 def linear_rate(qi: float, qf: float, t: np.ndarray, t_end: float) -> np.ndarray:
@@ -48,10 +57,10 @@ def linear_rate(qi: float, qf: float, t: np.ndarray, t_end: float) -> np.ndarray
         q(t) = qi + (qf - qi) * (t / t_end)
     """
     t = np.asarray(t, dtype=float)
-    qi = float(qi)
-    qf = float(qf)
-    t_end = float(t_end)
-    if t_end <= 0:
+    qi = np.asarray(qi, dtype=float)
+    qf = np.asarray(qf, dtype=float)
+    t_end = np.asarray(t_end, dtype=float)
+    if np.any(t_end <= 0):
         raise ValueError("t_end must be > 0")
     return qi + (qf - qi) * (t / t_end)
 
@@ -59,7 +68,6 @@ def linear_rate(qi: float, qf: float, t: np.ndarray, t_end: float) -> np.ndarray
 def flat_rate(qi: float, t: np.ndarray) -> np.ndarray:
     """Flat rate q(t)=qi."""
     t = np.asarray(t, dtype=float)
-    qi = float(qi)
     return np.full_like(t, qi, dtype=float)
 
 
@@ -67,14 +75,16 @@ def power_law_rate(qi: float, m: float, tau: float, t: np.ndarray) -> np.ndarray
     """
     Power-law decline:
         q(t) = qi / (1 + t / tau) ** m
+
+    Parameters broadcast against `t`.
     """
     t = np.asarray(t, dtype=float)
-    qi = float(qi)
-    m = float(m)
-    tau = float(tau)
-    if m < 0:
+    qi = np.asarray(qi, dtype=float)
+    m = np.asarray(m, dtype=float)
+    tau = np.asarray(tau, dtype=float)
+    if np.any(m < 0):
         raise ValueError("m must be >= 0")
-    if tau <= 0:
+    if np.any(tau <= 0):
         raise ValueError("tau must be > 0")
     return qi / np.power(1.0 + (t / tau), m)
 
@@ -103,63 +113,44 @@ def _validate_segments(segments: Sequence[SegmentSpec], *, dt: float) -> None:
             raise ValueError("first segment params must include qi")
 
 
+# Parameters each method reads from `SegmentSpec.params` (the first segment also reads qi).
+_METHOD_PARAMS: Dict[str, Tuple[str, ...]] = {
+    "Exp": ("Di",),
+    "Hyperbolic": ("b", "Di"),
+    "Harmonic": ("Di",),
+    "Linear": ("qf",),
+    "Flat": (),
+    "PowerLaw": ("m", "tau"),
+}
+
+
 def _segment_rate(
     *,
     method: MethodName,
-    qi: float,
+    qi: np.ndarray,
     t_local: np.ndarray,
-    duration: float,
+    duration: np.ndarray,
     params: Mapping[str, Any],
 ) -> np.ndarray:
+    """Rates of one method; every argument may be an array broadcasting against `t_local`."""
     if method == "Exp":
-        return exponential_rate(qi, float(params["Di"]), t_local)
+        return exponential_rate(qi, params["Di"], t_local)
     if method == "Hyperbolic":
-        return hyperbolic_rate(qi, float(params["b"]), float(params["Di"]), t_local)
+        return hyperbolic_rate(qi, params["b"], params["Di"], t_local)
     if method == "Harmonic":
         # Harmonic is hyperbolic with b=1
-        return hyperbolic_rate(qi, 1.0, float(params["Di"]), t_local)
+        return hyperbolic_rate(qi, 1.0, params["Di"], t_local)
     if method == "Linear":
-        return linear_rate(qi, float(params["qf"]), t_local, float(duration))
+        return linear_rate(qi, params["qf"], t_local, duration)
     if method == "Flat":
         return flat_rate(qi, t_local)
     if method == "PowerLaw":
-        return power_law_rate(qi, float(params["m"]), float(params["tau"]), t_local)
+        return power_law_rate(qi, params["m"], params["tau"], t_local)
     raise ValueError(f"Unknown method: {method}")
 
 
-def simulate_multisegment(
-    segments: Sequence[SegmentSpec],
-    *,
-    frequency: Optional[FrequencyName] = None,
-    dt_years: Optional[float] = None,
-) -> Dict[str, np.ndarray]:
-    """
-    Build a multi-segment decline model and return per-time calculated data.
-
-    Output columns (per time t, in years):
-      - t_years
-      - t_days
-      - segment (1-indexed)
-      - segment_index (alias of segment; 1-indexed)
-      - method
-      - calculation_method (alias of method)
-      - rate
-      - cum (cumulative production, trapezoid in days; if rate is bbl/d then cum is bbl)
-      - rate_change (Δq vs previous time step; 0 at t=0)
-      - rate_pct_change_step (Δq / q_prev * 100; 0 at t=0)
-      - rate_pct_change_from_start ((q / q0 - 1) * 100)
-      - rate_pct_change_cumulative (alias of rate_pct_change_from_start)
-      - secant_nominal_pct_per_year (-ln(q/q_prev)/dt * 100; 0 at t=0)
-      - secant_effective_pct_per_year ((1 - (q/q_prev)^(1/dt)) * 100; 0 at t=0)
-      - secant_nominal_per_year (-ln(q/q_prev)/dt; 0 at t=0)  [aka Di, 1/yr]
-      - secant_effective_per_year (1 - (q/q_prev)^(1/dt); 0 at t=0)  [aka De, frac/yr]
-      - secant_nominal_Di_per_year (alias of secant_nominal_per_year)
-      - secant_effective_De_per_year (alias of secant_effective_per_year)
-
-    Time stepping:
-      - Provide `frequency` in {"daily","monthly","yearly"} to use a standard step based on 365.25 days/year.
-      - Or provide `dt_years` directly for custom spacing.
-    """
+def _step(frequency: Optional[FrequencyName], dt_years: Optional[float]) -> Tuple[float, float]:
+    """(dt in years, dt in days)."""
     if frequency is None and dt_years is None:
         dt_years = 1.0 / 12.0
 
@@ -175,109 +166,190 @@ def simulate_multisegment(
             dt_days = _DAYS_PER_YEAR
         else:
             raise ValueError(f"Unknown frequency: {frequency}")
-        dt = dt_days / _DAYS_PER_YEAR
-    else:
-        dt = float(dt_years)
-        dt_days = dt * _DAYS_PER_YEAR
-
-    _validate_segments(segments, dt=dt)
-
-    t_years_all: List[float] = []
-    t_days_all: List[float] = []
-    seg_all: List[int] = []
-    method_all: List[str] = []
-    rate_all: List[float] = []
-
-    t_cursor_days = 0.0
-    q_start = float(segments[0].params["qi"])
-    if q_start < 0:
-        raise ValueError("qi must be >= 0")
+        return dt_days / _DAYS_PER_YEAR, dt_days
+    dt = float(dt_years)
+    return dt, dt * _DAYS_PER_YEAR
+
 
-    n_segments = len(segments)
-    for seg_idx, seg in enumerate(segments, start=1):
-        # Store times for this segment *excluding* the end boundary time.
-        # The end boundary time (t=duration) is owned by the next segment (except for the last segment),
-        # which avoids duplicates and makes "current segment" unambiguous at boundaries.
-        duration_years = float(seg.duration)
-        duration_days = duration_years * _DAYS_PER_YEAR
-        t_local_days_store = np.arange(0.0, duration_days, dt_days, dtype=float)
-
-        # For the last segment, include the final endpoint.
-        if seg_idx == n_segments:
-            if t_local_days_store.size == 0 or abs(t_local_days_store[-1] - duration_days) > 1e-12:
-                t_local_days_store = np.append(t_local_days_store, duration_days)
-
-        if t_local_days_store.size:
-            t_local_years_store = t_local_days_store / _DAYS_PER_YEAR
-            q_store = _segment_rate(
-                method=seg.method,
-                qi=q_start,
-                t_local=t_local_years_store,
-                duration=duration_years,
-                params=seg.params,
+def _ranges(starts: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """Concatenated arange(start, start + count) for each pair."""
+    offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    return np.repeat(starts, counts) + offsets
+
+
+def _sample_rows(
+    curves: Sequence[Sequence[SegmentSpec]], dt_days: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    (t_days, rate, segment, method) as NaN/0/None-padded (curves × time) rows,
+    plus each row's sample count. Samples are laid out and evaluated as one flat
+    ragged array, then scattered into rows.
+    """
+    n_curves = len(curves)
+    n_segments = max(len(segments) for segments in curves)
+    rows = np.arange(n_curves)
+
+    # (curves × segment positions) layout; positions past a curve's last segment hold no samples.
+    present = np.arange(n_segments) < np.array([len(segments) for segments in curves])[:, None]
+    duration_years = np.zeros((n_curves, n_segments))
+    method_grid = np.full((n_curves, n_segments), None, dtype=object)
+    for c, segments in enumerate(curves):
+        duration_years[c, : len(segments)] = [float(seg.duration) for seg in segments]
+        method_grid[c, : len(segments)] = [seg.method for seg in segments]
+    duration_days = duration_years * _DAYS_PER_YEAR
+
+    # Each segment stores times in [0, duration) on the dt grid (np.arange); the end boundary
+    # time is owned by the next segment, which keeps "current segment" unambiguous at
+    # boundaries. The last segment also stores its end point.
+    grid_counts = np.where(present, np.ceil(duration_days / dt_days), 0).astype(int)
+    last = present.sum(axis=1) - 1
+    last_count = grid_counts[rows, last]
+    with_end = np.zeros_like(present)
+    with_end[rows, last] = (last_count == 0) | (
+        np.abs((last_count - 1) * dt_days - duration_days[rows, last]) > 1e-12
+    )
+    counts = (grid_counts + with_end).ravel()
+    first_sample = np.cumsum(counts) - counts
+
+    owner = np.repeat(np.arange(counts.size), counts)  # flat (curve, position) of each sample
+    step_index = np.arange(counts.sum()) - first_sample[owner]
+    local_days = np.where(
+        with_end.ravel()[owner] & (step_index == counts[owner] - 1),
+        duration_days.ravel()[owner],
+        step_index * dt_days,
+    )
+    segment_start_days = np.zeros((n_curves, n_segments))
+    if n_segments > 1:
+        segment_start_days[:, 1:] = np.cumsum(duration_days[:, :-1], axis=1)
+    t_days_flat = segment_start_days.ravel()[owner] + local_days
+    local_years = local_days / _DAYS_PER_YEAR
+
+    # Rates, chaining each segment from the previous segment's rate at its full duration.
+    q_start = np.array([float(segments[0].params["qi"]) for segments in curves])
+    if np.any(q_start < 0):
+        raise ValueError("qi must be >= 0")
+    rate_flat = np.empty(counts.sum())
+    for k in range(n_segments):
+        next_start = np.empty(n_curves)
+        for method in dict.fromkeys(method_grid[present[:, k], k]):
+            members = np.flatnonzero(method_grid[:, k] == method)
+            params = {
+                name: np.array([float(curves[c][k].params[name]) for c in members])
+                for name in _METHOD_PARAMS.get(method, ())
+            }
+            member_counts = counts[members * n_segments + k]
+            samples = _ranges(first_sample[members * n_segments + k], member_counts)
+            rate_flat[samples] = _segment_rate(
+                method=method,
+                qi=np.repeat(q_start[members], member_counts),
+                t_local=local_years[samples],
+                duration=np.repeat(duration_years[members, k], member_counts),
+                params={name: np.repeat(values, member_counts) for name, values in params.items()},
+            )
+            next_start[members] = _segment_rate(
+                method=method,
+                qi=q_start[members],
+                t_local=duration_years[members, k],
+                duration=duration_years[members, k],
+                params=params,
             )
+        q_start = next_start
+
+    # Samples are already in row-major order, so rows fill through a mask of the stored slots.
+    n_samples = counts.reshape(n_curves, n_segments).sum(axis=1)
+    stored = np.arange(n_samples.max()) < n_samples[:, None]
+
+    def _rows(values: np.ndarray, fill: Any, dtype: Any) -> np.ndarray:
+        out = np.full(stored.shape, fill, dtype=dtype)
+        out[stored] = values
+        return out
+
+    return (
+        _rows(t_days_flat, np.nan, float),
+        _rows(rate_flat, np.nan, float),
+        _rows(owner % n_segments + 1, 0, int),
+        _rows(method_grid.ravel()[owner], None, object),
+        n_samples,
+    )
 
-            t_days_global = t_cursor_days + t_local_days_store
-            t_years_global = t_days_global / _DAYS_PER_YEAR
-            t_days_all.extend(t_days_global.tolist())
-            t_years_all.extend(t_years_global.tolist())
-            rate_all.extend(q_store.astype(float).tolist())
-            seg_all.extend([seg_idx] * t_local_days_store.size)
-            method_all.extend([seg.method] * t_local_days_store.size)
-
-        # Always compute the boundary end rate at t=duration to seed the next segment.
-        q_end = _segment_rate(
-            method=seg.method,
-            qi=q_start,
-            t_local=np.asarray([duration_years], dtype=float),
-            duration=duration_years,
-            params=seg.params,
-        )
-        q_start = float(q_end[-1])
-        t_cursor_days += duration_days
-
-    if not t_years_all:
-        raise ValueError("No times were generated; check segment durations and dt_years")
-
-    t_years = np.asarray(t_years_all, dtype=float)
-    t_days = np.asarray(t_days_all, dtype=float)
-    rate = np.asarray(rate_all, dtype=float)
-    seg_arr = np.asarray(seg_all, dtype=int)
-    method_arr = np.asarray(method_all, dtype=object)
+
+def simulate_multisegment_batch(
+    curves: Sequence[Sequence[SegmentSpec]],
+    *,
+    frequency: Optional[FrequencyName] = None,
+    dt_years: Optional[float] = None,
+) -> Dict[str, np.ndarray]:
+    """
+    `simulate_multisegment` for many segment sequences at once.
+
+    Returns the same columns as 2-D (curves × time) arrays, plus `n_samples`
+    (curves,). Row i holds `simulate_multisegment(curves[i])` in its first
+    `n_samples[i]` columns; shorter rows are padded with NaN (`segment` with 0,
+    `method` with None).
+
+    Each curve's time grid is laid out from segment durations alone, and
+    rates are evaluated one (segment position, method) group at a time across
+    all curves, so the only Python loops run over segment positions and
+    methods, never over time samples.
+    """
+    dt, dt_days = _step(frequency, dt_years)
+    if not curves:
+        raise ValueError("curves must be non-empty")
+    for segments in curves:
+        _validate_segments(segments, dt=dt)
+
+    t_days, rate, seg_arr, method_arr, n_samples = _sample_rows(curves, dt_days)
+    t_years = t_days / _DAYS_PER_YEAR
+    padding = np.arange(rate.shape[1]) >= n_samples[:, None]
+
+    q_prev, q_cur = rate[:, :-1], rate[:, 1:]
+    # Columns are filled in place: at daily steps over decades each one is a large matrix.
 
     # Cumulative production via trapezoidal integration in DAYS
-    cum = np.zeros_like(rate, dtype=float)
-    dt_steps_days = np.diff(t_days)
-    if dt_steps_days.size:
-        cum[1:] = np.cumsum(0.5 * (rate[:-1] + rate[1:]) * dt_steps_days)
+    cum = np.zeros_like(rate)
+    np.add(q_prev, q_cur, out=cum[:, 1:])
+    cum[:, 1:] *= 0.5
+    cum[:, 1:] *= np.diff(t_days, axis=1)
+    np.cumsum(cum[:, 1:], axis=1, out=cum[:, 1:])
+
+    rate_change = np.zeros_like(rate)
+    np.subtract(q_cur, q_prev, out=rate_change[:, 1:])
 
-    rate_change = np.zeros_like(rate, dtype=float)
-    rate_change[1:] = rate[1:] - rate[:-1]
+    rate_pct_change_step = np.zeros_like(rate)
+    np.divide(rate_change[:, 1:], q_prev, out=rate_pct_change_step[:, 1:], where=q_prev != 0)
+    rate_pct_change_step *= 100.0
 
-    rate_pct_change_step = np.zeros_like(rate, dtype=float)
     with np.errstate(divide="ignore", invalid="ignore"):
-        step = np.where(rate[:-1] != 0, (rate[1:] - rate[:-1]) / rate[:-1], 0.0)
-    rate_pct_change_step[1:] = 100.0 * step
-
-    q0 = float(rate[0])
-    rate_pct_change_from_start = np.zeros_like(rate, dtype=float)
-    if q0 != 0:
-        rate_pct_change_from_start = 100.0 * (rate / q0 - 1.0)
-
-    secant_nominal_pct_per_year = np.zeros_like(rate, dtype=float)
-    secant_effective_pct_per_year = np.zeros_like(rate, dtype=float)
-    for i in range(1, rate.size):
-        q_prev = float(rate[i - 1])
-        q_cur = float(rate[i])
-        dt_i_years = float(t_years[i] - t_years[i - 1])
-        if dt_i_years <= 0 or q_prev <= 0 or q_cur <= 0:
-            continue
-        # Nominal: D = -ln(q2/q1)/Δt
-        d_nom = -math.log(q_cur / q_prev) / dt_i_years
-        secant_nominal_pct_per_year[i] = 100.0 * d_nom
-        # Effective annual: De = 1 - (q2/q1)^(1/Δt)
-        de_eff = 1.0 - math.exp(math.log(q_cur / q_prev) / dt_i_years)
-        secant_effective_pct_per_year[i] = 100.0 * de_eff
+        rate_pct_change_from_start = rate / rate[:, :1]
+    rate_pct_change_from_start -= 1.0
+    rate_pct_change_from_start *= 100.0
+    rate_pct_change_from_start[rate[:, 0] == 0] = 0.0
+
+    # Secant declines between consecutive samples with positive rates:
+    #   nominal D = -ln(q2/q1)/Δt, effective annual De = 1 - (q2/q1)^(1/Δt)
+    dt_step = np.diff(t_years, axis=1)
+    with np.errstate(invalid="ignore"):
+        secant = (dt_step > 0) & (q_prev > 0) & (q_cur > 0)
+    log_ratio = np.divide(q_cur, q_prev, out=np.ones_like(dt_step), where=secant)
+    np.log(log_ratio, out=log_ratio)
+    np.divide(log_ratio, dt_step, out=log_ratio, where=secant)
+    secant_nominal_pct_per_year = np.zeros_like(rate)
+    np.multiply(log_ratio, -100.0, out=secant_nominal_pct_per_year[:, 1:], where=secant)
+    secant_effective_pct_per_year = np.zeros_like(rate)
+    np.exp(log_ratio, out=log_ratio)
+    np.subtract(1.0, log_ratio, out=log_ratio)
+    np.multiply(log_ratio, 100.0, out=secant_effective_pct_per_year[:, 1:], where=secant)
+    del log_ratio, dt_step, secant
+
+    for column in (
+        cum,
+        rate_change,
+        rate_pct_change_step,
+        rate_pct_change_from_start,
+        secant_nominal_pct_per_year,
+        secant_effective_pct_per_year,
+    ):
+        column[padding] = np.nan
 
     # Also provide fraction-per-year versions (0..1 typical), which many workflows call Di/De.
     secant_nominal_per_year = secant_nominal_pct_per_year / 100.0
@@ -302,9 +374,51 @@ def simulate_multisegment(
         "secant_nominal_per_year": secant_nominal_per_year,
         "secant_effective_De_per_year": secant_effective_per_year,  # alias
         "secant_nominal_Di_per_year": secant_nominal_per_year,  # alias
+        "n_samples": n_samples,
     }
 
 
+def simulate_multisegment(
+    segments: Sequence[SegmentSpec],
+    *,
+    frequency: Optional[FrequencyName] = None,
+    dt_years: Optional[float] = None,
+) -> Dict[str, np.ndarray]:
+    """
+    Build a multi-segment decline model and return per-time calculated data.
+
+    Output columns (per time t, in years):
+      - t_years
+      - t_days
+      - segment (1-indexed)
+      - segment_index (alias of segment; 1-indexed)
+      - method
+      - calculation_method (alias of method)
+      - rate
+      - cum (cumulative production, trapezoid in days; if rate is bbl/d then cum is bbl)
+      - rate_change (Δq vs previous time step; 0 at t=0)
+      - rate_pct_change_step (Δq / q_prev * 100; 0 at t=0)
+      - rate_pct_change_from_start ((q / q0 - 1) * 100)
+      - rate_pct_change_cumulative (alias of rate_pct_change_from_start)
+      - secant_nominal_pct_per_year (-ln(q/q_prev)/dt * 100; 0 at t=0)
+      - secant_effective_pct_per_year ((1 - (q/q_prev)^(1/dt)) * 100; 0 at t=0)
+      - secant_nominal_per_year (-ln(q/q_prev)/dt; 0 at t=0)  [aka Di, 1/yr]
+      - secant_effective_per_year (1 - (q/q_prev)^(1/dt); 0 at t=0)  [aka De, frac/yr]
+      - secant_nominal_Di_per_year (alias of secant_nominal_per_year)
+      - secant_effective_De_per_year (alias of secant_effective_per_year)
+
+    Time stepping:
+      - Provide `frequency` in {"daily","monthly","yearly"} to use a standard step based on 365.25 days/year.
+      - Or provide `dt_years` directly for custom spacing.
+
+    Every column is computed with array operations; see `simulate_multisegment_batch`
+    for many curves at once.
+    """
+    batch = simulate_multisegment_batch([segments], frequency=frequency, dt_years=dt_years)
+    batch.pop("n_samples")
+    return {name: values[0] for name, values in batch.items()}
+
+
 def multisegment_to_dataframe(data: Mapping[str, np.ndarray]):
     """
     Convert `simulate_multisegment` output to a pandas DataFrame.
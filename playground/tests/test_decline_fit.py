@@ -0,0 +1,124 @@
+import numpy as np
+import pytest
+
+from backend.economics import _evaluate_multi_segment_production
+from backend.models import TypeCurveParams
+from playground.decline_fit import fit_decline_curves
+from playground.decline_multiseg import SegmentSpec, hyperbolic_rate, power_law_rate, simulate_multisegment
+
+T_MONTHLY = np.arange(120) / 12.0
+
+
+def _hyperbolic_histories(wells: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    qi = rng.uniform(200.0, 1500.0, wells)
+    b = rng.uniform(0.0, 1.8, wells)
+    di = rng.uniform(0.3, 6.0, wells)
+    return qi, b, di, hyperbolic_rate(qi[:, None], b[:, None], di[:, None], T_MONTHLY)
+
+
+def test_rate_functions_broadcast_per_curve_parameters():
+    qi = np.array([[500.0], [800.0]])
+    b = np.array([[0.0], [1.2]])
+    di = np.array([[0.9], [2.5]])
+
+    rates = hyperbolic_rate(qi, b, di, T_MONTHLY)
+
+    assert rates.shape == (2, T_MONTHLY.size)
+    np.testing.assert_array_equal(rates[0], hyperbolic_rate(500.0, 0.0, 0.9, T_MONTHLY))
+    np.testing.assert_array_equal(rates[1], hyperbolic_rate(800.0, 1.2, 2.5, T_MONTHLY))
+    with pytest.raises(ValueError):
+        hyperbolic_rate(qi, -b, di, T_MONTHLY)
+
+
+def test_noise_free_histories_recover_their_parameters():
+    qi, b, di, rates = _hyperbolic_histories(300)
+
+    fit = fit_decline_curves(T_MONTHLY, rates, chunk_size=128)
+
+    params = fit.segments[0].params
+    assert fit.converged.all()
+    np.testing.assert_allclose(params["qi"], qi, rtol=1e-9)
+    np.testing.assert_allclose(params["b"], b, rtol=0, atol=1e-9)
+    np.testing.assert_allclose(params["Di"], di, rtol=1e-9)
+    np.testing.assert_allclose(fit.rates(T_MONTHLY), rates, rtol=1e-9)
+    np.testing.assert_allclose(fit.r_squared_log, 1.0)
+
+
+def test_power_law_and_fixed_b_methods():
+    rng = np.random.default_rng(1)
+    m, tau = rng.uniform(0.5, 2.0, 50), rng.uniform(0.05, 2.0, 50)
+    rates = power_law_rate(900.0, m[:, None], tau[:, None], T_MONTHLY)
+
+    power_law = fit_decline_curves(T_MONTHLY, rates, methods="PowerLaw").segments[0]
+    harmonic = fit_decline_curves(T_MONTHLY, hyperbolic_rate(700.0, 1.0, 2.0, T_MONTHLY), methods="Harmonic")
+
+    np.testing.assert_allclose(power_law.params["m"], m, rtol=1e-9)
+    np.testing.assert_allclose(power_law.params["tau"], tau, rtol=1e-9)
+    assert set(harmonic.segments[0].params) == {"qi", "Di"}
+    np.testing.assert_allclose(harmonic.segments[0].params["Di"], 2.0, rtol=1e-9)
+
+
+def test_noisy_gappy_histories_stay_in_bounds_and_report_diagnostics():
+    _, _, _, rates = _hyperbolic_histories(200, seed=2)
+    rng = np.random.default_rng(3)
+    noisy = rates * np.exp(rng.normal(0.0, 0.1, rates.shape))
+    noisy[rng.random(rates.shape) < 0.1] = np.nan
+    noisy[0, 2:] = np.nan  # two samples: too few for three parameters
+    noisy[1, 60:] = np.nan  # a shorter history
+
+    fit = fit_decline_curves(T_MONTHLY, noisy, bounds={"b": (0.0, 1.0)})
+
+    segment = fit.segments[0]
+    assert np.isnan(segment.params["b"][0]) and not segment.converged[0]
+    assert segment.n_points[1] == np.isfinite(noisy[1]).sum()
+    assert segment.converged[1:].all()
+    assert (segment.params["b"][1:] <= 1.0).all() and (segment.params["b"][1:] >= 0.0).all()
+    assert (segment.rmse_log[1:] < 0.2).all()
+    assert (fit.r_squared_log[1:] > 0.8).all()
+    assert fit.to_type_curves()[0] is None
+
+
+def test_segments_chain_from_the_fitted_break_rate():
+    out = simulate_multisegment(
+        [
+            SegmentSpec(method="Hyperbolic", duration=5.0, params={"qi": 900.0, "b": 1.3, "Di": 3.0}),
+            SegmentSpec(method="Exp", duration=15.0, params={"Di": 0.09}),
+        ],
+        frequency="monthly",
+    )
+    t, rates = out["t_years"], out["rate"]
+
+    fit = fit_decline_curves(t, rates, methods=("Hyperbolic", "Exp"), segment_breaks=(5.0,))
+
+    first, second = fit.segments
+    np.testing.assert_allclose([first.params["b"][0], first.params["Di"][0]], [1.3, 3.0], rtol=1e-9)
+    np.testing.assert_allclose(second.params["Di"], 0.09, rtol=1e-9)
+    np.testing.assert_allclose(second.params["qi"], hyperbolic_rate(900.0, 1.3, 3.0, 5.0), rtol=1e-9)
+    np.testing.assert_allclose(fit.rates(t)[0], rates, rtol=1e-9)
+
+    tc = TypeCurveParams(**fit.to_type_curves()[0])
+    assert [s.cutoffKind for s in tc.segments] == ["time_days", "default"]
+    assert tc.segments[0].cutoffValue == pytest.approx(5.0 * 365.25)
+    assert tc.segments[1].qi is None and tc.segments[1].b == 0.0
+
+
+def test_type_curve_reproduces_the_fit_in_the_engine():
+    _, _, _, rates = _hyperbolic_histories(5, seed=4)
+    fit = fit_decline_curves(T_MONTHLY, rates)
+
+    for well, payload in enumerate(fit.to_type_curves(terminal_decline=6.0)):
+        oil, _ = _evaluate_multi_segment_production(TypeCurveParams(**payload), 120, 1.0)
+        engine_months = np.arange(1, 121) * 30.4 / 365.25
+        np.testing.assert_allclose(oil, fit.rates(engine_months)[well] * 30.4, rtol=1e-7)
+
+
+def test_process_pool_matches_in_process_fit():
+    _, _, _, rates = _hyperbolic_histories(40, seed=5)
+
+    serial = fit_decline_curves(T_MONTHLY, rates, chunk_size=10)
+    parallel = fit_decline_curves(T_MONTHLY, rates, chunk_size=10, workers=2)
+
+    for name, values in serial.segments[0].params.items():
+        np.testing.assert_array_equal(parallel.segments[0].params[name], values)
+    np.testing.assert_array_equal(parallel.segments[0].iterations, serial.segments[0].iterations)
@@ -0,0 +1,76 @@
+import math
+
+import numpy as np
+import pytest
+
+from playground.decline_multiseg import SegmentSpec, simulate_multisegment, simulate_multisegment_batch
+
+CURVES = [
+    [
+        SegmentSpec(method="Hyperbolic", duration=1.0, params={"qi": 1000.0, "b": 1.2, "Di": 1.5}),
+        SegmentSpec(method="Exp", duration=2.3, params={"Di": 0.2}),
+    ],
+    [SegmentSpec(method="PowerLaw", duration=0.7, params={"qi": 400.0, "m": 1.1, "tau": 0.3})],
+    [
+        SegmentSpec(method="Flat", duration=0.25, params={"qi": 0.0}),
+        SegmentSpec(method="Linear", duration=0.5, params={"qf": 300.0}),
+        SegmentSpec(method="Harmonic", duration=1.1, params={"Di": 0.9}),
+        SegmentSpec(method="Exp", duration=0.4, params={"Di": 0.1}),
+    ],
+    [
+        SegmentSpec(method="Exp", duration=2.0, params={"qi": 650.0, "Di": 0.6}),
+        SegmentSpec(method="Hyperbolic", duration=1.5, params={"b": 0.4, "Di": 0.3}),
+    ],
+]
+
+
+def _secant_reference(rate: np.ndarray, t_years: np.ndarray):
+    """The per-sample loop the secant columns replace."""
+    nominal = np.zeros_like(rate)
+    effective = np.zeros_like(rate)
+    for i in range(1, rate.size):
+        dt = t_years[i] - t_years[i - 1]
+        if dt <= 0 or rate[i - 1] <= 0 or rate[i] <= 0:
+            continue
+        nominal[i] = 100.0 * (-math.log(rate[i] / rate[i - 1]) / dt)
+        effective[i] = 100.0 * (1.0 - math.exp(math.log(rate[i] / rate[i - 1]) / dt))
+    return nominal, effective
+
+
+@pytest.mark.parametrize("frequency", ["daily", "monthly", "yearly"])
+def test_batch_rows_match_single_curve_runs(frequency):
+    batch = simulate_multisegment_batch(CURVES, frequency=frequency)
+
+    width = batch["rate"].shape[1]
+    assert all(values.shape == (len(CURVES), width) for name, values in batch.items() if name != "n_samples")
+    for i, segments in enumerate(CURVES):
+        single = simulate_multisegment(segments, frequency=frequency)
+        n = batch["n_samples"][i]
+        assert n == single["rate"].size
+        for name, values in single.items():
+            if values.dtype == object:
+                assert list(batch[name][i, :n]) == list(values)
+            else:
+                np.testing.assert_array_equal(batch[name][i, :n], values)
+        assert np.isnan(batch["rate"][i, n:]).all() and np.isnan(batch["cum"][i, n:]).all()
+        assert (batch["segment"][i, n:] == 0).all() and all(m is None for m in batch["method"][i, n:])
+
+
+def test_secant_columns_match_per_sample_reference():
+    out = simulate_multisegment(CURVES[2], dt_years=0.05)
+
+    nominal, effective = _secant_reference(out["rate"], out["t_years"])
+
+    assert out["rate"][0] == 0.0  # zero-rate samples keep 0 secant declines
+    np.testing.assert_allclose(out["secant_nominal_pct_per_year"], nominal, rtol=1e-13, atol=0)
+    np.testing.assert_allclose(out["secant_effective_pct_per_year"], effective, rtol=1e-13, atol=0)
+    np.testing.assert_array_equal(out["rate_pct_change_from_start"], 0.0)
+
+
+def test_batch_validates_every_curve():
+    with pytest.raises(ValueError):
+        simulate_multisegment_batch([])
+    with pytest.raises(ValueError, match="qi must be >= 0"):
+        simulate_multisegment_batch([CURVES[0], [SegmentSpec(method="Flat", duration=1.0, params={"qi": -1.0})]])
+    with pytest.raises(ValueError, match="first segment params must include qi"):
+        simulate_multisegment_batch([CURVES[0], [SegmentSpec(method="Exp", duration=1.0, params={"Di": 0.1})]])